@@ -0,0 +1,118 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import logging
+from concurrent.futures          import ThreadPoolExecutor, wait
+from django.apps                 import AppConfig
+from django.conf                 import settings
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+
+class AuthleteDjangoConfig(AppConfig):
+    """Django application configuration of this library.
+
+    Adding 'authlete.django' to `INSTALLED_APPS` enables the startup warm-up.
+    The following settings are recognized.
+
+    AUTHLETE_WARMUP_HANDLERS
+        A list of dotted paths. Each of them points to an object that has a
+        `warmUp()` method (e.g. a `ConfigurationRequestHandler` or a
+        `JwksRequestHandler` that has a `DocumentCache`), or to a callable
+        that takes no argument and returns such an object.
+
+    AUTHLETE_WARMUP_TIMEOUT
+        The deadline of the warm-up in seconds. The default value is 10.
+
+    The `warmUp()` methods are called concurrently when the application is
+    ready. Startup waits until all of them finish or the deadline passes.
+    Failures are logged and do not prevent startup.
+    """
+
+
+    name         = 'authlete.django'
+    label        = 'authlete_django'
+    verbose_name = 'Authlete'
+
+
+    def ready(self):
+        paths = getattr(settings, 'AUTHLETE_WARMUP_HANDLERS', None)
+
+        if not paths:
+            return
+
+        timeout = getattr(settings, 'AUTHLETE_WARMUP_TIMEOUT', 10)
+        targets = [ self.__resolve(path) for path in paths ]
+
+        # Targets that could not be resolved have been logged and skipped.
+        self.warmUp([ target for target in targets if target is not None ], timeout)
+
+
+    def warmUp(self, targets, timeout):
+        """Call `warmUp()` of the targets concurrently.
+
+        Args:
+            targets (list) : Objects that have a `warmUp()` method.
+            timeout (float) : The deadline in seconds.
+
+        Returns:
+            bool : True if all the targets finished successfully in time.
+        """
+
+        if len(targets) == 0:
+            return True
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(targets), thread_name_prefix='AuthleteWarmUp')
+
+        futures = { executor.submit(target.warmUp): target for target in targets }
+
+        done, notDone = wait(futures, timeout=timeout)
+
+        # Don't wait for the targets that have not finished by the deadline.
+        executor.shutdown(wait=False)
+
+        succeeded = len(notDone) == 0
+
+        for future in done:
+            if future.exception() is not None:
+                succeeded = False
+                logger.warning("Warm-up of %r failed: %s",
+                    futures[future], future.exception())
+
+        for future in notDone:
+            logger.warning("Warm-up of %r did not finish in %s seconds.",
+                futures[future], timeout)
+
+        return succeeded
+
+
+    def __resolve(self, path):
+        try:
+            target = import_string(path)
+
+            # A factory that builds the target.
+            if not hasattr(target, 'warmUp'):
+                target = target()
+        except Exception as cause:
+            logger.warning("Warm-up target %s could not be resolved: %s", path, cause)
+            return None
+
+        return target
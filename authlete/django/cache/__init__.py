@@ -0,0 +1,29 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+from .cached_document            import CachedDocument
+from .django_introspection_cache import DjangoIntrospectionCache
+from .document_cache             import DocumentCache
+from .document_refresher         import DocumentRefresher
+from .document_snapshot          import DocumentSnapshot
+from .introspection_cache        import IntrospectionCache
+from .service_jwks_cache         import ServiceJwksCache
+from .shared_document_cache      import SharedDocumentCache
+from .signals                    import tokenRevoked, userClaimsChanged
+from .single_flight              import SingleFlight
+from .user_claim_cache           import UserClaimCache
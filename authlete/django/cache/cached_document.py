@@ -0,0 +1,182 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import base64
+import gzip
+import hashlib
+import time
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CachedDocument(object):
+    """Immutable document kept by `DocumentCache`.
+
+    The content is encoded into bytes once when an instance is created, so
+    that it can be written to responses as is on every request. A strong
+    ETag of the content is computed at the same time.
+
+    Compressed variants of the content (gzip, and Brotli if the `Brotli`
+    package is installed) are created on first use and kept together with
+    the document, so compression runs once per content change. Documents
+    smaller than `MIN_COMPRESSION_SIZE` bytes are not compressed.
+
+    A document may instead represent a redirection (`location`), and may
+    have its own expiration time (`expiresAt`) which `DocumentCache` honors
+    in addition to its TTL.
+    """
+
+
+    # Content codings of the compressed variants in order of preference.
+    ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+    # Documents smaller than this are not worth compressing.
+    MIN_COMPRESSION_SIZE = 1024
+
+
+    __slots__ = ('_content', '_contentType', '_etag', '_createdAt', '_variants',
+                 '_expiresAt', '_location')
+
+
+    def __init__(self, content, contentType='application/json', expiresAt=None, location=None, etag=None):
+        """Constructor
+
+        Args:
+            content (str or bytes-like) :
+                The document. A str is encoded in UTF-8. A bytes-like object
+                such as a memoryview is kept as is without being copied.
+            contentType (str) : The media type of the document.
+            expiresAt (float) :
+                The time in seconds since the Unix epoch after which the
+                document must not be served. None if it does not expire.
+            location (str) :
+                The URL to which requests should be redirected instead of
+                being answered with the content.
+            etag (str) :
+                The ETag of the content if it has been computed already.
+        """
+
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        object.__setattr__(self, '_content',     content)
+        object.__setattr__(self, '_contentType', contentType)
+        object.__setattr__(self, '_etag',        etag or self.__computeEtag(content))
+        object.__setattr__(self, '_createdAt',   time.time())
+        object.__setattr__(self, '_variants',    {})
+        object.__setattr__(self, '_expiresAt',   expiresAt)
+        object.__setattr__(self, '_location',    location)
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'CachedDocument' object is immutable")
+
+
+    @property
+    def content(self):
+        """Get the pre-encoded content.
+
+        Returns:
+            bytes : Or a bytes-like object given to the constructor.
+        """
+        return self._content
+
+
+    @property
+    def contentType(self):
+        return self._contentType
+
+
+    @property
+    def etag(self):
+        """Get the strong ETag of the content.
+
+        Returns:
+            str : A quoted string, e.g. '"Yk3...Q"'.
+        """
+        return self._etag
+
+
+    @property
+    def expiresAt(self):
+        return self._expiresAt
+
+
+    @property
+    def location(self):
+        return self._location
+
+
+    @property
+    def createdAt(self):
+        """Get the time when this document was created in seconds since the Unix epoch.
+
+        Returns:
+            float
+        """
+        return self._createdAt
+
+
+    def getVariant(self, encoding):
+        """Get the compressed variant of the content.
+
+        Args:
+            encoding (str) : A content coding, 'br' or 'gzip'.
+
+        Returns:
+            tuple :
+                A pair of the compressed content (bytes) and its ETag. None if
+                the encoding is not supported or compression does not help.
+        """
+
+        if encoding not in self.ENCODINGS or len(self._content) < self.MIN_COMPRESSION_SIZE:
+            return None
+
+        variant = self._variants.get(encoding)
+
+        if variant is None:
+            # Compressing the same content twice in a race is harmless.
+            variant = self.__compress(encoding)
+            self._variants[encoding] = variant
+
+        # False means that the compressed content was not smaller.
+        return variant or None
+
+
+    def __compress(self, encoding):
+        if encoding == 'br':
+            compressed = brotli.compress(self._content)
+        else:
+            # mtime=0 makes the output deterministic.
+            compressed = gzip.compress(self._content, mtime=0)
+
+        if len(self._content) <= len(compressed):
+            return False
+
+        # Each representation needs its own strong ETag (RFC 9110, 8.8.3).
+        return compressed, '{}-{}"'.format(self._etag[:-1], encoding)
+
+
+    @classmethod
+    def __computeEtag(cls, content):
+        digest = hashlib.sha256(content).digest()
+
+        return '"{}"'.format(base64.urlsafe_b64encode(digest).decode('ascii').rstrip('='))
@@ -0,0 +1,202 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import json
+import math
+from asgiref.sync                              import sync_to_async
+from django.core.cache                         import caches
+from authlete.django.cache.introspection_cache import IntrospectionCache
+from authlete.dto.introspection_response       import IntrospectionResponse
+
+
+class DjangoIntrospectionCache(IntrospectionCache):
+    """Introspection cache stored in a cache backend of Django's cache framework.
+
+    This class works in the same way as `IntrospectionCache` but stores the
+    entries in the cache backend identified by `alias` (an entry of the
+    `CACHES` setting). With a shared backend such as memcached, redis or the
+    database backend, all worker processes and nodes share one warm cache.
+
+    Entries are keyed by the SHA-256 hash of the access token and stored as
+    compact JSON from which attributes having default values are omitted.
+    The number of entries is bounded by the backend (e.g. `MAX_ENTRIES`),
+    so `maxSize` is not used and `size` is always None.
+
+    The backend may be shared with other applications, so `clear()` does not
+    delete entries but increments a generation number kept in the backend.
+    Entries written in an older generation are ignored. If the backend evicts
+    the generation number, entries older than the last `clear()` may be
+    served again, but never after their own expiration time.
+
+    Removals that race with `put()` (see `stamp()`) are detected only within
+    the process that removed the entry.
+
+    `aget()` and `aput()` use the asynchronous methods of the backend (e.g.
+    `aget_many()`), so they work with backends that must not be used in an
+    async context, such as the database backend.
+    """
+
+
+    # The prefix of keys in the cache backend.
+    KEY_PREFIX = 'authlete.introspection.'
+
+    # The key of the generation number in the cache backend.
+    GENERATION_KEY = KEY_PREFIX + 'generation'
+
+
+    def __init__(self, alias='default', maxTtl=300, negativeTtl=10, staleTtl=0, refreshWorkers=2,
+                 clearOnRefreshTokenRevocation=True):
+        """Constructor
+
+        Args:
+            alias (str) : The alias of a cache backend in the `CACHES` setting.
+            maxTtl (float) : The maximum lifetime of an entry in seconds.
+            negativeTtl (float) : The lifetime of a negative entry in seconds.
+            staleTtl (float) : The grace period for stale-while-revalidate in seconds.
+            refreshWorkers (int) : The maximum number of threads that refresh stale entries.
+            clearOnRefreshTokenRevocation (bool) :
+                True to clear all the entries when a refresh token is revoked.
+        """
+
+        super().__init__(None, maxTtl, negativeTtl, staleTtl, refreshWorkers,
+                         clearOnRefreshTokenRevocation)
+        self._alias = alias
+
+
+    @property
+    def alias(self):
+        return self._alias
+
+
+    @property
+    def backend(self):
+        # 'caches' returns a per-thread instance of the backend.
+        return caches[self._alias]
+
+
+    @property
+    def size(self):
+        return None
+
+
+    def remove(self, key):
+        # Cancel the pending put of a refresh of the entry, if any.
+        super().remove(key)
+
+        self.backend.delete(self.KEY_PREFIX + key)
+
+
+    def clear(self):
+        super().clear()
+
+        backend = self.backend
+
+        # Entries written in older generations are ignored from now on.
+        # The generation number never expires.
+        if not backend.add(self.GENERATION_KEY, 1, None):
+            backend.incr(self.GENERATION_KEY)
+
+
+    def _loadEntry(self, key, now):
+        # The entry and the current generation in one round trip.
+        values = self.backend.get_many([ self.KEY_PREFIX + key, self.GENERATION_KEY ])
+
+        return self.__parseEntry(key, values, now)
+
+
+    async def _aloadEntry(self, key, now):
+        values = await self.__acall('get_many', [ self.KEY_PREFIX + key, self.GENERATION_KEY ])
+
+        return self.__parseEntry(key, values, now)
+
+
+    def _storeEntry(self, key, response, softExpiresAt, hardExpiresAt, now):
+        backend    = self.backend
+        generation = backend.get(self.GENERATION_KEY, 0)
+
+        backend.set(self.KEY_PREFIX + key,
+            *self.__buildEntry(generation, response, softExpiresAt, hardExpiresAt, now))
+
+
+    async def _astoreEntry(self, key, response, softExpiresAt, hardExpiresAt, now):
+        generation = await self.__acall('get', self.GENERATION_KEY, 0)
+
+        await self.__acall('set', self.KEY_PREFIX + key,
+            *self.__buildEntry(generation, response, softExpiresAt, hardExpiresAt, now))
+
+
+    async def _adeleteEntry(self, key):
+        await self.__acall('delete', self.KEY_PREFIX + key)
+
+
+    async def __acall(self, name, *args):
+        backend = self.backend
+
+        # The asynchronous methods of cache backends are available since
+        # Django 4.0.
+        method = getattr(backend, 'a' + name, None)
+
+        if method is None:
+            return await sync_to_async(getattr(backend, name))(*args)
+
+        return await method(*args)
+
+
+    def __parseEntry(self, key, values, now):
+        value = values.get(self.KEY_PREFIX + key)
+
+        if value is None:
+            return None
+
+        generation, softExpiresAt, hardExpiresAt, payload = value
+
+        # If the entry was written before the last clear().
+        if generation != values.get(self.GENERATION_KEY, 0):
+            return None
+
+        # The backend may keep the entry a little longer than the hard
+        # expiration time because its timeout is in whole seconds.
+        if hardExpiresAt <= now:
+            return None
+
+        return IntrospectionResponse.from_json(payload), softExpiresAt
+
+
+    def __buildEntry(self, generation, response, softExpiresAt, hardExpiresAt, now):
+        value   = (generation, softExpiresAt, hardExpiresAt, self.__serialize(response))
+        timeout = max(1, int(math.ceil(hardExpiresAt - now)))
+
+        return value, timeout
+
+
+    def __serialize(self, response):
+        # The constructor of IntrospectionResponse fills missing attributes
+        # with their default values, so they can be omitted.
+        dct = {
+            name: value for name, value in json.loads(response.to_json()).items()
+            if not self.__isDefaultValue(value)
+        }
+
+        return json.dumps(dct, separators=(',', ':'))
+
+
+    def __isDefaultValue(self, value):
+        if value is None or value is False:
+            return True
+
+        return type(value) in (int, float) and value == 0
@@ -0,0 +1,271 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import threading
+import time
+from collections                         import OrderedDict
+from concurrent.futures                  import ThreadPoolExecutor
+from authlete.django.cache.single_flight import SingleFlight
+
+
+class DocumentCache(object):
+    """In-process cache of documents that rarely change.
+
+    This class is used by request handlers of well-known endpoints, such as
+    `ConfigurationRequestHandler`, to avoid calling Authlete APIs on every
+    request. Documents are kept as `CachedDocument` instances whose content
+    has been encoded into bytes in advance.
+
+    A document is fresh for `ttl` seconds after it was loaded. After that, it
+    is still served for up to `staleTtl` more seconds while a background thread
+    reloads it, so that request threads do not wait for Authlete. Concurrent
+    loads of the same key on a cache miss are coalesced.
+
+    When the number of documents exceeds `maxSize`, the least recently used
+    one is evicted. The numbers of hits, misses and evictions are counted
+    for monitoring.
+
+    Instances of this class are thread-safe. Create one per process (e.g. at
+    module level) and share it among handlers.
+    """
+
+
+    def __init__(self, ttl=300, staleTtl=300, refreshWorkers=1, maxSize=100):
+        """Constructor
+
+        Args:
+            ttl (float) : The time in seconds during which a document is fresh.
+            staleTtl (float) :
+                The grace period in seconds after `ttl` during which a stale
+                document is served while it is reloaded. 0 disables background
+                refresh.
+            refreshWorkers (int) :
+                The maximum number of threads that reload stale documents.
+            maxSize (int) : The maximum number of documents.
+        """
+
+        self._ttl            = ttl
+        self._staleTtl       = staleTtl
+        self._refreshWorkers = refreshWorkers
+        self._maxSize        = maxSize
+        self._entries        = OrderedDict()
+        self._hits           = 0
+        self._misses         = 0
+        self._evictions      = 0
+        self._refreshing     = set()
+        self._executor       = None
+        self._singleFlight   = SingleFlight()
+        self._lock           = threading.Lock()
+
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+
+    @property
+    def staleTtl(self):
+        return self._staleTtl
+
+
+    @property
+    def maxSize(self):
+        return self._maxSize
+
+
+    @property
+    def size(self):
+        """Get the number of documents including ones that have expired but have not been evicted yet.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+    @property
+    def hits(self):
+        """Get the number of lookups that found a document, including stale ones.
+
+        Returns:
+            int
+        """
+        return self._hits
+
+
+    @property
+    def misses(self):
+        """Get the number of lookups that had to load a document.
+
+        Returns:
+            int
+        """
+        return self._misses
+
+
+    @property
+    def evictions(self):
+        """Get the number of documents evicted because of `maxSize`.
+
+        Returns:
+            int
+        """
+        return self._evictions
+
+
+    def get(self, key, loader):
+        """Get the document for the key, loading it if necessary.
+
+        Args:
+            key (hashable) : A key that identifies the document.
+            loader (callable) :
+                A function that takes no argument and returns a
+                `CachedDocument`. If it returns None, nothing is cached.
+
+        Returns:
+            authlete.django.cache.CachedDocument :
+                The document. None if the loader returned None.
+
+        Raises:
+            Exception : The loader raised an exception on a cache miss.
+        """
+
+        now   = time.time()
+        entry = self.__getEntry(key, now)
+
+        if entry is None:
+            # Load the document synchronously. Concurrent loads are coalesced.
+            return self._singleFlight.do(key, lambda: self.__load(key, loader))
+
+        document, softExpiresAt = entry
+
+        if softExpiresAt <= now:
+            # Serve the stale document and reload it in the background.
+            with self._lock:
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self.__getExecutor().submit(self.__refresh, key, loader)
+
+        return document
+
+
+    def put(self, key, document):
+        """Put a document into the cache.
+
+        If the document has `expiresAt`, it is not served after that time
+        even if `ttl` and `staleTtl` have not passed yet.
+
+        Args:
+            key (hashable)
+            document (authlete.django.cache.CachedDocument)
+        """
+
+        now = time.time()
+
+        softExpiresAt = now + self._ttl
+        hardExpiresAt = softExpiresAt + self._staleTtl
+
+        if document.expiresAt is not None:
+            softExpiresAt = min(softExpiresAt, document.expiresAt)
+            hardExpiresAt = min(hardExpiresAt, document.expiresAt)
+
+        if hardExpiresAt <= now:
+            # The document has expired already.
+            return
+
+        with self._lock:
+            self._entries[key] = (document, softExpiresAt, hardExpiresAt)
+            self._entries.move_to_end(key)
+
+            # Evict the least recently used documents.
+            while len(self._entries) > self._maxSize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+    def remove(self, key):
+        """Remove the document for the key if any.
+
+        Args:
+            key (hashable)
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+    def clear(self):
+        """Remove all the documents.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+
+    def __getEntry(self, key, now):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            document, softExpiresAt, hardExpiresAt = entry
+
+            if hardExpiresAt <= now:
+                # The document has expired.
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            # Mark the document as most recently used.
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return document, softExpiresAt
+
+
+    def __load(self, key, loader):
+        document = loader()
+
+        if document is not None:
+            self.put(key, document)
+
+        return document
+
+
+    def __getExecutor(self):
+        # Called with the lock held.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._refreshWorkers,
+                thread_name_prefix='DocumentCache')
+
+        return self._executor
+
+
+    def __refresh(self, key, loader):
+        try:
+            self.__load(key, loader)
+        except Exception:
+            # Keep the stale document until it expires.
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
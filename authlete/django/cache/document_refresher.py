@@ -0,0 +1,156 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentRefresher(object):
+    """Background thread that keeps cached documents up to date.
+
+    Targets are request handlers that have a `reload()` method, such as
+    `ConfigurationRequestHandler` and `JwksRequestHandler` created with a
+    `DocumentCache`. Every `interval` seconds, the refresher calls `reload()`
+    of each target, which fetches the document from Authlete and replaces
+    the cached one. Request threads therefore always find a fresh document
+    in the cache and never wait for Authlete, provided that `interval` is
+    shorter than the `ttl` of the cache.
+
+    When the content of a document changes (e.g. by key rotation), `onChange`
+    is called with the target and the new `CachedDocument`. The first load
+    of each target is not regarded as a change.
+
+    A refresher can be listed in the `AUTHLETE_WARMUP_HANDLERS` setting. Its
+    `warmUp()` method loads the documents once and starts the thread.
+    """
+
+
+    def __init__(self, targets, interval=60, onChange=None):
+        """Constructor
+
+        Args:
+            targets (list) : Objects that have a `reload()` method.
+            interval (float) : The interval of refreshes in seconds.
+            onChange (callable) :
+                A function that takes a target and a `CachedDocument`. It is
+                called in the refresher thread when a document has changed.
+        """
+
+        self._targets  = list(targets)
+        self._interval = interval
+        self._onChange = onChange
+        self._etags    = {}
+        self._thread   = None
+        self._stopped  = threading.Event()
+        self._lock     = threading.Lock()
+
+
+    @property
+    def targets(self):
+        return self._targets
+
+
+    @property
+    def interval(self):
+        return self._interval
+
+
+    @property
+    def running(self):
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+
+    def start(self):
+        """Start the refresher thread. This method does nothing if it is running.
+        """
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stopped.clear()
+
+            # A daemon thread does not prevent the process from exiting.
+            self._thread = threading.Thread(
+                target=self.__run, name='DocumentRefresher', daemon=True)
+            self._thread.start()
+
+
+    def stop(self, timeout=None):
+        """Stop the refresher thread.
+
+        Args:
+            timeout (float) : The time in seconds to wait for the thread to stop.
+        """
+
+        self._stopped.set()
+
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None:
+            thread.join(timeout)
+
+
+    def warmUp(self):
+        """Load the documents once and start the refresher thread.
+        """
+
+        self.refreshNow()
+        self.start()
+
+
+    def refreshNow(self):
+        """Reload the documents of all the targets in the current thread.
+
+        Exceptions raised by targets are logged and do not stop the others.
+        The cached documents are kept as they are when reloading fails.
+        """
+
+        for index, target in enumerate(self._targets):
+            try:
+                document = target.reload()
+            except Exception as cause:
+                logger.warning("Failed to reload the document of %r: %s", target, cause)
+                continue
+
+            etag = None if document is None else document.etag
+
+            with self._lock:
+                previous = self._etags.get(index, etag)
+                self._etags[index] = etag
+
+            if previous != etag and self._onChange is not None:
+                self.__notify(target, document)
+
+
+    def __notify(self, target, document):
+        try:
+            self._onChange(target, document)
+        except Exception as cause:
+            logger.warning("The change callback failed: %s", cause)
+
+
+    def __run(self):
+        # Event.wait() returns True when stop() is called.
+        while not self._stopped.wait(self._interval):
+            self.refreshNow()
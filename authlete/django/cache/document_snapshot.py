@@ -0,0 +1,205 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from authlete.django.cache.cached_document import CachedDocument
+
+
+class DocumentSnapshot(object):
+    """File that shares cached documents among processes.
+
+    One process writes documents, their ETags and expiration times into the
+    file with `write()`. Other processes map the file into memory with
+    `read()` and get documents whose content refers to the mapped memory
+    directly, so the content is neither read nor copied per process.
+
+    The file is replaced atomically (a new file is written and renamed), so
+    readers never see a partially written snapshot, and documents obtained
+    from an old mapping stay valid. Each snapshot has a generation counter
+    which is incremented on every write.
+
+    The file layout is a header (magic, generation and the length of the
+    index), a JSON index of the documents and their contents.
+    """
+
+
+    MAGIC  = b'ALDSNAP1'
+    HEADER = struct.Struct('<8sQI')
+
+
+    def __init__(self, path):
+        """Constructor
+
+        Args:
+            path (str) : The path of the snapshot file.
+        """
+
+        self._path       = path
+        self._generation = 0
+        self._documents  = {}
+        self._identity   = None
+        self._lock       = threading.Lock()
+
+
+    @property
+    def path(self):
+        return self._path
+
+
+    @property
+    def generation(self):
+        """Get the generation of the snapshot that was read or written last.
+
+        Returns:
+            int : 0 if no snapshot has been read or written.
+        """
+        return self._generation
+
+
+    def write(self, entries):
+        """Write documents into the snapshot file.
+
+        Args:
+            entries (list) :
+                Tuples of a key, a `CachedDocument` and the time in seconds
+                since the Unix epoch after which the document must not be
+                served. A key is a str or a tuple of JSON-compatible values.
+
+        Returns:
+            int : The generation of the written snapshot.
+        """
+
+        index    = []
+        contents = []
+        offset   = 0
+
+        for key, document, expiresAt in entries:
+            content = bytes(document.content)
+
+            index.append({
+                'key':         list(key) if isinstance(key, tuple) else key,
+                'contentType': document.contentType,
+                'etag':        document.etag,
+                'location':    document.location,
+                'expiresAt':   expiresAt,
+                'offset':      offset,
+                'length':      len(content)
+            })
+
+            contents.append(content)
+            offset += len(content)
+
+        encodedIndex = json.dumps(index, separators=(',', ':')).encode('utf-8')
+
+        with self._lock:
+            generation = max(self._generation, self.__readGeneration()) + 1
+
+            directory = os.path.dirname(os.path.abspath(self._path))
+            fd, temporary = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.HEADER.pack(self.MAGIC, generation, len(encodedIndex)))
+                    f.write(encodedIndex)
+
+                    for content in contents:
+                        f.write(content)
+
+                # Readers see either the old file or the new one.
+                os.replace(temporary, self._path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+            self._generation = generation
+
+        return generation
+
+
+    def read(self):
+        """Get the documents in the snapshot file.
+
+        The file is mapped again only when it has been replaced since the
+        last call.
+
+        Returns:
+            dict :
+                Pairs of a key and a tuple of a `CachedDocument` and its
+                expiration time. Empty if the file does not exist.
+        """
+
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return {}
+
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if identity != self._identity:
+                self.__map(identity)
+
+            return self._documents
+
+
+    def __map(self, identity):
+        # Called with the lock held.
+        with open(self._path, 'rb') as f:
+            if identity[2] < self.HEADER.size:
+                return
+
+            # The mapping stays valid after the file is closed.
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        magic, generation, indexLength = self.HEADER.unpack_from(buffer)
+
+        if magic != self.MAGIC or generation < self._generation:
+            return
+
+        start = self.HEADER.size + indexLength
+        index = json.loads(bytes(buffer[self.HEADER.size:start]).decode('utf-8'))
+
+        documents = {}
+
+        for item in index:
+            key     = tuple(item['key']) if isinstance(item['key'], list) else item['key']
+            offset  = start + item['offset']
+            content = buffer[offset:offset + item['length']]
+
+            documents[key] = (CachedDocument(content, item['contentType'],
+                expiresAt=item['expiresAt'], location=item['location'],
+                etag=item['etag']), item['expiresAt'])
+
+        self._documents  = documents
+        self._generation = generation
+        self._identity   = identity
+
+
+    def __readGeneration(self):
+        try:
+            with open(self._path, 'rb') as f:
+                magic, generation, _ = self.HEADER.unpack(f.read(self.HEADER.size))
+        except (OSError, struct.error):
+            return 0
+
+        return generation if magic == self.MAGIC else 0
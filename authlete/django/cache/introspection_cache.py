@@ -0,0 +1,479 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import hashlib
+import threading
+import time
+from collections                       import OrderedDict
+from concurrent.futures                import ThreadPoolExecutor
+from authlete.django.cache.signals     import tokenRevoked
+from authlete.dto.introspection_action import IntrospectionAction
+
+
+class IntrospectionCache(object):
+    """In-process cache of responses from Authlete's /api/auth/introspection API.
+
+    Entries are keyed by the SHA-256 hash of an access token (see `computeKey()`)
+    so that raw access tokens are not kept as dictionary keys. An entry expires
+    at the expiration time of the access token (`expiresAt` of the response)
+    or `maxTtl` seconds after it was put, whichever comes first. When the number
+    of entries exceeds `maxSize`, the least recently used entry is evicted.
+
+    Responses whose `action` is `UNAUTHORIZED` or `BAD_REQUEST` (e.g. for a
+    revoked or malformed access token) are cached for `negativeTtl` seconds
+    so that clients retrying with a bad access token do not trigger an API
+    call each time. Responses with other actions are never cached.
+
+    When `staleTtl` is greater than 0, an entry that has passed `maxTtl` is
+    still served for up to `staleTtl` more seconds while a background thread
+    refreshes it (stale-while-revalidate). See `get()`. A stale entry is
+    never served after the expiration time of the access token.
+
+    Entries are removed when the `tokenRevoked` signal is sent, for example,
+    by `RevocationRequestHandler` after a successful revocation. When a
+    refresh token is revoked, Authlete also revokes the access tokens issued
+    with it, but their hashes are unknown here. Therefore, if the signal says
+    that the revoked token is a refresh token, all the entries are cleared
+    unless `clearOnRefreshTokenRevocation` is False. Note that a client may
+    omit `token_type_hint`, in which case only the entry of the revoked token
+    itself is removed.
+
+    A response fetched while its entry is removed must not be put afterwards,
+    or the revoked token would stay valid. Callers get a stamp by `stamp()`
+    before calling the API and pass it to `put()`, which drops the response
+    if the entry has been removed or the cache has been cleared since then.
+
+    Instances of this class are thread-safe and can be shared by multiple
+    `AccessTokenValidator` instances.
+    """
+
+
+    # Actions of responses that are cached as negative results.
+    NEGATIVE_ACTIONS = (IntrospectionAction.UNAUTHORIZED, IntrospectionAction.BAD_REQUEST)
+
+    # The maximum number of removed keys remembered for puts in flight.
+    MAX_TOMBSTONES = 1000
+
+
+    def __init__(self, maxSize=1000, maxTtl=300, negativeTtl=10, staleTtl=0, refreshWorkers=2,
+                 clearOnRefreshTokenRevocation=True):
+        """Constructor
+
+        Args:
+            maxSize (int) : The maximum number of entries.
+            maxTtl (float) : The maximum lifetime of an entry in seconds.
+            negativeTtl (float) :
+                The lifetime of a negative entry in seconds. 0 disables
+                caching negative results.
+            staleTtl (float) :
+                The grace period in seconds after `maxTtl` during which a
+                stale entry is served while it is refreshed. 0 disables
+                stale-while-revalidate.
+            refreshWorkers (int) :
+                The maximum number of threads that refresh stale entries.
+            clearOnRefreshTokenRevocation (bool) :
+                True to clear all the entries when the `tokenRevoked` signal
+                reports the revocation of a refresh token.
+        """
+
+        self._maxSize        = maxSize
+        self._maxTtl         = maxTtl
+        self._negativeTtl    = negativeTtl
+        self._staleTtl       = staleTtl
+        self._refreshWorkers = refreshWorkers
+        self._clearOnRefreshTokenRevocation = clearOnRefreshTokenRevocation
+        self._entries        = OrderedDict()
+        self._refreshing     = set()
+        self._removals       = 0
+        self._tombstones     = OrderedDict()
+        self._staleStamp     = 0
+        self._executor       = None
+        self._lock           = threading.RLock()
+
+        # Remove the entry of a token when it is revoked. The receiver is
+        # weakly referenced, so this does not keep the cache alive.
+        tokenRevoked.connect(self.__onTokenRevoked)
+
+
+    @property
+    def maxSize(self):
+        return self._maxSize
+
+
+    @property
+    def maxTtl(self):
+        return self._maxTtl
+
+
+    @property
+    def negativeTtl(self):
+        return self._negativeTtl
+
+
+    @property
+    def staleTtl(self):
+        return self._staleTtl
+
+
+    @property
+    def size(self):
+        """Get the number of entries including ones that have expired but have not been evicted yet.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+    @classmethod
+    def computeKey(cls, accessToken):
+        """Compute the cache key for an access token.
+
+        Args:
+            accessToken (str)
+
+        Returns:
+            str : The hex-encoded SHA-256 hash of the access token.
+        """
+        return hashlib.sha256(accessToken.encode('utf-8')).hexdigest()
+
+
+    def stamp(self):
+        """Get a stamp to be given to `put()` for a response about to be fetched.
+
+        Returns:
+            int : The number of removals so far.
+        """
+        with self._lock:
+            return self._removals
+
+
+    def get(self, key, refresher=None):
+        """Get the cached introspection response.
+
+        If the entry is stale (i.e. it has passed `maxTtl` but is still within
+        `staleTtl`) and `refresher` is given, the stale response is returned
+        and `refresher` is executed in a background thread to refresh the
+        entry. Only one refresh per key runs at a time. If `refresher` is not
+        given, a stale entry is treated as missing.
+
+        Args:
+            key (str) : A key computed by `computeKey()`.
+            refresher (callable) :
+                A function that takes no argument and returns a fresh
+                `IntrospectionResponse`. If it returns None or raises an
+                exception, the stale entry is left as is.
+
+        Returns:
+            authlete.dto.IntrospectionResponse :
+                The cached response. None if no entry is found or the entry
+                has expired. The returned object is shared and must not be
+                modified.
+        """
+
+        now = time.time()
+
+        return self.__serve(key, self._loadEntry(key, now), now, refresher)
+
+
+    async def aget(self, key, refresher=None):
+        """Get the cached introspection response without blocking the event loop.
+
+        This is the asynchronous version of `get()`.
+
+        Args:
+            key (str) : A key computed by `computeKey()`.
+            refresher (callable) : See `get()`.
+
+        Returns:
+            authlete.dto.IntrospectionResponse : See `get()`.
+        """
+
+        now = time.time()
+
+        return self.__serve(key, await self._aloadEntry(key, now), now, refresher)
+
+
+    def __serve(self, key, entry, now, refresher):
+        if entry is None:
+            return None
+
+        response, softExpiresAt = entry
+
+        if now < softExpiresAt:
+            # The entry is fresh.
+            return response
+
+        if refresher is None:
+            return None
+
+        # Serve the stale entry and refresh it in the background.
+        with self._lock:
+            if key not in self._refreshing:
+                self._refreshing.add(key)
+                self.__getExecutor().submit(self.__refresh, key, refresher)
+
+        return response
+
+
+    def put(self, key, response, stamp=None):
+        """Put an introspection response into the cache.
+
+        The response is silently ignored if its `action` is not cacheable.
+
+        Args:
+            key (str) : A key computed by `computeKey()`.
+            response (authlete.dto.IntrospectionResponse)
+            stamp (int) :
+                A value returned by `stamp()` before the response was fetched.
+                If the entry has been removed since then, the response is
+                ignored. None not to check it.
+        """
+
+        now = time.time()
+        softExpiresAt, hardExpiresAt = self.__computeExpiresAt(response, now)
+
+        # If the response is not cacheable or the access token has expired.
+        if hardExpiresAt <= now:
+            return
+
+        # remove() and clear() wait for the store to complete.
+        with self._lock:
+            if self.__isRemovedSince(key, stamp):
+                return
+
+            self._storeEntry(key, response, softExpiresAt, hardExpiresAt, now)
+
+
+    async def aput(self, key, response, stamp=None):
+        """Put an introspection response into the cache without blocking the event loop.
+
+        This is the asynchronous version of `put()`.
+
+        Args:
+            key (str) : A key computed by `computeKey()`.
+            response (authlete.dto.IntrospectionResponse)
+            stamp (int) : See `put()`.
+        """
+
+        now = time.time()
+        softExpiresAt, hardExpiresAt = self.__computeExpiresAt(response, now)
+
+        # If the response is not cacheable or the access token has expired.
+        if hardExpiresAt <= now or self.__isRemovedSince(key, stamp):
+            return
+
+        await self._astoreEntry(key, response, softExpiresAt, hardExpiresAt, now)
+
+        # The lock cannot be held while awaiting, so a removal may have run
+        # before the store completed.
+        if self.__isRemovedSince(key, stamp):
+            await self._adeleteEntry(key)
+
+
+    def remove(self, key):
+        """Remove the entry for the key if any.
+
+        Args:
+            key (str) : A key computed by `computeKey()`.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+            # A response being fetched by a refresh may predate the removal.
+            self._refreshing.discard(key)
+
+            # Responses being fetched on a cache miss may predate it too.
+            self._removals += 1
+            self._tombstones[key] = self._removals
+            self._tombstones.move_to_end(key)
+
+            while len(self._tombstones) > self.MAX_TOMBSTONES:
+                # Puts that started before the forgotten removal are dropped.
+                self._staleStamp = self._tombstones.popitem(last=False)[1]
+
+
+    def clear(self):
+        """Remove all the entries.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._refreshing.clear()
+
+            # Puts that started before now are dropped.
+            self._removals  += 1
+            self._tombstones.clear()
+            self._staleStamp = self._removals
+
+
+    def _loadEntry(self, key, now):
+        """Load an entry from the storage.
+
+        Subclasses that use a different storage override this method together
+        with `_storeEntry()`, `remove()`, `clear()` and the `size` property,
+        and with the asynchronous versions.
+
+        Args:
+            key (str)
+            now (float) : The current time in seconds since the Unix epoch.
+
+        Returns:
+            tuple :
+                A pair of the response and the soft expiration time. None if
+                the entry is not found or has passed its hard expiration time.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            response, softExpiresAt, hardExpiresAt = entry
+
+            if hardExpiresAt <= now:
+                # The entry has expired.
+                del self._entries[key]
+                return None
+
+            # Mark the entry as most recently used.
+            self._entries.move_to_end(key)
+
+            return response, softExpiresAt
+
+
+    def _storeEntry(self, key, response, softExpiresAt, hardExpiresAt, now):
+        """Store an entry into the storage.
+
+        Args:
+            key (str)
+            response (authlete.dto.IntrospectionResponse)
+            softExpiresAt (float) : The time after which the entry is stale.
+            hardExpiresAt (float) : The time after which the entry must not be served.
+            now (float) : The current time in seconds since the Unix epoch.
+        """
+
+        with self._lock:
+            self._entries[key] = (response, softExpiresAt, hardExpiresAt)
+            self._entries.move_to_end(key)
+
+            # Evict the least recently used entries.
+            while len(self._entries) > self._maxSize:
+                self._entries.popitem(last=False)
+
+
+    async def _adeleteEntry(self, key):
+        """Delete an entry from the storage without blocking the event loop.
+
+        This is called when a removal has raced with `aput()`. Unlike
+        `remove()`, the removal is not recorded.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+    async def _aloadEntry(self, key, now):
+        """Load an entry from the storage without blocking the event loop.
+
+        The entries of this class are in memory, so this method just calls
+        `_loadEntry()`. Subclasses whose storage involves I/O override it.
+        """
+
+        return self._loadEntry(key, now)
+
+
+    async def _astoreEntry(self, key, response, softExpiresAt, hardExpiresAt, now):
+        """Store an entry into the storage without blocking the event loop.
+
+        The entries of this class are in memory, so this method just calls
+        `_storeEntry()`. Subclasses whose storage involves I/O override it.
+        """
+
+        self._storeEntry(key, response, softExpiresAt, hardExpiresAt, now)
+
+
+    def __computeExpiresAt(self, response, now):
+        action = response.action
+
+        if action in self.NEGATIVE_ACTIONS:
+            # A negative result is kept only for a short time.
+            expiresAt = now + self._negativeTtl
+            return expiresAt, expiresAt
+
+        if action != IntrospectionAction.OK:
+            # Other results (e.g. INTERNAL_SERVER_ERROR) are not cached.
+            return now, now
+
+        softExpiresAt = now + self._maxTtl
+        hardExpiresAt = softExpiresAt + self._staleTtl
+
+        # 'expiresAt' of the introspection response is the expiration time
+        # of the access token in milliseconds since the Unix epoch. The entry
+        # must never be served after it.
+        if response.expiresAt is not None and response.expiresAt > 0:
+            tokenExpiresAt = response.expiresAt / 1000.0
+            softExpiresAt  = min(softExpiresAt, tokenExpiresAt)
+            hardExpiresAt  = min(hardExpiresAt, tokenExpiresAt)
+
+        return softExpiresAt, hardExpiresAt
+
+
+    def __isRemovedSince(self, key, stamp):
+        if stamp is None:
+            return False
+
+        with self._lock:
+            return stamp < self._staleStamp or stamp < self._tombstones.get(key, 0)
+
+
+    def __onTokenRevoked(self, sender, tokenHash, tokenTypeHint=None, **kwargs):
+        if tokenTypeHint == 'refresh_token' and self._clearOnRefreshTokenRevocation:
+            # The access tokens issued with the refresh token are revoked too.
+            self.clear()
+        else:
+            self.remove(tokenHash)
+
+
+    def __getExecutor(self):
+        # Called with the lock held.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._refreshWorkers,
+                thread_name_prefix='IntrospectionCache')
+
+        return self._executor
+
+
+    def __refresh(self, key, refresher):
+        try:
+            response = refresher()
+
+            with self._lock:
+                # Don't put back a response fetched before the entry was
+                # removed, e.g. because the token was revoked.
+                if response is not None and key in self._refreshing:
+                    self.put(key, response)
+        except Exception:
+            # Keep the stale entry until it expires.
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
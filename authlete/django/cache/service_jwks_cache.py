@@ -0,0 +1,198 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import json
+import threading
+import time
+from authlete.django.cache.single_flight import SingleFlight
+
+try:
+    from jwt import PyJWK
+    from jwt.exceptions import PyJWKError
+except ImportError:
+    PyJWK = None
+
+
+class ServiceJwksCache(object):
+    """Cache of the public keys in the JWK Set of the service.
+
+    The JWK Set is fetched by Authlete's /api/service/jwks/get API and kept
+    for `ttl` seconds. When a key with an unknown key ID is requested, the
+    JWK Set is fetched again so that key rotation is picked up, but not more
+    often than once per `minRefreshInterval` seconds. Concurrent fetches are
+    coalesced.
+
+    `PyJWT` with the `crypto` extra must be installed to use this class.
+    """
+
+
+    def __init__(self, api, ttl=3600, minRefreshInterval=60):
+        """Constructor
+
+        Args:
+            api (authlete.api.AuthleteApi)
+            ttl (float) : The lifetime of the fetched JWK Set in seconds.
+            minRefreshInterval (float) :
+                The minimum interval in seconds between fetches triggered by
+                unknown key IDs.
+        """
+
+        if PyJWK is None:
+            raise RuntimeError("'PyJWT' is required to use ServiceJwksCache.")
+
+        self._api                = api
+        self._ttl                = ttl
+        self._minRefreshInterval = minRefreshInterval
+        self._keys               = None
+        self._fetchedAt          = None
+        self._lock               = threading.Lock()
+        self._singleFlight       = SingleFlight()
+
+
+    @property
+    def api(self):
+        return self._api
+
+
+    def getKey(self, kid):
+        """Get the public key that has the key ID.
+
+        Args:
+            kid (str) : A key ID.
+
+        Returns:
+            jwt.PyJWK : The key. None if the JWK Set does not contain the key.
+
+        Raises:
+            authlete.api.AuthleteApiException : Fetching the JWK Set failed.
+        """
+
+        with self._lock:
+            keys      = self._keys
+            fetchedAt = self._fetchedAt
+
+        now = time.monotonic()
+
+        # If the last attempt to fetch the JWK Set failed recently.
+        if keys is None and fetchedAt is not None and now - fetchedAt < self._minRefreshInterval:
+            return None
+
+        # If the JWK Set has not been fetched yet or has expired.
+        if keys is None or self._ttl <= now - fetchedAt:
+            keys, fetchedAt = self.refresh(), time.monotonic()
+
+        key = keys.get(kid)
+
+        # The key may have been added to the JWK Set by key rotation.
+        if key is None and self._minRefreshInterval <= now - fetchedAt:
+            key = self.refresh().get(kid)
+
+        return key
+
+
+    def isFetchNeeded(self, kid):
+        """Check whether `getKey()` would fetch the JWK Set for the key ID.
+
+        This is used to avoid the blocking API call on an event loop.
+
+        Args:
+            kid (str) : A key ID.
+
+        Returns:
+            bool
+        """
+
+        if not isinstance(kid, str):
+            return False
+
+        with self._lock:
+            keys      = self._keys
+            fetchedAt = self._fetchedAt
+
+        now = time.monotonic()
+
+        # If the last attempt to fetch the JWK Set failed recently.
+        if keys is None and fetchedAt is not None and now - fetchedAt < self._minRefreshInterval:
+            return False
+
+        # If the JWK Set has not been fetched yet or has expired.
+        if keys is None or self._ttl <= now - fetchedAt:
+            return True
+
+        # If the key ID is unknown and the JWK Set may be fetched again.
+        return kid not in keys and self._minRefreshInterval <= now - fetchedAt
+
+
+    def warmUp(self):
+        """Fetch the JWK Set in advance.
+
+        Raises:
+            authlete.api.AuthleteApiException : Fetching the JWK Set failed.
+        """
+
+        self.refresh()
+
+
+    def refresh(self):
+        """Fetch the JWK Set of the service.
+
+        Returns:
+            dict : Pairs of a key ID and a `jwt.PyJWK` instance.
+
+        Raises:
+            authlete.api.AuthleteApiException : Fetching the JWK Set failed.
+        """
+
+        return self._singleFlight.do('jwks', self.__fetch)
+
+
+    def __fetch(self):
+        try:
+            # Call Authlete's /api/service/jwks/get API without pretty
+            # formatting and without private keys.
+            keys = self.__parseJwks(self._api.getServiceJwks(False, False))
+        except Exception:
+            with self._lock:
+                # Don't hammer the API while it is failing.
+                self._fetchedAt = time.monotonic()
+            raise
+
+        with self._lock:
+            self._keys      = keys
+            self._fetchedAt = time.monotonic()
+
+        return keys
+
+
+    def __parseJwks(self, jwks):
+        keys = {}
+
+        if jwks is None or len(jwks) == 0:
+            return keys
+
+        for jwk in json.loads(jwks).get('keys', []):
+            # Keys for encryption are not used to verify signatures.
+            if jwk.get('kid') is None or jwk.get('use') == 'enc':
+                continue
+
+            try:
+                keys[jwk['kid']] = PyJWK(jwk)
+            except PyJWKError:
+                # Unsupported key type or algorithm.
+                continue
+
+        return keys
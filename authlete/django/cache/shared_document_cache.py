@@ -0,0 +1,153 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import time
+from authlete.django.cache.document_cache    import DocumentCache
+from authlete.django.cache.document_snapshot import DocumentSnapshot
+
+
+class SharedDocumentCache(DocumentCache):
+    """`DocumentCache` whose documents are shared among worker processes.
+
+    Documents are shared through a `DocumentSnapshot` file. One process, the
+    writer (`writer=True`), refreshes the documents (typically by running a
+    `DocumentRefresher`) and rewrites the snapshot whenever a document is
+    put. The other processes look up the snapshot first and use the
+    documents in it without calling Authlete. Only when a document is not
+    in the snapshot or has expired there do they fall back to the behavior
+    of `DocumentCache`. Handlers must be given `tenant` for their documents
+    to be shared, because keys without it are not JSON-compatible.
+
+    Readers check whether the snapshot file has been replaced at most once
+    per `checkInterval` seconds.
+
+    The snapshot is replaced by renaming a new file, so this class is meant
+    for POSIX systems.
+    """
+
+
+    def __init__(self, path, writer=False, checkInterval=1,
+                 ttl=300, staleTtl=300, refreshWorkers=1, maxSize=100):
+        """Constructor
+
+        Args:
+            path (str) : The path of the snapshot file.
+            writer (bool) : True if this process writes the snapshot.
+            checkInterval (float) :
+                The interval in seconds at which readers check the snapshot
+                file for a new generation.
+            ttl (float)
+            staleTtl (float)
+            refreshWorkers (int)
+            maxSize (int)
+        """
+
+        super().__init__(ttl, staleTtl, refreshWorkers, maxSize)
+
+        self._snapshot      = DocumentSnapshot(path)
+        self._writer        = writer
+        self._checkInterval = checkInterval
+        self._documents     = {}
+        self._checkedAt     = None
+
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+
+    @property
+    def writer(self):
+        return self._writer
+
+
+    def get(self, key, loader):
+        """Get the document for the key from the snapshot or `DocumentCache`.
+
+        See `DocumentCache.get()` for details.
+        """
+
+        if not self._writer:
+            document = self.__getFromSnapshot(key)
+
+            if document is not None:
+                with self._lock:
+                    self._hits += 1
+
+                return document
+
+        return super().get(key, loader)
+
+
+    def put(self, key, document):
+        """Put a document into the cache and, if this is the writer, into the snapshot.
+
+        See `DocumentCache.put()` for details.
+        """
+
+        super().put(key, document)
+
+        if self._writer:
+            self.publish()
+
+
+    def publish(self):
+        """Write the documents in this cache into the snapshot file.
+
+        Documents whose keys are not JSON-compatible are not written.
+
+        Returns:
+            int : The generation of the written snapshot.
+        """
+
+        with self._lock:
+            entries = [ (key, document, hardExpiresAt)
+                        for key, (document, softExpiresAt, hardExpiresAt)
+                        in self._entries.items() if self.__isSharable(key) ]
+
+        return self._snapshot.write(entries)
+
+
+    def __getFromSnapshot(self, key):
+        now = time.time()
+
+        # Checking the file costs a system call, so it is done only once
+        # per checkInterval.
+        if self._checkedAt is None or self._checkedAt + self._checkInterval <= now:
+            self._documents = self._snapshot.read()
+            self._checkedAt = now
+
+        entry = self._documents.get(key)
+
+        if entry is None:
+            return None
+
+        document, expiresAt = entry
+
+        # The writer may have stopped refreshing the document.
+        if expiresAt is not None and expiresAt <= now:
+            return None
+
+        return document
+
+
+    def __isSharable(self, key):
+        values = key if isinstance(key, tuple) else (key,)
+
+        return all(value is None or isinstance(value, (str, int, float, bool))
+                   for value in values)
@@ -0,0 +1,36 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+from django.dispatch import Signal
+
+
+# Sent when an access token or a refresh token has been revoked successfully
+# at the revocation endpoint. The 'tokenHash' argument is the key computed by
+# IntrospectionCache.computeKey() from the revoked token, and the optional
+# 'tokenTypeHint' argument is the 'token_type_hint' of the request (RFC 7009).
+# Every instance of IntrospectionCache (and its subclasses) in the process
+# listens to this signal and removes the entry for the token, or all the
+# entries when a refresh token has been revoked.
+tokenRevoked = Signal()
+
+
+# Sent when claims of a user have been changed, for example, when the user
+# has updated their profile. The 'subject' argument is the subject of the
+# user. Every instance of UserClaimCache in the process listens to this
+# signal and removes the entries of the user.
+userClaimsChanged = Signal()
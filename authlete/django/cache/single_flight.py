@@ -0,0 +1,163 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import asyncio
+import threading
+
+
+class _Call(object):
+    def __init__(self):
+        self.event     = threading.Event()
+        self.result    = None
+        self.exception = None
+
+
+class SingleFlight(object):
+    """Coalescing of concurrent calls that share the same key.
+
+    While a call for a key is in flight, other threads calling `do()` with
+    the same key do not execute their functions but wait for the in-flight
+    call and receive its result (or its exception). This is useful to make
+    a burst of identical Authlete API calls cost one round trip.
+
+    `ado()` is the counterpart for coroutines. Calls are coalesced among
+    tasks running on the same event loop without blocking the loop.
+
+    Instances of this class are thread-safe and are meant to be shared.
+    """
+
+
+    def __init__(self):
+        self._calls   = {}
+        self._futures = {}
+        self._lock    = threading.Lock()
+
+
+    def do(self, key, func):
+        """Execute the function unless a call for the same key is in flight.
+
+        Args:
+            key (object) : A hashable key that identifies the call.
+            func (callable) : A function that takes no argument.
+
+        Returns:
+            object : The value returned from the function.
+
+        Raises:
+            Exception : The exception raised by the function.
+        """
+
+        with self._lock:
+            call   = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            # Wait for the in-flight call to complete.
+            call.event.wait()
+
+            if call.exception is not None:
+                raise call.exception
+
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as cause:
+            call.exception = cause
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            # Wake up the waiting threads.
+            call.event.set()
+
+        return call.result
+
+
+    async def ado(self, key, func):
+        """Await the coroutine function unless a call for the same key is in flight.
+
+        Args:
+            key (object) : A hashable key that identifies the call.
+            func (callable) : A coroutine function that takes no argument.
+
+        Returns:
+            object : The value returned from the coroutine.
+
+        Raises:
+            Exception : The exception raised by the coroutine.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        # Futures are bound to an event loop.
+        futureKey = (loop, key)
+
+        while True:
+            with self._lock:
+                future = self._futures.get(futureKey)
+                leader = future is None
+
+                if leader:
+                    future = loop.create_future()
+                    self._futures[futureKey] = future
+
+            if leader:
+                return await self.__lead(futureKey, future, func)
+
+            try:
+                # Cancellation of a waiting task must not cancel the shared future.
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or self.__isCancelling():
+                    raise
+
+            # The leader was cancelled (e.g. its client disconnected), but this
+            # task was not. Retry so that one of the waiting tasks takes over.
+
+
+    async def __lead(self, futureKey, future, func):
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as cause:
+            future.set_exception(cause)
+
+            # Avoid "exception was never retrieved" when nobody is waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._futures[futureKey]
+
+        return result
+
+
+    def __isCancelling(self):
+        # Task.cancelling() is available since Python 3.11.
+        cancelling = getattr(asyncio.current_task(), 'cancelling', None)
+
+        return cancelling is not None and cancelling() > 0
@@ -0,0 +1,222 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import threading
+import time
+from collections                   import OrderedDict
+from authlete.django.cache.signals import userClaimsChanged
+
+
+class UserClaimCache(object):
+    """In-process cache of claim values of users.
+
+    `ClaimCollector` looks up claim values through this cache instead of
+    calling `UserClaimProviderSpi` each time. Entries are keyed by a triplet
+    of a subject, a claim name and a language tag, and expire `ttl` seconds
+    after they were put. Claims that the user does not have are cached too
+    (as None) so that lookups for fallback language tags are skipped as well.
+    When the number of entries exceeds `maxSize`, the least recently used
+    entry is evicted.
+
+    When claims of a user change, call `invalidate()` with the subject of the
+    user or send the `userClaimsChanged` signal. Otherwise, the old values
+    may be served until they expire.
+
+    Instances of this class are thread-safe and can be shared by multiple
+    handlers.
+    """
+
+
+    def __init__(self, maxSize=10000, ttl=60):
+        """Constructor
+
+        Args:
+            maxSize (int) : The maximum number of entries.
+            ttl (float) : The lifetime of an entry in seconds.
+        """
+
+        self._maxSize  = maxSize
+        self._ttl      = ttl
+        self._entries  = OrderedDict()
+        self._subjects = {}
+        self._hits     = 0
+        self._misses   = 0
+        self._lock     = threading.Lock()
+
+        # Remove the entries of a user when their claims change. The receiver
+        # is weakly referenced, so this does not keep the cache alive.
+        userClaimsChanged.connect(self.__onUserClaimsChanged)
+
+
+    @property
+    def maxSize(self):
+        return self._maxSize
+
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+
+    @property
+    def hits(self):
+        return self._hits
+
+
+    @property
+    def misses(self):
+        return self._misses
+
+
+    @property
+    def size(self):
+        """Get the number of entries including ones that have expired but have not been evicted yet.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return len(self._entries)
+
+
+    def get(self, subject, claimName, languageTag, loader):
+        """Get the value of a claim of a user.
+
+        Args:
+            subject (str) : The subject of a user.
+            claimName (str) : A claim name such as "name".
+            languageTag (str) : A language tag such as "ja". May be None.
+            loader (callable) :
+                A function that takes no argument and returns the claim value.
+                It is called when the value is not cached, and its result is
+                cached even if it is None.
+
+        Returns:
+            object : The value of the claim. None if the user does not have it.
+        """
+
+        key     = (claimName, languageTag)
+        entries = self.getAll(subject, [ key ])
+
+        if key in entries:
+            return entries[key]
+
+        value = loader()
+        self.putAll(subject, { key: value })
+
+        return value
+
+
+    def getAll(self, subject, keys):
+        """Get cached values of claims of a user.
+
+        Args:
+            subject (str) : The subject of a user.
+            keys (list) :
+                Pairs of a claim name and a language tag (None for the claim
+                value without a language tag).
+
+        Returns:
+            dict :
+                Pairs of a key and its cached value. Keys whose values are not
+                cached are not contained.
+        """
+
+        now    = time.time()
+        values = {}
+
+        with self._lock:
+            for key in keys:
+                entryKey = (subject, key)
+                entry    = self._entries.get(entryKey)
+
+                if entry is not None and now < entry[1]:
+                    # Mark the entry as most recently used.
+                    self._entries.move_to_end(entryKey)
+                    values[key] = entry[0]
+                    self._hits += 1
+                else:
+                    self._misses += 1
+
+        return values
+
+
+    def putAll(self, subject, values):
+        """Put values of claims of a user into the cache.
+
+        Args:
+            subject (str) : The subject of a user.
+            values (dict) :
+                Pairs of a key (a pair of a claim name and a language tag)
+                and the value of the claim. None as a value means that the
+                user does not have the claim.
+        """
+
+        expiresAt = time.time() + self._ttl
+
+        with self._lock:
+            keys = self._subjects.setdefault(subject, set())
+
+            for key, value in values.items():
+                entryKey = (subject, key)
+                self._entries[entryKey] = (value, expiresAt)
+                self._entries.move_to_end(entryKey)
+                keys.add(key)
+
+            # Evict the least recently used entries.
+            while len(self._entries) > self._maxSize:
+                (evictedSubject, evictedKey), _ = self._entries.popitem(last=False)
+                self.__forget(evictedSubject, evictedKey)
+
+
+    def invalidate(self, subject):
+        """Remove all the entries of a user.
+
+        Args:
+            subject (str) : The subject of a user.
+        """
+
+        with self._lock:
+            for key in self._subjects.pop(subject, ()):
+                self._entries.pop((subject, key), None)
+
+
+    def clear(self):
+        """Remove all the entries.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._subjects.clear()
+
+
+    def __forget(self, subject, key):
+        # Called with the lock held.
+        keys = self._subjects.get(subject)
+
+        if keys is None:
+            return
+
+        keys.discard(key)
+
+        if len(keys) == 0:
+            del self._subjects[subject]
+
+
+    def __onUserClaimsChanged(self, sender, subject, **kwargs):
+        self.invalidate(subject)
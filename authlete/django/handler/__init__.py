@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019-2024 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -19,6 +19,7 @@ from .authorization_request_base_handler             import AuthorizationRequest
 from .authorization_request_decision_handler         import AuthorizationRequestDecisionHandler
 from .authorization_request_error_handler            import AuthorizationRequestErrorHandler
 from .base_request_handler                           import BaseRequestHandler
+from .claim_collection_context                       import ClaimCollectionContext
 from .claim_collector                                import ClaimCollector
 from .configuration_request_handler                  import ConfigurationRequestHandler
 from .credential_issuer_jwks_request_handler         import CredentialIssuerJwksRequestHandler
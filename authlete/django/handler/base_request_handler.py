@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,7 +15,10 @@
 # License.
 
 
-from authlete.django.web.response_utility import ResponseUtility
+from django.conf                           import settings
+from django.utils.http                     import parse_etags
+from authlete.django.cache.cached_document import CachedDocument
+from authlete.django.web.response_utility  import ResponseUtility
 
 
 class BaseRequestHandler(object):
@@ -47,3 +50,212 @@ class BaseRequestHandler(object):
             "{} API returned an unknown action."}'.format(apiPath)
 
         return ResponseUtility.internalServerError(content)
+
+
+    def warmUp(self):
+        """Load data that this handler caches in advance.
+
+        This method is called at startup by `authlete.django.apps.AuthleteDjangoConfig`
+        for handlers listed in the `AUTHLETE_WARMUP_HANDLERS` setting. The
+        default implementation does nothing.
+        """
+
+        pass
+
+
+    def buildCacheKey(self, name, tenant, *params):
+        """Build a key of a document in a document cache.
+
+        Documents of different Authlete services must not be mixed up even
+        when their handlers share a cache. If `tenant` is None, the `api`
+        instance is used in place of it. Such a key is not JSON-compatible,
+        so `SharedDocumentCache` does not share the document among worker
+        processes. Give `tenant` to the handlers to share it.
+
+        Args:
+            name (str) : The name of the document, e.g. the path of an Authlete API.
+            tenant (str) : An identifier of the Authlete service. May be None.
+            params : Other values that identify the document.
+
+        Returns:
+            tuple
+        """
+
+        return (name, self._api if tenant is None else tenant) + params
+
+
+    def isPrettyRequested(self, request, pretty=None):
+        """Decide whether JSON should be formatted in pretty format.
+
+        Compact JSON is used by default. Pretty format is used when the
+        request has the `pretty` query parameter (e.g. "?pretty" or
+        "?pretty=true") or when the `AUTHLETE_PRETTY_JSON` setting is True.
+
+        Args:
+            request (django.http.HttpRequest) : The request. May be None.
+            pretty (bool) : An explicit choice. If not None, it is returned as is.
+
+        Returns:
+            bool
+        """
+
+        if pretty is not None:
+            return pretty
+
+        if request is not None and 'pretty' in request.GET:
+            return request.GET['pretty'].lower() not in ('0', 'false', 'no')
+
+        return getattr(settings, 'AUTHLETE_PRETTY_JSON', False)
+
+
+    def getCachedDocument(self, cache, key, call, okAction, build=CachedDocument):
+        """Get a document from a cache, calling an Authlete API on a miss.
+
+        Only successful responses of the API are cached. When the API returns
+        an error, the response is returned instead of a document so that the
+        caller can build an error response from it.
+
+        Args:
+            cache (authlete.django.cache.DocumentCache)
+            key (tuple) : The key of the document in the cache.
+            call (callable) :
+                A function that takes no argument, calls the Authlete API and
+                returns its response, which has `action` and `responseContent`.
+            okAction : The `action` of a successful response.
+            build (callable) :
+                A function that takes `responseContent` of a successful
+                response and returns a `CachedDocument`.
+
+        Returns:
+            tuple :
+                A pair of the document and None, or a pair of None and the
+                response from the API when it is not successful.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        # The response from the Authlete API is put here when this thread
+        # calls the API but the result is not cacheable.
+        holder = []
+
+        def load():
+            res = call()
+
+            if res.action != okAction:
+                # Errors are not cached.
+                holder.append(res)
+                return None
+
+            return build(res.responseContent)
+
+        document = cache.get(key, load)
+
+        if document is not None:
+            return document, None
+
+        if len(holder) == 0:
+            # Another thread called the API and got an uncacheable result,
+            # which is not shared. Call the API for this thread.
+            holder.append(call())
+
+        return None, holder[0]
+
+
+    def documentResponse(self, request, document, maxAge, compress=True):
+        """Create a cacheable response of a document.
+
+        If the client accepts gzip or Brotli (Accept-Encoding), a compressed
+        variant of the document is used. If the `If-None-Match` header of the
+        request matches the ETag of the selected variant, a response of
+        "304 Not Modified" without a body is returned. Otherwise, a response
+        of "200 OK" with the variant is returned.
+
+        Args:
+            request (django.http.HttpRequest) : The request. May be None.
+            document (authlete.django.cache.CachedDocument)
+            maxAge (int) : The value of max-age of the Cache-Control header.
+            compress (bool) :
+                False not to use compressed variants. Compression pays off
+                only when the document is reused, so this should be False
+                for a document built for a single request.
+
+        Returns:
+            django.http.HttpResponse
+        """
+
+        if compress:
+            content, etag, headers = self.__selectVariant(request, document)
+        else:
+            content, etag, headers = document.content, document.etag, None
+
+        if request is not None and self.__matchesEtag(request, etag):
+            # 304 Not Modified
+            return ResponseUtility.notModified(etag, maxAge, headers)
+
+        # 200 OK, application/json;charset=UTF-8
+        return ResponseUtility.okCacheableJson(content, etag, maxAge, headers)
+
+
+    def __selectVariant(self, request, document):
+        # The response varies depending on Accept-Encoding.
+        headers = { 'Vary': 'Accept-Encoding' }
+
+        if request is not None:
+            accepted = self.__parseAcceptEncoding(request.headers.get('Accept-Encoding'))
+            quality  = lambda encoding: accepted.get(encoding, accepted.get('*', 0))
+
+            # Higher quality first. The sort is stable, so the preference
+            # order of the document is kept among the same quality.
+            for encoding in sorted(document.ENCODINGS, key=lambda e: -quality(e)):
+                if quality(encoding) <= 0:
+                    continue
+
+                variant = document.getVariant(encoding)
+
+                if variant is not None:
+                    headers['Content-Encoding'] = encoding
+                    return variant[0], variant[1], headers
+
+        return document.content, document.etag, headers
+
+
+    def __parseAcceptEncoding(self, header):
+        accepted = {}
+
+        if header is None:
+            return accepted
+
+        # e.g. "gzip, deflate, br;q=0.9, *;q=0"
+        for element in header.split(','):
+            coding, _, params = element.partition(';')
+            quality           = 1.0
+
+            params = params.strip()
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+
+            accepted[coding.strip().lower()] = quality
+
+        return accepted
+
+
+    def __matchesEtag(self, request, etag):
+        header = request.headers.get('If-None-Match')
+
+        if header is None:
+            return False
+
+        # If-None-Match uses the weak comparison (RFC 9110, 13.1.2).
+        for candidate in parse_etags(header):
+            if candidate == '*' or self.__stripWeak(candidate) == etag:
+                return True
+
+        return False
+
+
+    def __stripWeak(self, etag):
+        return etag[2:] if etag.startswith('W/') else etag
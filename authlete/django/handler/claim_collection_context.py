@@ -0,0 +1,68 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+class ClaimCollectionContext(object):
+    """Context of one run of `ClaimCollector.collect()`.
+
+    The subject is fixed during a collection, so the profile of the user is
+    loaded only once, when a claim value is looked up for the first time,
+    and is shared by the lookups of the other claims.
+    """
+
+
+    def __init__(self, subject, profileLoader=None):
+        """Constructor
+
+        Args:
+            subject (str) : The subject (= unique identifier) of the user.
+            profileLoader (callable) :
+                A function that takes the subject and returns the profile of
+                the user. None if no profile is used.
+        """
+
+        self._subject       = subject
+        self._profileLoader = profileLoader
+        self._profile       = None
+        self._profileLoaded = False
+
+
+    @property
+    def subject(self):
+        return self._subject
+
+
+    @property
+    def profile(self):
+        """Get the profile of the user, loading it on first access.
+
+        Returns:
+            object : The profile. None if it is not available.
+        """
+
+        if not self._profileLoaded:
+            if self._profileLoader is not None:
+                self._profile = self._profileLoader(self._subject)
+
+            self._profileLoaded = True
+
+        return self._profile
+
+
+    @property
+    def profileLoaded(self):
+        return self._profileLoaded
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,8 +15,11 @@
 # License.
 
 
+from authlete.django.handler.claim_collection_context import ClaimCollectionContext
+
+
 class ClaimCollector(object):
-    def __init__(self, subject, claimNames, claimLocales, claimProvider):
+    def __init__(self, subject, claimNames, claimLocales, claimProvider, claimCache=None):
         """Constructor
 
         Args:
@@ -24,12 +27,15 @@ class ClaimCollector(object):
             claimNames (list)   : list of str. Claim names.
             claimLocales (list) : list of str. Claim locales.
             claimProvider (authlete.django.handler.spi.ClaimProviderSpi)
+            claimCache (authlete.django.cache.UserClaimCache) :
+                A cache of claim values. None not to cache claim values.
         """
 
         self._subject       = subject
         self._claimNames    = claimNames
         self._claimLocales  = self.__normalizeClaimLocales(claimLocales)
         self._claimProvider = claimProvider
+        self._claimCache    = claimCache
 
 
     def __normalizeClaimLocales(self, claimLocales):
@@ -68,10 +74,46 @@ class ClaimCollector(object):
         if claimNames is None or len(claimNames) == 0:
             return None
 
+        # Triplets of a claim name, its name part and its language tag part.
+        targets = self.__parseClaimNames(claimNames)
+
+        if len(targets) == 0:
+            return None
+
+        # Try the bulk lookup first. It returns None if it is not supported.
+        values = self.__getClaimValuesInBulk(targets)
+
+        # The profile of the user is loaded at most once in this collection.
+        context = self.__createContext()
+
         # Pairs of claim name and its value.
         collectedClaims = {}
 
         # For each required claim.
+        for claimName, name, tag in targets:
+            if values is None:
+                # Get the value of the claim.
+                value = self.__getClaimValue(context, name, tag)
+            else:
+                value = self.__pickClaimValue(values, name, tag)
+
+            # If the value of the claim was not obtained.
+            if value is None:
+                continue
+
+            # Add the pair of the claim name and its value.
+            collectedClaims[claimName] = value
+
+        # If no claim value has been obtained.
+        if len(collectedClaims) == 0:
+            return None
+
+        return collectedClaims
+
+
+    def __parseClaimNames(self, claimNames):
+        targets = []
+
         for claimName in claimNames:
             if claimName is None:
                 continue
@@ -85,49 +127,121 @@ class ClaimCollector(object):
             if name is None or len(name) == 0:
                 continue
 
-            # Get the value of the claim.
-            value = self.__getClaimValue(name, tag)
-
-            # If the value of the claim was not obtained.
-            if value is None:
-                continue
-
             # Just for an edge case where claimName ends with '#'. e.g. 'family_name#'
             if tag is None or len(tag) == 0:
                 claimName = name
+                tag       = None
 
-            # Add the pair of the claim name and its value.
-            collectedClaims[claimName] = value
+            targets.append((claimName, name, tag))
 
-        # If no claim value has been obtained.
-        if len(collectedClaims) == 0:
-            return None
+        return targets
 
-        return collectedClaims
-
-
-    def __getClaimValue(self, name, tag):
-        provider = self._claimProvider
-        subject  = self._subject
 
+    def __getLanguageTags(self, tag):
         # If a language tag is explicitly appended.
-        if tag is not None and len(tag) != 0:
-            # Get the claim value of the claim with the specific language tag.
-            return provider.getUserClaimValue(subject, name, tag)
+        if tag is not None:
+            # The claim value with the specific language tag only.
+            return [ tag ]
 
         # If claim locales are not specified by the 'claims_locales' parameter.
         if self._claimLocales is None:
-            # Get the claim value of the claim without any language tag.
-            return provider.getUserClaimValue(subject, name, None)
+            # The claim value without any language tag.
+            return [ None ]
 
-        # For each claim locale. They are ordered by preference.
-        for locale in self._claimLocales:
-            # Try to get the claim value with the claim locale.
-            value = provider.getUserClaimValue(subject, name, locale)
+        # The claim locales ordered by preference, and as the last resort,
+        # the claim value without any language tag.
+        return self._claimLocales + [ None ]
+
+
+    def __getClaimValuesInBulk(self, targets):
+        provider = self._claimProvider
+
+        # The provider may not implement UserClaimProviderSpi.
+        if not hasattr(provider, 'getUserClaimValues'):
+            return None
+
+        requests = [ (name, tag, self.__getLanguageTags(tag))
+                     for claimName, name, tag in targets ]
+
+        if self._claimCache is None:
+            return provider.getUserClaimValues(self._subject, requests)
+
+        return self.__getClaimValuesInBulkWithCache(provider, requests)
+
+
+    def __getClaimValuesInBulkWithCache(self, provider, requests):
+        cache   = self._claimCache
+        subject = self._subject
+
+        keys   = [ (name, languageTag) for name, tag, languageTags in requests
+                   for languageTag in languageTags ]
+        values = cache.getAll(subject, keys)
+
+        # Requests some of whose claim values are not cached.
+        missing = [ r for r in requests
+                    if any((r[0], languageTag) not in values for languageTag in r[2]) ]
+
+        if len(missing) == 0:
+            return values
+
+        loaded = provider.getUserClaimValues(subject, missing)
+
+        if loaded is None:
+            # The bulk lookup is not supported.
+            return None
+
+        # Cache the values including None for claims the user does not have.
+        loaded = { (name, languageTag): loaded.get((name, languageTag))
+                   for name, tag, languageTags in missing
+                   for languageTag in languageTags }
+        cache.putAll(subject, loaded)
+        values.update(loaded)
+
+        return values
+
+
+    def __pickClaimValue(self, values, name, tag):
+        for languageTag in self.__getLanguageTags(tag):
+            value = values.get((name, languageTag))
+
+            if value is not None:
+                return value
+
+        return None
+
+
+    def __createContext(self):
+        # The provider may not implement UserClaimProviderSpi.
+        loader = getattr(self._claimProvider, 'loadUserProfile', None)
+
+        return ClaimCollectionContext(self._subject, loader)
+
+
+    def __getClaimValue(self, context, name, tag):
+        provider = self._claimProvider
+
+        # For each language tag. They are ordered by preference.
+        for languageTag in self.__getLanguageTags(tag):
+            # Try to get the claim value with the language tag.
+            value = self.__lookUp(provider, context, name, languageTag)
 
             # If the claim value was obtained.
             if value is not None:
                 return value
 
-        # The last resort. Try to get the claim value without any language tag.
-        return provider.getUserClaimValue(subject, name, None)
+        return None
+
+
+    def __lookUp(self, provider, context, name, languageTag):
+        if self._claimCache is None:
+            return self.__callProvider(provider, context, name, languageTag)
+
+        return self._claimCache.get(self._subject, name, languageTag,
+            lambda: self.__callProvider(provider, context, name, languageTag))
+
+
+    def __callProvider(self, provider, context, name, languageTag):
+        if hasattr(provider, 'getUserClaimValueInContext'):
+            return provider.getUserClaimValueInContext(context, name, languageTag)
+
+        return provider.getUserClaimValue(context.subject, name, languageTag)
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019-2024 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,8 +15,8 @@
 # License.
 
 
+from authlete.django.cache.cached_document       import CachedDocument
 from authlete.django.handler.base_request_handler import BaseRequestHandler
-from authlete.django.web.response_utility         import ResponseUtility
 from authlete.dto.service_configuration_request   import ServiceConfigurationRequest
 
 
@@ -37,27 +37,65 @@ class ConfigurationRequestHandler(BaseRequestHandler):
     the description about the "issuer" metadata defined in "3. OpenID Provider
     Metadata" (OpenID Connecto Discovery 1.0) and the "iss" claim in
     "2. ID Token" (OpenID Connect Core 1.0).
+
+    When a `DocumentCache` is given, the configuration is kept in it and
+    Authlete's /service/configuration API is called only when the cached
+    document has expired. Because handlers are usually created per request,
+    the cache should be created once per process and shared. Cache entries are
+    keyed by `tenant`, so one cache can be shared by handlers for multiple
+    services.
+
+    Responses carry an ETag and are cacheable for `maxAge` seconds. A request
+    whose If-None-Match header matches the ETag receives "304 Not Modified".
     """
 
 
-    def __init__(self, api):
+    def __init__(self, api, cache=None, maxAge=300, tenant=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
+            cache (authlete.django.cache.DocumentCache)
+            maxAge (int) : The value of max-age of the Cache-Control header.
+            tenant (str) :
+                An identifier of the Authlete service that `api` accesses.
+                It separates cache entries of different services. If None,
+                `api` itself separates them. See `buildCacheKey()`.
         """
 
         super().__init__(api)
 
+        self._cache  = cache
+        self._maxAge = maxAge
+        self._tenant = tenant
+
+
+    @property
+    def cache(self):
+        return self._cache
+
 
-    def handle(self, request, pretty=True):
+    @property
+    def maxAge(self):
+        return self._maxAge
+
+
+    @property
+    def tenant(self):
+        return self._tenant
+
+
+    def handle(self, request, pretty=None):
         """Handle a request to a configuration endpoint.
 
         This method calls Authlete's /service/configuration API.
 
         Args:
             request (django.http.HttpRequest)
-            pretty (bool)
+            pretty (bool) :
+                True to format the configuration in pretty format. If None,
+                it is decided by `isPrettyRequested()`. Each format is cached
+                separately.
 
         Returns:
             django.http.HttpResponse
@@ -66,12 +104,65 @@ class ConfigurationRequestHandler(BaseRequestHandler):
             authlete.api.AuthleteApiException
         """
 
+        pretty = self.isPrettyRequested(request, pretty)
+
+        document = self.__getDocument(pretty)
+
+        # 200 OK, application/json;charset=UTF-8 (or 304 Not Modified)
+        return self.documentResponse(request, document, self._maxAge, self._cache is not None)
+
+
+    def warmUp(self):
+        """Load the configuration into the cache in advance.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        if self._cache is not None:
+            self.__getDocument(self.isPrettyRequested(None))
+
+
+    def reload(self):
+        """Load the configuration from Authlete and replace the cached one.
+
+        This method is used by `authlete.django.cache.DocumentRefresher` to
+        refresh the cache in the background.
+
+        Returns:
+            authlete.django.cache.CachedDocument
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        pretty   = self.isPrettyRequested(None)
+        document = CachedDocument(self.__getConfiguration(pretty))
+
+        if self._cache is not None:
+            # Swap the cached document.
+            self._cache.put(self.__buildKey(pretty), document)
+
+        return document
+
+
+    def __getDocument(self, pretty):
+        if self._cache is None:
+            return CachedDocument(self.__getConfiguration(pretty))
+
+        # The content of the cached document has been encoded already.
+        return self._cache.get(self.__buildKey(pretty),
+            lambda: CachedDocument(self.__getConfiguration(pretty)))
+
+
+    def __buildKey(self, pretty):
+        return self.buildCacheKey('configuration', self._tenant, pretty)
+
+
+    def __getConfiguration(self, pretty):
         # Call Authlete's /service/configuration API. The API returns
         # JSON that complies with OpenID Connect Discovery 1.0.
         req = ServiceConfigurationRequest()
         req.pretty = pretty
 
-        jsn = self.api.getServiceConfiguration(req)
-
-        # 200 OK, application/json;charset=UTF-8
-        return ResponseUtility.okJson(jsn)
+        return self.api.getServiceConfiguration(req)
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2024 Authlete, Inc.
+# Copyright (C) 2024-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,6 +15,7 @@
 # License.
 
 
+from authlete.django.cache.cached_document        import CachedDocument
 from authlete.django.handler.base_request_handler import BaseRequestHandler
 from authlete.django.web.response_utility         import ResponseUtility
 from authlete.dto.credential_issuer_jwks_action   import CredentialIssuerJwksAction
@@ -23,26 +24,64 @@ from authlete.dto.credential_issuer_jwks_request  import CredentialIssuerJwksReq
 
 class CredentialIssuerJwksRequestHandler(BaseRequestHandler):
     """Handler for requests to a JWK Set endpoint of the credential issuer.
+
+    Successful responses carry an ETag and are cacheable for `maxAge` seconds.
+
+    When a `DocumentCache` is given, the JWK Set is kept in it and Authlete's
+    /vci/jwks API is called only when the cached document has expired. Cache
+    entries are keyed by `tenant` and the parameters of the request to the
+    Authlete API, so one cache can be shared by handlers for multiple
+    services and issuers.
     """
 
 
-    def __init__(self, api):
+    def __init__(self, api, cache=None, maxAge=300, tenant=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
+            cache (authlete.django.cache.DocumentCache)
+            maxAge (int) : The value of max-age of the Cache-Control header.
+            tenant (str) :
+                An identifier of the Authlete service that `api` accesses.
+                It separates cache entries of different services. If None,
+                `api` itself separates them. See `buildCacheKey()`.
         """
 
         super().__init__(api)
 
+        self._cache  = cache
+        self._maxAge = maxAge
+        self._tenant = tenant
+
+
+    @property
+    def cache(self):
+        return self._cache
+
+
+    @property
+    def maxAge(self):
+        return self._maxAge
+
 
-    def handle(self, request=None):
+    @property
+    def tenant(self):
+        return self._tenant
+
+
+    def handle(self, request=None, httpRequest=None):
         """Handle a request to a JWK Set endpoint of the credential issuer.
 
         This method calls Authlete's /vci/jwks API.
 
         Args:
-            request (authlete.dto.CredentialIssuerJwksRequest)
+            request (authlete.dto.CredentialIssuerJwksRequest) :
+                The request to the Authlete API. If None, a request is built
+                with `pretty` decided by `isPrettyRequested()`.
+            httpRequest (django.http.HttpRequest) :
+                The request to the endpoint. If given, its If-None-Match
+                header is compared with the ETag of the JWK Set.
 
         Returns:
             django.http.HttpResponse
@@ -53,11 +92,48 @@ class CredentialIssuerJwksRequestHandler(BaseRequestHandler):
 
         if request is None:
             request = CredentialIssuerJwksRequest()
-            request.pretty = True
+            request.pretty = self.isPrettyRequested(httpRequest)
+
+        if self._cache is None:
+            # Call Authlete's /vci/jwks API.
+            res = self.api.credentialIssuerJwks(request)
+        else:
+            document, res = self.__getDocument(request)
+
+            if document is not None:
+                # 200 OK (or 304 Not Modified)
+                return self.documentResponse(httpRequest, document, self._maxAge)
+
+        return self.__buildResponse(res, httpRequest)
+
+
+    def warmUp(self):
+        """Load the JWK Set into the cache in advance.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        if self._cache is None:
+            return
+
+        request = CredentialIssuerJwksRequest()
+        request.pretty = self.isPrettyRequested(None)
+
+        self.__getDocument(request)
+
+
+    def __getDocument(self, request):
+        # All the parameters of the request are part of the key, so that
+        # requests with different parameters do not share a document.
+        key = self.buildCacheKey('/vci/jwks', self._tenant, request.to_json())
+
+        # Call Authlete's /vci/jwks API if the document is not cached.
+        return self.getCachedDocument(self._cache, key,
+            lambda: self.api.credentialIssuerJwks(request), CredentialIssuerJwksAction.OK)
 
-        # Call Authlete's /vci/jwks API.
-        res = self.api.credentialIssuerJwks(request)
 
+    def __buildResponse(self, res, httpRequest):
         # 'action' in the response denotes the next action which
         # the implementation of the endpoint should take.
         action = res.action
@@ -66,8 +142,9 @@ class CredentialIssuerJwksRequestHandler(BaseRequestHandler):
         content = res.responseContent
 
         if action == CredentialIssuerJwksAction.OK:
-            # 200 OK
-            return ResponseUtility.okJson(content)
+            # 200 OK (or 304 Not Modified). The document is not reused, so
+            # it is not worth compressing.
+            return self.documentResponse(httpRequest, CachedDocument(content), self._maxAge, False)
         elif action == CredentialIssuerJwksAction.NOT_FOUND:
             # 404 Not Found
             return ResponseUtility.notFound(content)
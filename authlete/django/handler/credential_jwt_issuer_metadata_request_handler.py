@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2024 Authlete, Inc.
+# Copyright (C) 2024-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,6 +15,7 @@
 # License.
 
 
+from authlete.django.cache.cached_document               import CachedDocument
 from authlete.django.handler.base_request_handler        import BaseRequestHandler
 from authlete.django.web.response_utility                import ResponseUtility
 from authlete.dto.credential_jwt_issuer_metadata_action  import CredentialJwtIssuerMetadataAction
@@ -26,26 +27,64 @@ class CredentialJwtIssuerMetadataRequestHandler(BaseRequestHandler):
 
     A JWT issuer may provide an endpoint containing its metadata at
     "${Issuer-Identifier}/.well-known/jwt-vc-issuer".
+
+    Successful responses carry an ETag and are cacheable for `maxAge` seconds.
+
+    When a `DocumentCache` is given, the metadata is kept in it and Authlete's
+    /vci/jwtissuer API is called only when the cached document has expired. Cache
+    entries are keyed by `tenant` and the parameters of the request to the
+    Authlete API, so one cache can be shared by handlers for multiple
+    services and issuers.
     """
 
 
-    def __init__(self, api):
+    def __init__(self, api, cache=None, maxAge=300, tenant=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
+            cache (authlete.django.cache.DocumentCache)
+            maxAge (int) : The value of max-age of the Cache-Control header.
+            tenant (str) :
+                An identifier of the Authlete service that `api` accesses.
+                It separates cache entries of different services. If None,
+                `api` itself separates them. See `buildCacheKey()`.
         """
 
         super().__init__(api)
 
+        self._cache  = cache
+        self._maxAge = maxAge
+        self._tenant = tenant
+
+
+    @property
+    def cache(self):
+        return self._cache
+
+
+    @property
+    def tenant(self):
+        return self._tenant
+
 
-    def handle(self, request=None):
+    @property
+    def maxAge(self):
+        return self._maxAge
+
+
+    def handle(self, request=None, httpRequest=None):
         """Handle a request to a JWT issuer metadata endpoint.
 
         This method calls Authlete's /vci/jwtissuer API.
 
         Args:
-            request (authlete.dto.CredentialJwtIssuerMetadataRequest)
+            request (authlete.dto.CredentialJwtIssuerMetadataRequest) :
+                The request to the Authlete API. If None, a request is built
+                with `pretty` decided by `isPrettyRequested()`.
+            httpRequest (django.http.HttpRequest) :
+                The request to the endpoint. If given, its If-None-Match
+                header is compared with the ETag of the metadata.
 
         Returns:
             django.http.HttpResponse
@@ -56,11 +95,48 @@ class CredentialJwtIssuerMetadataRequestHandler(BaseRequestHandler):
 
         if request is None:
             request = CredentialJwtIssuerMetadataRequest()
-            request.pretty = True
+            request.pretty = self.isPrettyRequested(httpRequest)
+
+        if self._cache is None:
+            # Call Authlete's /vci/jwtissuer API.
+            res = self.api.credentialJwtIssuerMetadata(request)
+        else:
+            document, res = self.__getDocument(request)
+
+            if document is not None:
+                # 200 OK (or 304 Not Modified)
+                return self.documentResponse(httpRequest, document, self._maxAge)
+
+        return self.__buildResponse(res, httpRequest)
+
+
+    def warmUp(self):
+        """Load the metadata into the cache in advance.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        if self._cache is None:
+            return
+
+        request = CredentialJwtIssuerMetadataRequest()
+        request.pretty = self.isPrettyRequested(None)
+
+        self.__getDocument(request)
+
+
+    def __getDocument(self, request):
+        # All the parameters of the request are part of the key, so that
+        # requests with different parameters do not share a document.
+        key = self.buildCacheKey('/vci/jwtissuer', self._tenant, request.to_json())
+
+        # Call Authlete's /vci/jwtissuer API if the document is not cached.
+        return self.getCachedDocument(self._cache, key,
+            lambda: self.api.credentialJwtIssuerMetadata(request), CredentialJwtIssuerMetadataAction.OK)
 
-        # Call Authlete's /vci/jwtissuer API.
-        res = self.api.credentialJwtIssuerMetadata(request)
 
+    def __buildResponse(self, res, httpRequest):
         # 'action' in the response denotes the next action which
         # the implementation of the endpoint should take.
         action = res.action
@@ -69,8 +145,9 @@ class CredentialJwtIssuerMetadataRequestHandler(BaseRequestHandler):
         content = res.responseContent
 
         if action == CredentialJwtIssuerMetadataAction.OK:
-            # 200 OK
-            return ResponseUtility.okJson(content)
+            # 200 OK (or 304 Not Modified). The document is not reused, so
+            # it is not worth compressing.
+            return self.documentResponse(httpRequest, CachedDocument(content), self._maxAge, False)
         elif action == CredentialJwtIssuerMetadataAction.NOT_FOUND:
             # 404 Not Found
             return ResponseUtility.notFound(content)
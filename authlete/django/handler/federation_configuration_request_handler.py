@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2024 Authlete, Inc.
+# Copyright (C) 2024-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,6 +15,9 @@
 # License.
 
 
+import base64
+import json
+from authlete.django.cache.cached_document         import CachedDocument
 from authlete.django.handler.base_request_handler  import BaseRequestHandler
 from authlete.django.web.response_utility          import ResponseUtility
 from authlete.dto.federation_configuration_action  import FederationConfigurationAction
@@ -27,18 +30,57 @@ class FederationConfigurationRequestHandler(BaseRequestHandler):
     An entity that supports "OpenID Federation 1.0" provides an endpoint that
     returns its entity configuration in the JWT format. The URL of the endpoint
     is "{Entity-Identifier}/.well-known/openid-federation".
+
+    When a `DocumentCache` is given, the entity configuration for the default
+    request is kept in it and Authlete's /federation/configuration API is
+    called only when the cached document has expired. A request given by the
+    caller is not cached. Cache entries are keyed by `tenant`, so one cache can
+    be shared by handlers for multiple entities.
+
+    The cached entity configuration expires `expiryMargin` seconds before the
+    `exp` claim of the entity statement, so that an expired statement is never
+    served. The `ttl` of the cache still applies, so a cache dedicated to this
+    handler with a long `ttl` lets the statement be kept until then. Concurrent
+    reloads are coalesced.
     """
 
 
-    def __init__(self, api):
+    def __init__(self, api, cache=None, expiryMargin=60, tenant=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
+            cache (authlete.django.cache.DocumentCache)
+            expiryMargin (float) :
+                The time in seconds before the `exp` claim at which the cached
+                entity configuration expires.
+            tenant (str) :
+                An identifier of the Authlete service that `api` accesses.
+                It separates cache entries of different services. If None,
+                `api` itself separates them. See `buildCacheKey()`.
         """
 
         super().__init__(api)
 
+        self._cache        = cache
+        self._expiryMargin = expiryMargin
+        self._tenant       = tenant
+
+
+    @property
+    def cache(self):
+        return self._cache
+
+
+    @property
+    def expiryMargin(self):
+        return self._expiryMargin
+
+
+    @property
+    def tenant(self):
+        return self._tenant
+
 
     def handle(self, request=None):
         """Handle a request to a federation configuration endpoint.
@@ -58,9 +100,75 @@ class FederationConfigurationRequestHandler(BaseRequestHandler):
         if request is None:
             request = FederationConfigurationRequest()
 
+            if self._cache is not None:
+                document, res = self.__getDocument(request)
+
+                if document is not None:
+                    # 200 OK; application/entity-statement+jwt
+                    return ResponseUtility.entityStatement(document.content)
+
+                return self.__buildResponse(res)
+
         # Call Authlete's /federation/configuration API.
         res = self.api.federationConfiguration(request)
 
+        return self.__buildResponse(res)
+
+
+    def warmUp(self):
+        """Load the entity configuration into the cache in advance.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        if self._cache is None:
+            return
+
+        request = FederationConfigurationRequest()
+
+        self.__getDocument(request)
+
+
+    def __getDocument(self, request):
+        key = self.buildCacheKey('/federation/configuration', self._tenant)
+
+        # Call Authlete's /federation/configuration API if the document is
+        # not cached.
+        return self.getCachedDocument(self._cache, key,
+            lambda: self.api.federationConfiguration(request),
+            FederationConfigurationAction.OK, self.__buildDocument)
+
+
+    def __buildDocument(self, content):
+        return CachedDocument(content, 'application/entity-statement+jwt',
+            expiresAt=self.__computeExpiresAt(content))
+
+
+    def __computeExpiresAt(self, statement):
+        exp = self.__extractExp(statement)
+
+        if exp is None:
+            # Only the TTL of the cache applies.
+            return None
+
+        return exp - self._expiryMargin
+
+
+    def __extractExp(self, statement):
+        # The signature need not be verified because the entity statement
+        # has just been issued by Authlete.
+        try:
+            payload = statement.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+        except Exception:
+            return None
+
+        return exp if isinstance(exp, (int, float)) else None
+
+
+    def __buildResponse(self, res):
         # 'action' in the response denotes the next action which
         # the implementation of the endpoint should take.
         action = res.action
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,7 +15,9 @@
 # License.
 
 
+import time
 from authlete.api.authlete_api_exception          import AuthleteApiException
+from authlete.django.cache.cached_document        import CachedDocument
 from authlete.django.handler.base_request_handler import BaseRequestHandler
 from authlete.django.web.response_utility         import ResponseUtility
 
@@ -28,27 +30,73 @@ class JwksRequestHandler(BaseRequestHandler):
     and (2) encrypt their requests to the OpenID Provider. The URI of a JWK
     Set endpoint can be found as the value of the "jwks_uri" metadata which is
     defined in "3. OpenID Provider Metadata" of "OpenID Connect Discovery 1.0"
+
+    Responses carry an ETag and are cacheable for `maxAge` seconds. A request
+    whose If-None-Match header matches the ETag receives "304 Not Modified".
+
+    When a `DocumentCache` is given, the JWK Set is kept in it and Authlete's
+    /api/service/jwks/get API is called only when the cached document has
+    expired. If the JWK Set is hosted elsewhere and the API responds with a
+    redirection, the location is kept for `redirectTtl` seconds. Cache entries
+    are keyed by `tenant`, so one cache can be shared by handlers for multiple
+    services.
     """
 
 
-    def __init__(self, api):
+    def __init__(self, api, cache=None, maxAge=300, redirectTtl=300, tenant=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
+            cache (authlete.django.cache.DocumentCache)
+            maxAge (int) : The value of max-age of the Cache-Control header.
+            redirectTtl (float) :
+                The time in seconds during which a redirect location is kept
+                in the cache.
+            tenant (str) :
+                An identifier of the Authlete service that `api` accesses.
+                It separates cache entries of different services. If None,
+                `api` itself separates them. See `buildCacheKey()`.
         """
 
         super().__init__(api)
 
+        self._cache       = cache
+        self._maxAge      = maxAge
+        self._redirectTtl = redirectTtl
+        self._tenant      = tenant
+
+
+    @property
+    def cache(self):
+        return self._cache
+
+
+    @property
+    def maxAge(self):
+        return self._maxAge
+
+
+    @property
+    def redirectTtl(self):
+        return self._redirectTtl
+
+
+    @property
+    def tenant(self):
+        return self._tenant
+
 
-    def handle(self, request, pretty=True):
+    def handle(self, request, pretty=None):
         """Handle a request to a JWK Set document endpoint.
 
         This method calls Authlete's /api/service/jwks/get API.
 
         Args:
             request (django.http.HttpRequest)
-            pretty (bool) : True to format the JWK Set document in pretty format.
+            pretty (bool) :
+                True to format the JWK Set document in pretty format. If None,
+                it is decided by `isPrettyRequested()`.
 
         Returns:
             django.http.HttpResponse
@@ -57,21 +105,24 @@ class JwksRequestHandler(BaseRequestHandler):
             authlete.api.AuthleteApiException
         """
 
-        cause = None
+        cause  = None
+        pretty = self.isPrettyRequested(request, pretty)
 
         try:
-            # Call Authlete's /api/service/jwks/get API. The API returns the
-            # JWK Set (RFC 7517) of the service. The second argument given
-            # to getServiceJwks() is False not to include private keys.
-            jwks = self.api.getServiceJwks(pretty, False)
+            document = self.__getJwks(pretty)
 
             # If no JWK Set for the service is registered.
-            if jwks is None or len(jwks) == 0:
+            if document is None:
                 # 204 No Content.
                 return ResponseUtility.noContent()
 
-            # 200 OK, application/json;charset=UTF-8
-            return ResponseUtility.okJson(jwks)
+            # If the JWK Set is hosted elsewhere.
+            if document.location is not None:
+                # 302 Found with a Location header.
+                return ResponseUtility.location(document.location)
+
+            # 200 OK, application/json;charset=UTF-8 (or 304 Not Modified)
+            return self.documentResponse(request, document, self._maxAge, self._cache is not None)
         except AuthleteApiException as e:
             cause = e
 
@@ -84,3 +135,78 @@ class JwksRequestHandler(BaseRequestHandler):
 
         # 302 Found with a Location header.
         return ResponseUtility.location(location)
+
+
+    def warmUp(self):
+        """Load the JWK Set into the cache in advance.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        if self._cache is not None:
+            self.__getJwks(self.isPrettyRequested(None))
+
+
+    def reload(self):
+        """Load the JWK Set from Authlete and replace the cached one.
+
+        This method is used by `authlete.django.cache.DocumentRefresher` to
+        refresh the cache in the background.
+
+        Returns:
+            authlete.django.cache.CachedDocument :
+                The JWK Set or a redirection. None if no JWK Set is registered.
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        pretty   = self.isPrettyRequested(None)
+        document = self.__loadJwksOrLocation(pretty)
+
+        if self._cache is not None:
+            if document is None:
+                self._cache.remove(self.__buildKey(pretty))
+            else:
+                # Swap the cached document.
+                self._cache.put(self.__buildKey(pretty), document)
+
+        return document
+
+
+    def __getJwks(self, pretty):
+        if self._cache is None:
+            return self.__loadJwks(pretty)
+
+        return self._cache.get(self.__buildKey(pretty), lambda: self.__loadJwksOrLocation(pretty))
+
+
+    def __buildKey(self, pretty):
+        return self.buildCacheKey('jwks', self._tenant, pretty)
+
+
+    def __loadJwksOrLocation(self, pretty):
+        try:
+            return self.__loadJwks(pretty)
+        except AuthleteApiException as cause:
+            if cause.response is None or cause.response.status_code != 302:
+                raise
+
+            # Remember the location so that following requests do not need
+            # to call the API and handle the exception.
+            return CachedDocument(b'',
+                expiresAt=time.time() + self._redirectTtl,
+                location=cause.response.headers.get('Location'))
+
+
+    def __loadJwks(self, pretty):
+        # Call Authlete's /api/service/jwks/get API. The API returns the
+        # JWK Set (RFC 7517) of the service. The second argument given
+        # to getServiceJwks() is False not to include private keys.
+        jwks = self.api.getServiceJwks(pretty, False)
+
+        if jwks is None or len(jwks) == 0:
+            return None
+
+        return CachedDocument(jwks)
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -32,16 +32,20 @@ class NoInteractionHandler(AuthorizationRequestBaseHandler):
     """
 
 
-    def __init__(self, api, spi):
+    def __init__(self, api, spi, claimCache=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
             spi (authlete.django.handler.spi.NoInteractionHandlerSpi)
+            claimCache (authlete.django.cache.UserClaimCache) :
+                A cache of claim values shared among requests. None not to
+                cache claim values.
         """
 
         super().__init__(api)
-        self._spi = spi
+        self._spi        = spi
+        self._claimCache = claimCache
 
 
     def handle(self, response):
@@ -108,7 +112,7 @@ class NoInteractionHandler(AuthorizationRequestBaseHandler):
 
         # Collect claim values.
         claims = ClaimCollector(
-            subject, response.claims, response.claimsLocales, spi).collect()
+            subject, response.claims, response.claimsLocales, spi, self._claimCache).collect()
 
         # Properties to be associated with an access token and/or an authorization code.
         properties = spi.getProperties()
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,6 +15,9 @@
 # License.
 
 
+import urllib.parse
+from authlete.django.cache.introspection_cache    import IntrospectionCache
+from authlete.django.cache.signals                import tokenRevoked
 from authlete.django.handler.base_request_handler import BaseRequestHandler
 from authlete.django.web.basic_credentials        import BasicCredentials
 from authlete.django.web.request_utility          import RequestUtility
@@ -41,7 +44,16 @@ class RevocationRequestHandler(BaseRequestHandler):
     def handle(self, request):
         """Handle a revocation request.
 
-        This method calls Authlete's /api/auth/revocation API.
+        This method calls Authlete's /api/auth/revocation API. When the token
+        has been revoked successfully, the `tokenRevoked` signal is sent so
+        that cached validation results of the token are invalidated.
+
+        When a refresh token is revoked, Authlete also revokes the access
+        tokens issued with it. They cannot be identified from the request,
+        so `IntrospectionCache` clears all its entries if `token_type_hint`
+        is `refresh_token`. Without the hint, only the entry of the revoked
+        token itself is invalidated, and the access tokens of the grant stay
+        valid in caches for up to `maxTtl` seconds.
 
         Args:
             request (django.http.HttpRequest)
@@ -81,6 +93,9 @@ class RevocationRequestHandler(BaseRequestHandler):
             # 400 Bad Request
             return ResponseUtility.badRequest(content)
         elif action == RevocationAction.OK:
+            # Invalidate cached validation results of the revoked token.
+            self.__publishRevocation(params)
+
             # 200 OK
             return ResponseUtility.okJavaScript(content)
         else:
@@ -100,6 +115,25 @@ class RevocationRequestHandler(BaseRequestHandler):
         return BasicCredentials(None, None)
 
 
+    def __publishRevocation(self, parameters):
+        if parameters is None:
+            return
+
+        # The 'token' request parameter holds the revoked token (RFC 7009).
+        params = urllib.parse.parse_qs(parameters)
+        tokens = params.get('token')
+        if tokens is None:
+            return
+
+        hints = params.get('token_type_hint')
+
+        # A failure of a receiver must not turn the successful revocation
+        # into an error response.
+        tokenRevoked.send_robust(sender=self.__class__,
+            tokenHash=IntrospectionCache.computeKey(tokens[0]),
+            tokenTypeHint=None if hints is None else hints[0])
+
+
     def __callRevocationApi(self, parameters, credentials):
         if parameters is None:
             # Authlete returns different error coes for None and an empty
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -42,3 +42,66 @@ class UserClaimProviderSpi(metaclass=ABCMeta):
                 should be returned.
         """
         pass
+
+
+    def getUserClaimValues(self, subject, requests):
+        """Get the values of multiple claims of a user at once.
+
+        This method is optional. `ClaimCollector` calls it before falling
+        back to `getUserClaimValue()`, so that an implementation backed by a
+        database can answer all the claims with one query. The default
+        implementation returns None, which means that the bulk lookup is not
+        supported.
+
+        Args:
+            subject (str) : The subject (= unique identifier) of a user.
+            requests (list) :
+                Tuples of a claim name, the language tag explicitly appended
+                to the claim name (or None), and the list of language tags to
+                try in order of preference. None in the list means the claim
+                value without any language tag.
+
+        Returns:
+            dict :
+                Pairs of a tuple of a claim name and a language tag (or None)
+                and the value of the claim. Claims whose values are not
+                available may be omitted. None if the bulk lookup is not
+                supported.
+        """
+        return None
+
+
+    def loadUserProfile(self, subject):
+        """Load the profile of a user.
+
+        This method is optional. `ClaimCollector` calls it at most once per
+        collection, when the first claim value is looked up, and makes the
+        result available to `getUserClaimValueInContext()` as
+        `context.profile`. The default implementation returns None.
+
+        Args:
+            subject (str) : The subject (= unique identifier) of a user.
+
+        Returns:
+            object : The profile of the user, e.g. a model instance.
+        """
+        return None
+
+
+    def getUserClaimValueInContext(self, context, claimName, languageTag):
+        """Get the value of a claim of a user in the context of a collection.
+
+        `ClaimCollector` calls this method instead of `getUserClaimValue()`.
+        An implementation can override it to read the claim value from
+        `context.profile` so that the profile is not loaded per claim. The
+        default implementation calls `getUserClaimValue()`.
+
+        Args:
+            context (authlete.django.handler.ClaimCollectionContext)
+            claimName (str) : A claim name such as "name" and "family_name".
+            languageTag (str) : A language tag such as "en" and "ja".
+
+        Returns:
+            object : The value of the claim. None if the value is not available.
+        """
+        return self.getUserClaimValue(context.subject, claimName, languageTag)
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019-2024 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -31,16 +31,20 @@ class UserInfoRequestHandler(BaseRequestHandler):
     """
 
 
-    def __init__(self, api, spi):
+    def __init__(self, api, spi, claimCache=None):
         """Constructor
 
         Args:
             api (authlete.api.AuthleteApi)
             spi (authlete.django.handler.spi.UserInfoRequestHandlerSpi)
+            claimCache (authlete.django.cache.UserClaimCache) :
+                A cache of claim values shared among requests. None not to
+                cache claim values.
         """
 
         super().__init__(api)
-        self._spi = spi
+        self._spi        = spi
+        self._claimCache = claimCache
 
 
     def handle(self, request):
@@ -127,7 +131,7 @@ class UserInfoRequestHandler(BaseRequestHandler):
     def __getUserInfo(self, response, headers):
         # Collect information about the user.
         claims = ClaimCollector(
-            response.subject, response.claims, None, self._spi).collect()
+            response.subject, response.claims, None, self._spi, self._claimCache).collect()
 
         # The value of the 'sub' claim (optional)
         sub = self._spi.getSub()
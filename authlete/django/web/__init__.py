@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,7 +15,13 @@
 # License.
 
 
-from .access_token_validator import AccessTokenValidator
-from .basic_credentials      import BasicCredentials
-from .request_utility        import RequestUtility
-from .response_utility       import ResponseUtility
+from .access_token_middleware        import AccessTokenMiddleware
+from .access_token_validation_result import AccessTokenValidationResult
+from .access_token_validator         import AccessTokenValidator
+from .async_introspection_client     import AsyncIntrospectionClient
+from .basic_credentials              import BasicCredentials
+from .coroutine_utility              import CoroutineUtility
+from .decorators                     import require_token
+from .jwt_access_token_verifier      import JwtAccessTokenVerifier
+from .request_utility                import RequestUtility
+from .response_utility               import ResponseUtility
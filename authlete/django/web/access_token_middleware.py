@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+from authlete.django.web.access_token_validator import AccessTokenValidator
+from authlete.django.web.coroutine_utility      import CoroutineUtility
+from authlete.django.web.request_utility        import RequestUtility
+
+
+class AccessTokenMiddleware(object):
+    """Django middleware that validates the access token in a request.
+
+    If a request has an access token in its Authorization header, this
+    middleware validates it once and attaches the result (an instance of
+    `AccessTokenValidationResult`) to the request as the
+    `accessTokenValidation` attribute. If the access token is invalid, the
+    error response that complies with RFC 6750 is returned without calling
+    the view. Requests without an access token are passed to the view as is;
+    use `require_token` to protect views that need an access token.
+
+    The validator is obtained by `AccessTokenValidator.getDefault()`, which
+    refers to the AUTHLETE_ACCESS_TOKEN_VALIDATOR setting.
+
+    This middleware supports both WSGI and ASGI deployments.
+    """
+
+
+    sync_capable  = True
+    async_capable = True
+
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if CoroutineUtility.isCoroutineFunction(self.get_response):
+            CoroutineUtility.markCoroutineFunction(self)
+
+
+    def __call__(self, request):
+        if CoroutineUtility.isCoroutineFunction(self):
+            return self.__acall(request)
+
+        if RequestUtility.extractAccessToken(request) is not None:
+            result = AccessTokenValidator.getDefault().checkRequest(request)
+
+            if not result.valid:
+                return result.errorResponse
+
+        return self.get_response(request)
+
+
+    async def __acall(self, request):
+        if RequestUtility.extractAccessToken(request) is not None:
+            result = await AccessTokenValidator.getDefault().acheckRequest(request)
+
+            if not result.valid:
+                return result.errorResponse
+
+        return await self.get_response(request)
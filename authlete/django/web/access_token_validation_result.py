@@ -0,0 +1,92 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+class AccessTokenValidationResult(object):
+    """The result of access token validation by `AccessTokenValidator.check()`.
+
+    Instances of this class are immutable.
+    """
+
+
+    __slots__ = ('_valid', '_introspectionResponse', '_introspectionException', '_errorResponse')
+
+
+    def __init__(self, valid, introspectionResponse=None, introspectionException=None, errorResponse=None):
+        """Constructor
+
+        Args:
+            valid (bool) : The result of the access token validation.
+            introspectionResponse (authlete.dto.IntrospectionResponse)
+            introspectionException (Exception)
+            errorResponse (django.http.HttpResponse)
+        """
+
+        object.__setattr__(self, '_valid',                  valid)
+        object.__setattr__(self, '_introspectionResponse',  introspectionResponse)
+        object.__setattr__(self, '_introspectionException', introspectionException)
+        object.__setattr__(self, '_errorResponse',          errorResponse)
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "'{}' object is immutable".format(type(self).__qualname__))
+
+
+    @property
+    def valid(self):
+        """Get the result of the access token validation.
+
+        Returns:
+            bool
+        """
+        return self._valid
+
+
+    @property
+    def introspectionResponse(self):
+        """Get the response from Authlete's /api/auth/introspection API.
+
+        None if the API call threw an exception. The response may be shared
+        with other results and must not be modified.
+
+        Returns:
+            authlete.dto.IntrospectionResponse
+        """
+        return self._introspectionResponse
+
+
+    @property
+    def introspectionException(self):
+        """Get the exception raised by a call to Authlete's /api/auth/introspection API.
+
+        Returns:
+            Exception
+        """
+        return self._introspectionException
+
+
+    @property
+    def errorResponse(self):
+        """Get the error response that should be sent back to the client.
+
+        None if the access token is valid. This error response complies with
+        RFC 6750 (The OAuth 2.0 Authorization Framework: Bearer Token Usage).
+
+        Returns:
+            django.http.HttpResponse
+        """
+        return self._errorResponse
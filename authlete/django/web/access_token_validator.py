@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -15,15 +15,63 @@
 # License.
 
 
-from authlete.django.web.response_utility import ResponseUtility
-from authlete.dto.introspection_action    import IntrospectionAction
-from authlete.dto.introspection_request   import IntrospectionRequest
+import base64
+import copy
+import hashlib
+import re
+from concurrent.futures                                 import ThreadPoolExecutor
+from asgiref.sync                                       import sync_to_async
+from django.conf                                        import settings
+from django.utils.module_loading                        import import_string
+from authlete.django.cache.introspection_cache          import IntrospectionCache
+from authlete.django.web.access_token_validation_result import AccessTokenValidationResult
+from authlete.django.web.request_utility                import RequestUtility
+from authlete.django.web.response_utility               import ResponseUtility
+from authlete.dto.introspection_action                  import IntrospectionAction
+from authlete.dto.introspection_request                 import IntrospectionRequest
 
 
 class AccessTokenValidator(object):
-    def __init__(self, api):
+    # The name of the attribute of django.http.HttpRequest to which the result
+    # of the access token validation is attached by `checkRequest()`.
+    REQUEST_ATTRIBUTE = 'accessTokenValidation'
+
+    # The validator built from the AUTHLETE_ACCESS_TOKEN_VALIDATOR setting.
+    __default = None
+
+
+    def __init__(self, api, cache=None, singleFlight=None, asyncClient=None, jwtVerifier=None):
+        """Constructor
+
+        Args:
+            api (authlete.api.AuthleteApi)
+            cache (authlete.django.cache.IntrospectionCache):
+                An optional cache of introspection responses. When a cache is
+                given, Authlete's /api/auth/introspection API is called without
+                `requiredScopes` and `requiredSubject`, and they are checked
+                locally against the cached response.
+            singleFlight (authlete.django.cache.SingleFlight):
+                An optional coalescer of concurrent introspection calls. When
+                validators running in different threads share the same
+                instance, concurrent validations of the same access token
+                (with the same scopes and subject) make only one API call.
+            asyncClient (authlete.django.web.AsyncIntrospectionClient):
+                An optional non-blocking client used by `acheck()` and
+                `avalidate()`. If this is not given, these methods run the
+                blocking API call in a worker thread.
+            jwtVerifier (authlete.django.web.JwtAccessTokenVerifier):
+                An optional verifier of JWT access tokens. When it is given,
+                JWT access tokens are verified locally and
+                /api/auth/introspection API is called only for access tokens
+                that cannot be verified locally (e.g. opaque ones).
+        """
+
         super().__init__()
-        self._api = api
+        self._api          = api
+        self._cache        = cache
+        self._singleFlight = singleFlight
+        self._asyncClient  = asyncClient
+        self._jwtVerifier  = jwtVerifier
         self.__resetValidation()
 
 
@@ -39,6 +87,26 @@ class AccessTokenValidator(object):
         return self._api
 
 
+    @property
+    def cache(self):
+        return self._cache
+
+
+    @property
+    def singleFlight(self):
+        return self._singleFlight
+
+
+    @property
+    def asyncClient(self):
+        return self._asyncClient
+
+
+    @property
+    def jwtVerifier(self):
+        return self._jwtVerifier
+
+
     @property
     def valid(self):
         """Get the result of the access token validation.
@@ -103,7 +171,7 @@ class AccessTokenValidator(object):
         return self._errorResponse
 
 
-    def validate(self, accessToken, requiredScopes=None, requiredSubject=None):
+    def validate(self, accessToken, requiredScopes=None, requiredSubject=None, request=None):
         """Validate an access token.
 
         On entry, as the first step, the following properties are reset to
@@ -137,6 +205,18 @@ class AccessTokenValidator(object):
         the required subject (in case `requiredSubject` was given), this method
         returns `True`. In other cases, this method returns `False`.
 
+        When a cache has been given to the constructor, a cached response for
+        the access token is used if available. In this case, `requiredScopes`
+        and `requiredSubject` are checked locally, and if the check fails, the
+        `introspectionResponse` property holds a copy of the cached response
+        whose `action` is `FORBIDDEN`. A cached negative result (`UNAUTHORIZED`
+        or `BAD_REQUEST`) is used to build `errorResponse` without calling the
+        API again.
+
+        Because this method modifies the properties of this validator, an
+        instance must not be shared by concurrent requests when this method
+        is used. Use `check()` to share one instance.
+
         Args:
             accessToken (str): An access token to be validated.
             requiredScopes (list of str):
@@ -152,6 +232,12 @@ class AccessTokenValidator(object):
                 whether the access token is associated with the required subject.
                 On the other hand, if `None` is given, Authlete does not conduct
                 the validation on subject.
+            request (django.http.HttpRequest):
+                The request that presented the access token. If this parameter
+                is not `None`, the DPoP proof JWT (RFC 9449) and the client
+                certificate (RFC 8705) in the request are passed to Authlete's
+                /api/auth/introspection API together, so that the binding of
+                a sender-constrained access token is checked in the same call.
 
         Returns:
             bool: The result of access token validation.
@@ -160,39 +246,579 @@ class AccessTokenValidator(object):
         # Reset properties that may have been set by the previous call.
         self.__resetValidation()
 
+        result = self.check(accessToken, requiredScopes, requiredSubject, request)
+
+        self._valid                  = result.valid
+        self._introspectionResponse  = result.introspectionResponse
+        self._introspectionException = result.introspectionException
+        self._errorResponse          = result.errorResponse
+
+        return result.valid
+
+
+    def check(self, accessToken, requiredScopes=None, requiredSubject=None, request=None):
+        """Validate an access token without modifying this validator.
+
+        This method works in the same way as `validate()` but returns the
+        outcome as an immutable `AccessTokenValidationResult` instead of
+        setting the properties of this validator. Therefore, one validator
+        instance can be shared by all the requests in a process, including
+        concurrent ones in other threads.
+
+        Args:
+            accessToken (str): An access token to be validated.
+            requiredScopes (list of str): Scopes that the access token should have.
+            requiredSubject (str): Subject that the access token should be associated with.
+            request (django.http.HttpRequest): The request that presented the access token.
+
+        Returns:
+            authlete.django.web.AccessTokenValidationResult
+        """
+
+        pop = self.__extractPopParameters(request)
+
+        result = self.__checkLocallyIfJwt(accessToken, requiredScopes, requiredSubject, pop)
+        if result is not None:
+            return result
+
+        if self.__isCacheable(pop):
+            return self.__checkWithCache(
+                accessToken, requiredScopes, requiredSubject, pop)
+
         try:
             # Call Authlete's /api/auth/introspection API.
-            self._introspectionResponse = self.__callIntrospectionApi(
-                accessToken, requiredScopes, requiredSubject)
+            response = self.__callIntrospectionApi(
+                accessToken, requiredScopes, requiredSubject, pop)
         except Exception as cause:
-            self._introspectionException = cause
-            self._errorResponse          = self.__buildErrorFromException(cause)
-            self._valid                  = False
+            return self.__buildResultFromException(cause)
+
+        return self.__buildResultFromResponse(response)
+
+
+    async def avalidate(self, accessToken, requiredScopes=None, requiredSubject=None, request=None):
+        """Validate an access token without blocking the event loop.
+
+        This is the asynchronous version of `validate()`. The outcome is set
+        to the properties of this validator in the same way.
+
+        Args:
+            accessToken (str): An access token to be validated.
+            requiredScopes (list of str): Scopes that the access token should have.
+            requiredSubject (str): Subject that the access token should be associated with.
+            request (django.http.HttpRequest): The request that presented the access token.
+
+        Returns:
+            bool: The result of access token validation.
+        """
+
+        # Reset properties that may have been set by the previous call.
+        self.__resetValidation()
+
+        result = await self.acheck(accessToken, requiredScopes, requiredSubject, request)
+
+        self._valid                  = result.valid
+        self._introspectionResponse  = result.introspectionResponse
+        self._introspectionException = result.introspectionException
+        self._errorResponse          = result.errorResponse
+
+        return result.valid
+
+
+    async def acheck(self, accessToken, requiredScopes=None, requiredSubject=None, request=None):
+        """Validate an access token without blocking the event loop or modifying this validator.
+
+        This is the asynchronous version of `check()`. When a non-blocking
+        client has been given to the constructor, /api/auth/introspection API
+        is called with it. Otherwise, `check()` is executed in a worker thread.
+
+        Args:
+            accessToken (str): An access token to be validated.
+            requiredScopes (list of str): Scopes that the access token should have.
+            requiredSubject (str): Subject that the access token should be associated with.
+            request (django.http.HttpRequest): The request that presented the access token.
+
+        Returns:
+            authlete.django.web.AccessTokenValidationResult
+        """
+
+        if self._asyncClient is None:
+            return await sync_to_async(self.check, thread_sensitive=False)(
+                accessToken, requiredScopes, requiredSubject, request)
+
+        pop = self.__extractPopParameters(request)
+
+        result = await self.__acheckLocallyIfJwt(accessToken, requiredScopes, requiredSubject, pop)
+        if result is not None:
+            return result
+
+        if not self.__isCacheable(pop):
+            try:
+                # Call Authlete's /api/auth/introspection API.
+                response = await self.__acallIntrospectionApi(
+                    accessToken, requiredScopes, requiredSubject, pop)
+            except Exception as cause:
+                return self.__buildResultFromException(cause)
+
+            return self.__buildResultFromResponse(response)
+
+        key   = IntrospectionCache.computeKey(accessToken)
+        stamp = self._cache.stamp()
+
+        # Look up the cache first. A stale entry is refreshed in a background
+        # thread, which requires the blocking API.
+        response = await self._cache.aget(key,
+            None if self._api is None else self.__buildRefresher(accessToken, pop))
+
+        if response is None:
+            try:
+                response = await self.__acallIntrospectionApi(accessToken, None, None, pop)
+            except Exception as cause:
+                return self.__buildResultFromException(cause)
+
+            if self.__isShareable(response):
+                await self._cache.aput(key, response, stamp)
+
+        return self.__buildResultFromCachedResponse(
+            response, requiredScopes, requiredSubject, pop)
+
+
+    def checkRequest(self, request, requiredScopes=None, requiredSubject=None):
+        """Validate the access token in a request.
+
+        The access token is extracted from the Authorization header (Bearer
+        or DPoP) and validated without required scopes and subject. The
+        result is attached to the request as the `accessTokenValidation`
+        attribute, and the required scopes and subject are checked locally
+        against it. Therefore, even if this method is called multiple times
+        for one request (e.g. by the middleware and nested decorators),
+        the access token is validated only once.
+
+        Args:
+            request (django.http.HttpRequest)
+            requiredScopes (list of str): Scopes that the access token should have.
+            requiredSubject (str): Subject that the access token should be associated with.
+
+        Returns:
+            authlete.django.web.AccessTokenValidationResult
+        """
+
+        result = getattr(request, self.REQUEST_ATTRIBUTE, None)
+
+        if result is None:
+            accessToken = RequestUtility.extractAccessToken(request)
+
+            if accessToken is None:
+                return self.__buildResultForMissingToken()
+
+            result = self.check(accessToken, request=request)
+            setattr(request, self.REQUEST_ATTRIBUTE, result)
+
+        return self.checkRequirements(result, requiredScopes, requiredSubject)
+
+
+    async def acheckRequest(self, request, requiredScopes=None, requiredSubject=None):
+        """Validate the access token in a request without blocking the event loop.
+
+        This is the asynchronous version of `checkRequest()`.
+
+        Args:
+            request (django.http.HttpRequest)
+            requiredScopes (list of str): Scopes that the access token should have.
+            requiredSubject (str): Subject that the access token should be associated with.
+
+        Returns:
+            authlete.django.web.AccessTokenValidationResult
+        """
+
+        result = getattr(request, self.REQUEST_ATTRIBUTE, None)
+
+        if result is None:
+            accessToken = RequestUtility.extractAccessToken(request)
+
+            if accessToken is None:
+                return self.__buildResultForMissingToken()
+
+            result = await self.acheck(accessToken, request=request)
+            setattr(request, self.REQUEST_ATTRIBUTE, result)
+
+        return self.checkRequirements(result, requiredScopes, requiredSubject)
+
+
+    def checkRequirements(self, result, requiredScopes=None, requiredSubject=None):
+        """Check required scopes and subject against a validation result.
+
+        Args:
+            result (authlete.django.web.AccessTokenValidationResult):
+                A result of validation without required scopes and subject.
+            requiredScopes (list of str): Scopes that the access token should have.
+            requiredSubject (str): Subject that the access token should be associated with.
+
+        Returns:
+            authlete.django.web.AccessTokenValidationResult :
+                The given result if it is invalid or satisfies the requirements.
+                Otherwise, a result whose error response is `403 Forbidden`.
+        """
+
+        if not result.valid:
+            return result
+
+        response = self.__checkLocally(
+            result.introspectionResponse, requiredScopes, requiredSubject)
+
+        if response is result.introspectionResponse:
+            return result
+
+        return self.__buildResultFromResponse(response)
+
+
+    def checkMany(self, tokens, maxWorkers=8):
+        """Validate many access tokens at once.
+
+        Each element of `tokens` is an access token (str) or a tuple of an
+        access token, required scopes and optionally a required subject.
+        Each distinct access token is validated only once (without required
+        scopes and subject), and the requirements of each element are checked
+        locally. Access tokens found in the cache are served without an API
+        call, and the others are validated concurrently by a pool of at most
+        `maxWorkers` threads.
+
+        Args:
+            tokens (list): Access tokens with their requirements.
+            maxWorkers (int): The maximum number of concurrent API calls.
+
+        Returns:
+            list : `AccessTokenValidationResult` instances in the same order as `tokens`.
+        """
+
+        items = [ self.__normalizeItem(token) for token in tokens ]
+
+        # Distinct access tokens, keeping the order of their first appearance.
+        results = dict.fromkeys(item[0] for item in items)
+
+        if self._cache is not None:
+            for accessToken in results:
+                response = self._cache.get(IntrospectionCache.computeKey(accessToken))
+
+                if response is not None:
+                    # No client certificate is presented.
+                    results[accessToken] = self.__buildResultFromCachedResponse(
+                        response, None, None, None)
+
+        missing = [ accessToken for accessToken, result in results.items() if result is None ]
+
+        if len(missing) == 1:
+            results[missing[0]] = self.check(missing[0])
+        elif len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(maxWorkers, len(missing))) as executor:
+                for accessToken, result in zip(missing, executor.map(self.check, missing)):
+                    results[accessToken] = result
+
+        return [
+            self.checkRequirements(results[accessToken], requiredScopes, requiredSubject)
+            for accessToken, requiredScopes, requiredSubject in items
+        ]
+
+
+    @classmethod
+    def getDefault(cls):
+        """Get the validator configured by the AUTHLETE_ACCESS_TOKEN_VALIDATOR setting.
+
+        The value of the setting is the dotted path to an `AccessTokenValidator`
+        instance or to a callable that takes no argument and returns one. The
+        validator is resolved once and shared, so it should be used through
+        the stateless methods such as `check()` and `checkRequest()`.
+
+        Returns:
+            authlete.django.web.AccessTokenValidator
+        """
+
+        if cls.__default is None:
+            validator = import_string(settings.AUTHLETE_ACCESS_TOKEN_VALIDATOR)
+
+            if not isinstance(validator, AccessTokenValidator):
+                validator = validator()
+
+            AccessTokenValidator.__default = validator
+
+        return cls.__default
+
+
+    def __normalizeItem(self, token):
+        if isinstance(token, str):
+            return (token, None, None)
+
+        if len(token) == 2:
+            return (token[0], token[1], None)
+
+        return tuple(token)
+
+
+    def __buildResultForMissingToken(self):
+        # 401 Unauthorized without an error code (RFC 6750, 3.1).
+        return AccessTokenValidationResult(False,
+            errorResponse=ResponseUtility.unauthorized('Bearer'))
+
+
+    def __extractPopParameters(self, request):
+        if request is None:
+            return None
+
+        dpop = request.headers.get('DPoP')
+
+        # Parameters for sender-constrained access tokens. 'htm' and 'htu'
+        # are used to verify the DPoP proof JWT (RFC 9449).
+        return {
+            'dpop':              dpop,
+            'htm':               None if dpop is None else request.method,
+            'htu':               None if dpop is None else request.build_absolute_uri(request.path),
+            'clientCertificate': RequestUtility.extractClientCert(request)
+        }
+
+
+    def __isCacheable(self, pop):
+        if self._cache is None:
             return False
 
+        # A DPoP proof JWT is unique per request and must be verified by
+        # Authlete every time. Responses for such requests are not cached,
+        # and cached responses are not used for them.
+        return pop is None or pop['dpop'] is None
+
+
+    def __checkLocallyIfJwt(self, accessToken, requiredScopes, requiredSubject, pop):
+        if self._jwtVerifier is None:
+            return None
+
+        # Verify the access token locally if it is a JWT signed by a known key.
+        # Sender-constrained JWT access tokens are not verified locally.
+        response = self._jwtVerifier.verify(accessToken)
+        if response is None:
+            # Fall back to the introspection API.
+            return None
+
+        return self.__buildResultFromCachedResponse(
+            response, requiredScopes, requiredSubject, pop)
+
+
+    async def __acheckLocallyIfJwt(self, accessToken, requiredScopes, requiredSubject, pop):
+        if self._jwtVerifier is None:
+            return None
+
+        # Fetching the JWK Set, if necessary, does not block the event loop.
+        response = await self._jwtVerifier.averify(accessToken)
+        if response is None:
+            # Fall back to the introspection API.
+            return None
+
+        return self.__buildResultFromCachedResponse(
+            response, requiredScopes, requiredSubject, pop)
+
+
+    def __checkWithCache(self, accessToken, requiredScopes, requiredSubject, pop):
+        key   = IntrospectionCache.computeKey(accessToken)
+        stamp = self._cache.stamp()
+
+        # Look up the cache first. A stale entry is served while it is
+        # refreshed in a background thread.
+        response = self._cache.get(key, self.__buildRefresher(accessToken, pop))
+
+        if response is None:
+            try:
+                # Call Authlete's /api/auth/introspection API without the
+                # required scopes and subject so that the response can be
+                # reused for any combination of them.
+                response = self.__callIntrospectionApi(accessToken, None, None, pop)
+            except Exception as cause:
+                return self.__buildResultFromException(cause)
+
+            # The cache keeps positive results and, for a short time,
+            # negative results such as UNAUTHORIZED. The response is dropped
+            # if the access token has been revoked during the API call.
+            if self.__isShareable(response):
+                self._cache.put(key, response, stamp)
+
+        return self.__buildResultFromCachedResponse(
+            response, requiredScopes, requiredSubject, pop)
+
+
+    def __buildRefresher(self, accessToken, pop):
+        def refresher():
+            response = self.__callIntrospectionApi(accessToken, None, None, pop)
+
+            # None keeps the current entry.
+            return response if self.__isShareable(response) else None
+
+        return refresher
+
+
+    def __isShareable(self, response):
+        # A positive result is shareable because the certificate binding is
+        # checked locally for each request.
+        if response.action == IntrospectionAction.OK:
+            return True
+
+        # A negative result for an existing access token may be caused by the
+        # presenter (e.g. a stolen certificate-bound access token presented
+        # with a wrong certificate or without one). It must not be served to
+        # the legitimate holder. An access token that does not exist (e.g. a
+        # revoked or forged one) is rejected for everyone.
+        return not response.existent
+
+
+    def __buildResultFromCachedResponse(self, response, requiredScopes, requiredSubject, pop):
+        if response.action == IntrospectionAction.OK:
+            # The cached response may have been obtained with another client
+            # certificate, so check the certificate binding (RFC 8705) locally.
+            response = self.__checkCertificateBinding(response, pop)
+
+        if response.action == IntrospectionAction.OK:
+            # Check the required scopes and subject locally.
+            response = self.__checkLocally(response, requiredScopes, requiredSubject)
+
+        return self.__buildResultFromResponse(response)
+
+
+    def __checkCertificateBinding(self, response, pop):
+        thumbprint = response.certificateThumbprint
+
+        # If the access token is not bound to a client certificate.
+        if thumbprint is None:
+            return response
+
+        # No request means that no client certificate has been presented.
+        certificate = None if pop is None else pop['clientCertificate']
+
+        if self.__computeCertificateThumbprint(certificate) == thumbprint:
+            return response
+
+        unauthorized = copy.copy(response)
+        unauthorized.action          = IntrospectionAction.UNAUTHORIZED
+        unauthorized.usable          = False
+        unauthorized.responseContent = \
+            'Bearer error="invalid_token",error_description="The access token ' + \
+            'is not bound to the client certificate."'
+
+        return unauthorized
+
+
+    def __computeCertificateThumbprint(self, certificate):
+        if certificate is None:
+            return None
+
+        # PEM or base64-encoded DER (RFC 9440). Drop the PEM armor and
+        # whitespaces if any.
+        encoded = re.sub(r'-----[^-]+-----|\s', '', certificate)
+
+        try:
+            der = base64.b64decode(encoded)
+        except Exception:
+            return None
+
+        # 'x5t#S256' defined in RFC 8705.
+        digest = hashlib.sha256(der).digest()
+
+        return base64.urlsafe_b64encode(digest).decode('ascii').rstrip('=')
+
+
+    def __buildResultFromException(self, cause):
+        return AccessTokenValidationResult(False,
+            introspectionException=cause,
+            errorResponse=self.__buildErrorFromException(cause))
+
+
+    def __buildResultFromResponse(self, response):
         # The 'action' parameter in the response from /api/auth/introspection
         # denotes the next action that the API caller should take.
-        action = self._introspectionResponse.action
-
-        if action == IntrospectionAction.OK:
+        if response.action == IntrospectionAction.OK:
             # The access token is valid.
-            self._valid = True
-            return True
-        else:
-            self._errorResponse = self.__buildErrorFromResponse(self._introspectionResponse)
-            self._valid         = False
-            return False
+            return AccessTokenValidationResult(True, introspectionResponse=response)
+
+        return AccessTokenValidationResult(False,
+            introspectionResponse=response,
+            errorResponse=self.__buildErrorFromResponse(response))
+
+
+    def __checkLocally(self, response, requiredScopes, requiredSubject):
+        if requiredScopes is not None:
+            scopes = response.scopes or []
+
+            # If the access token does not cover all the required scopes.
+            if not set(requiredScopes).issubset(scopes):
+                return self.__buildForbidden(response,
+                    'Bearer error="insufficient_scope",error_description="The access ' +
+                    'token does not cover the required scopes.",scope="{}"'.format(
+                        ' '.join(requiredScopes)))
+
+        if requiredSubject is not None:
+            # If the access token is not associated with the required subject.
+            if response.subject != requiredSubject:
+                return self.__buildForbidden(response,
+                    'Bearer error="invalid_token",error_description="The access ' +
+                    'token is not associated with the required subject."')
+
+        return response
+
+
+    def __buildForbidden(self, response, challenge):
+        # The cached response is shared, so modify a copy of it.
+        forbidden = copy.copy(response)
+        forbidden.action          = IntrospectionAction.FORBIDDEN
+        forbidden.sufficient      = False
+        forbidden.responseContent = challenge
 
+        return forbidden
 
-    def __callIntrospectionApi(self, accessToken, requiredScopes, requiredSubject):
+
+    def __callIntrospectionApi(self, accessToken, requiredScopes, requiredSubject, pop=None):
+        req = self.__buildIntrospectionRequest(accessToken, requiredScopes, requiredSubject, pop)
+
+        if self._singleFlight is None:
+            # Call /api/auth/introspection API.
+            return self.api.introspection(req)
+
+        # Calls with the same access token, scopes, subject and proof of
+        # possession are coalesced. Note that the response is shared by the
+        # coalesced callers.
+        return self._singleFlight.do(
+            self.__buildFlightKey(accessToken, requiredScopes, requiredSubject, pop),
+            lambda: self.api.introspection(req))
+
+
+    async def __acallIntrospectionApi(self, accessToken, requiredScopes, requiredSubject, pop=None):
+        req = self.__buildIntrospectionRequest(accessToken, requiredScopes, requiredSubject, pop)
+
+        if self._singleFlight is None:
+            # Call /api/auth/introspection API without blocking.
+            return await self._asyncClient.introspection(req)
+
+        return await self._singleFlight.ado(
+            self.__buildFlightKey(accessToken, requiredScopes, requiredSubject, pop),
+            lambda: self._asyncClient.introspection(req))
+
+
+    def __buildFlightKey(self, accessToken, requiredScopes, requiredSubject, pop):
+        return (
+            IntrospectionCache.computeKey(accessToken),
+            None if requiredScopes is None else tuple(requiredScopes),
+            requiredSubject,
+            None if pop is None else tuple(sorted(pop.items()))
+        )
+
+
+    def __buildIntrospectionRequest(self, accessToken, requiredScopes, requiredSubject, pop):
         # Prepare a request to /api/auth/introspection API.
         req = IntrospectionRequest()
         req.token   = accessToken
         req.scopes  = requiredScopes
         req.subject = requiredSubject
 
-        # Call /api/auth/introspection API.
-        return self.api.introspection(req)
+        if pop is not None:
+            req.dpop              = pop['dpop']
+            req.htm               = pop['htm']
+            req.htu               = pop['htu']
+            req.clientCertificate = pop['clientCertificate']
+
+        return req
 
 
     def __buildErrorFromException(self, cause):
@@ -222,5 +848,10 @@ class AccessTokenValidator(object):
         # the WWW-Authenticate header.
         challenge = response.responseContent
 
+        # A DPoP nonce (RFC 9449) that the client should use in its next proof.
+        headers = None
+        if response.dpopNonce is not None:
+            headers = { 'DPoP-Nonce': response.dpopNonce }
+
         # Build a response that complies with RFC 6749.
-        return ResponseUtility.wwwAuthenticate(statusCode, challenge)
+        return ResponseUtility.wwwAuthenticate(statusCode, challenge, None, headers)
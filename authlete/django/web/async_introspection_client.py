@@ -0,0 +1,130 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import json
+from authlete.api.authlete_api_exception  import AuthleteApiException
+from authlete.conf.authlete_configuration import AuthleteConfiguration
+from authlete.dto.introspection_response  import IntrospectionResponse
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncIntrospectionClient(object):
+    """Non-blocking client of Authlete's /api/auth/introspection API.
+
+    This class is used by `AccessTokenValidator.acheck()` and
+    `AccessTokenValidator.avalidate()` so that the introspection call does not
+    block the event loop. The HTTP connections are pooled by an `httpx`
+    client, so `httpx` must be installed to use this class.
+
+    The behavior mirrors `authlete.api.AuthleteApiImpl`: an exception is
+    raised as `AuthleteApiException` when the API call fails or when the API
+    returns a status code other than 2XX.
+    """
+
+
+    def __init__(self, cnf, timeout=None):
+        """Constructor
+
+        Args:
+            cnf (authlete.conf.AuthleteConfiguration)
+            timeout (float) : Timeout in seconds. None means no timeout.
+        """
+
+        if httpx is None:
+            raise RuntimeError("'httpx' is required to use AsyncIntrospectionClient.")
+
+        if isinstance(cnf, AuthleteConfiguration) == False:
+            raise RuntimeError("'cnf' must be an instance of AuthleteConfiguration.")
+
+        if cnf.baseUrl is None:
+            raise RuntimeError("'baseUrl' of the configuration is None.")
+
+        baseUrl = cnf.baseUrl.rstrip('/')
+
+        # When the version of Authlete APIs is 3 (or higher).
+        if cnf.apiVersion == "V3":
+            if cnf.serviceAccessToken is None:
+                raise RuntimeError("'serviceAccessToken' of the configuration is None.")
+
+            self._url     = "{}/api/{}/auth/introspection".format(baseUrl, cnf.serviceApiKey)
+            self._auth    = None
+            self._headers = { "Authorization": "Bearer {}".format(cnf.serviceAccessToken) }
+        else:
+            self._url     = "{}/api/auth/introspection".format(baseUrl)
+            self._auth    = (cnf.serviceApiKey or '', cnf.serviceApiSecret or '')
+            self._headers = {}
+
+        self._headers.update({
+            "Accept":       "application/json",
+            "Content-Type": "application/json"
+        })
+
+        self._client = httpx.AsyncClient(timeout=timeout)
+
+
+    async def introspection(self, request):
+        """Call Authlete's /api/auth/introspection API.
+
+        Args:
+            request (authlete.dto.IntrospectionRequest)
+
+        Returns:
+            authlete.dto.IntrospectionResponse
+
+        Raises:
+            authlete.api.AuthleteApiException
+        """
+
+        data = request.to_json()
+
+        try:
+            response = await self._client.post(
+                self._url, content=data, headers=self._headers, auth=self._auth)
+        except Exception as cause:
+            raise AuthleteApiException(
+                self._url, None, data, "API call to /auth/introspection failed.", cause)
+
+        # If the HTTP status code is not 2XX.
+        if response.status_code < 200 or 300 <= response.status_code:
+            message = self.__extractResultMessage(response.text)
+            if message is None:
+                message = "/auth/introspection API returned {}".format(response.status_code)
+            raise AuthleteApiException(self._url, None, data, message, None, response)
+
+        return IntrospectionResponse.from_json(response.text)
+
+
+    async def aclose(self):
+        """Close the underlying HTTP connections.
+        """
+
+        await self._client.aclose()
+
+
+    def __extractResultMessage(self, body):
+        if body is None:
+            return None
+
+        # The response body may be JSON which contains 'resultMessage'.
+        try:
+            return json.loads(body)['resultMessage']
+        except Exception:
+            return None
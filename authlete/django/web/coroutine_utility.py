@@ -0,0 +1,47 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import asyncio
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:
+    # asgiref < 3.6 (e.g. with Django 4.1 and older), which checks coroutine
+    # functions with asyncio.iscoroutinefunction().
+    iscoroutinefunction = asyncio.iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+
+class CoroutineUtility(object):
+    """Utility to detect and mark coroutine functions as Django does.
+
+    The functions of `asgiref.sync` are used when they are available. With
+    asgiref older than 3.6, the checks of `asyncio` are used instead.
+    """
+
+
+    @classmethod
+    def isCoroutineFunction(cls, func):
+        return iscoroutinefunction(func)
+
+
+    @classmethod
+    def markCoroutineFunction(cls, func):
+        return markcoroutinefunction(func)
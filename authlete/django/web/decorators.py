@@ -0,0 +1,75 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+from functools                                  import wraps
+from authlete.django.web.access_token_validator import AccessTokenValidator
+from authlete.django.web.coroutine_utility      import CoroutineUtility
+
+
+def require_token(scopes=None, subject=None, validator=None):
+    """Decorator for views that require a valid access token.
+
+    The access token in the Authorization header of the request is validated
+    and the result is attached to the request as the `accessTokenValidation`
+    attribute. If the access token is missing or invalid, or if it does not
+    cover `scopes` or is not associated with `subject`, the error response
+    that complies with RFC 6750 is returned without calling the view.
+
+    The access token is validated only once per request. When
+    `AccessTokenMiddleware` or another `require_token` has already validated
+    it, the attached result is reused and only `scopes` and `subject` are
+    checked locally.
+
+    Both synchronous and asynchronous views are supported.
+
+    Args:
+        scopes (list of str): Scopes that the access token should have.
+        subject (str): Subject that the access token should be associated with.
+        validator (authlete.django.web.AccessTokenValidator):
+            The validator to use. If omitted, `AccessTokenValidator.getDefault()`
+            is used.
+    """
+
+    def getValidator():
+        return validator if validator is not None else AccessTokenValidator.getDefault()
+
+    def decorator(view):
+        if CoroutineUtility.isCoroutineFunction(view):
+            @wraps(view)
+            async def asyncWrapper(request, *args, **kwargs):
+                result = await getValidator().acheckRequest(request, scopes, subject)
+
+                if not result.valid:
+                    return result.errorResponse
+
+                return await view(request, *args, **kwargs)
+
+            return asyncWrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            result = getValidator().checkRequest(request, scopes, subject)
+
+            if not result.valid:
+                return result.errorResponse
+
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,231 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+from asgiref.sync                        import sync_to_async
+from authlete.dto.introspection_action   import IntrospectionAction
+from authlete.dto.introspection_response import IntrospectionResponse
+
+try:
+    import jwt
+except ImportError:
+    jwt = None
+
+
+class JwtAccessTokenVerifier(object):
+    """Local verifier of JWT access tokens issued by the Authlete service.
+
+    When the service issues access tokens in the JWT format (RFC 9068), their
+    signatures and claims can be verified without calling Authlete's
+    /api/auth/introspection API. The public keys are obtained from
+    `authlete.django.cache.ServiceJwksCache`.
+
+    `verify()` returns None when the access token cannot be verified locally,
+    for example, when the access token is not a JWT (opaque), when its `typ`
+    header is not `at+jwt` or when the key ID is not found in the JWK Set. In
+    such cases, the caller should fall back to the introspection API.
+
+    Note that revocation of a JWT access token cannot be detected locally.
+    The token remains valid until its `exp` claim. Sender-constrained access
+    tokens (those having the `cnf` claim) are not verified locally.
+
+    `PyJWT` with the `crypto` extra must be installed to use this class.
+    """
+
+
+    # Asymmetric algorithms accepted for signatures of access tokens.
+    ALGORITHMS = [
+        'RS256', 'RS384', 'RS512', 'PS256', 'PS384', 'PS512',
+        'ES256', 'ES384', 'ES512', 'EdDSA'
+    ]
+
+
+    def __init__(self, jwksCache, issuer, audience=None, leeway=0):
+        """Constructor
+
+        Args:
+            jwksCache (authlete.django.cache.ServiceJwksCache)
+            issuer (str) : The expected value of the `iss` claim.
+            audience (str or list of str) :
+                The expected value of the `aud` claim. None not to check it.
+            leeway (float) : Leeway in seconds for `exp` and `nbf`.
+        """
+
+        if jwt is None:
+            raise RuntimeError("'PyJWT' is required to use JwtAccessTokenVerifier.")
+
+        self._jwksCache = jwksCache
+        self._issuer    = issuer
+        self._audience  = audience
+        self._leeway    = leeway
+
+
+    @property
+    def jwksCache(self):
+        return self._jwksCache
+
+
+    @property
+    def issuer(self):
+        return self._issuer
+
+
+    @property
+    def audience(self):
+        return self._audience
+
+
+    def verify(self, accessToken):
+        """Verify an access token locally.
+
+        Args:
+            accessToken (str)
+
+        Returns:
+            authlete.dto.IntrospectionResponse :
+                A response built from the claims of the access token. Its
+                `action` is `OK` when the access token is valid, and
+                `UNAUTHORIZED` when the signature or a claim is invalid.
+                None if the access token cannot be verified locally.
+        """
+
+        try:
+            header = jwt.get_unverified_header(accessToken)
+        except jwt.InvalidTokenError:
+            # Not a JWT. Probably an opaque access token.
+            return None
+
+        if header.get('alg') not in self.ALGORITHMS or header.get('kid') is None:
+            return None
+
+        # Other JWTs signed by the same key (e.g. ID tokens) must not be
+        # accepted as access tokens. RFC 9068 requires 'typ'.
+        typ = header.get('typ')
+        if not isinstance(typ, str) or typ.lower() not in ('at+jwt', 'application/at+jwt'):
+            return None
+
+        try:
+            key = self._jwksCache.getKey(header['kid'])
+        except Exception:
+            # The JWK Set is not available now.
+            return None
+
+        if key is None:
+            # Unknown key ID.
+            return None
+
+        # The algorithm is determined by the key, not by the header which
+        # anyone can write.
+        if header['alg'] != key.algorithm_name:
+            return self.__buildUnauthorized(
+                'The algorithm does not match the key.')
+
+        try:
+            claims = jwt.decode(accessToken, key.key,
+                algorithms=[ key.algorithm_name ],
+                issuer=self._issuer,
+                audience=self._audience,
+                leeway=self._leeway,
+                options={
+                    'require':    [ 'exp', 'iss' ],
+                    'verify_aud': self._audience is not None
+                })
+        except (jwt.PyJWTError, TypeError, ValueError) as cause:
+            return self.__buildUnauthorized(str(cause))
+
+        # The binding of a sender-constrained access token (DPoP or mutual
+        # TLS) is left to the introspection API.
+        if 'cnf' in claims:
+            return None
+
+        try:
+            return self.__buildOk(claims)
+        except ValueError as cause:
+            return self.__buildUnauthorized(str(cause))
+
+
+    async def averify(self, accessToken):
+        """Verify an access token locally without blocking the event loop.
+
+        This is the asynchronous version of `verify()`. When the JWK Set needs
+        to be fetched, `verify()` is executed in a worker thread because the
+        fetch is a blocking API call.
+
+        Args:
+            accessToken (str)
+
+        Returns:
+            authlete.dto.IntrospectionResponse : The same as `verify()`.
+        """
+
+        if self.__isFetchNeeded(accessToken):
+            return await sync_to_async(self.verify, thread_sensitive=False)(accessToken)
+
+        return self.verify(accessToken)
+
+
+    def __isFetchNeeded(self, accessToken):
+        try:
+            header = jwt.get_unverified_header(accessToken)
+        except jwt.InvalidTokenError:
+            return False
+
+        return self._jwksCache.isFetchNeeded(header.get('kid'))
+
+
+    def __buildOk(self, claims):
+        response = IntrospectionResponse()
+        response.action     = IntrospectionAction.OK
+        response.existent   = True
+        response.usable     = True
+        response.sufficient = True
+        response.subject    = claims.get('sub')
+        response.scopes     = self.__extractScopes(claims)
+        response.expiresAt  = int(claims['exp']) * 1000
+
+        clientId = claims.get('client_id')
+        if isinstance(clientId, str) and clientId.isdigit():
+            response.clientId = int(clientId)
+        elif clientId is not None:
+            response.clientIdAlias = str(clientId)
+
+        return response
+
+
+    def __extractScopes(self, claims):
+        # RFC 9068 defines 'scope' as a space-separated string.
+        scope = claims.get('scope')
+
+        if scope is None:
+            return None
+
+        if isinstance(scope, str):
+            return scope.split()
+
+        if isinstance(scope, list) and all(isinstance(s, str) for s in scope):
+            return scope
+
+        raise ValueError('The scope claim is malformed.')
+
+
+    def __buildUnauthorized(self, description):
+        response = IntrospectionResponse()
+        response.action          = IntrospectionAction.UNAUTHORIZED
+        response.responseContent = \
+            'Bearer error="invalid_token",error_description="{}"'.format(
+                description.replace('"', "'"))
+
+        return response
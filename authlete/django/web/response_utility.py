@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019-2024 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -25,6 +25,14 @@ class ResponseUtility(object):
         return cls.__json(200, content, headers)
 
 
+    @classmethod
+    def okCacheableJson(cls, content, etag, maxAge, headers=None):
+        # 200 OK, application/json;charset=UTF-8, with an ETag header.
+        # Shared caches may store the response for maxAge seconds.
+        return cls.__response(200, content, cls.__etag(etag, headers),
+                              'application/json', maxAge=maxAge)
+
+
     @classmethod
     def okJavaScript(cls, content, headers=None):
         # 200 OK, application/javascript;charset=UTF-8
@@ -73,6 +81,12 @@ class ResponseUtility(object):
         return cls.__common(HttpResponse(status=204), headers)
 
 
+    @classmethod
+    def notModified(cls, etag, maxAge, headers=None):
+        # 304 Not Modified with an ETag header
+        return cls.__common(HttpResponse(status=304), cls.__etag(etag, headers), maxAge)
+
+
     @classmethod
     def location(cls, location, headers=None):
         # 302 Found with a Location header.
@@ -131,18 +145,21 @@ class ResponseUtility(object):
 
 
     @classmethod
-    def __response(cls, status, content, headers, content_type, charset='UTF-8'):
+    def __response(cls, status, content, headers, content_type, charset='UTF-8', maxAge=None):
         response = HttpResponse(
             status=status, content=content,
             content_type=content_type, charset=charset)
 
-        return cls.__common(response, headers)
+        return cls.__common(response, headers, maxAge)
 
 
     @classmethod
-    def __common(cls, response, headers):
-        response['Cache-Control'] = 'no-store'
-        response['Pragma']        = 'no-cache'
+    def __common(cls, response, headers, maxAge=None):
+        if maxAge is None:
+            response['Cache-Control'] = 'no-store'
+            response['Pragma']        = 'no-cache'
+        else:
+            response['Cache-Control'] = 'public, max-age={}'.format(int(maxAge))
 
         if headers is not None:
             for name, value in headers.items():
@@ -151,6 +168,16 @@ class ResponseUtility(object):
         return response
 
 
+    @classmethod
+    def __etag(cls, etag, headers):
+        merged = { 'ETag': etag }
+
+        if headers is not None:
+            merged.update(headers)
+
+        return merged
+
+
     @classmethod
     def __json(cls, status, content, headers):
         return cls.__response(status, content, headers, 'application/json')
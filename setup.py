@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2019-2024 Authlete, Inc.
+# Copyright (C) 2019-2026 Authlete, Inc.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -33,6 +33,8 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/authlete/authlete-python-django",
     packages=[
+        "authlete.django",
+        "authlete.django.cache",
         "authlete.django.handler",
         "authlete.django.handler.spi",
         "authlete.django.web",
@@ -45,5 +47,10 @@ setuptools.setup(
     ],
     install_requires=[
         "authlete>=1.3.0",
-    ]
+    ],
+    extras_require={
+        "async":  [ "httpx" ],
+        "brotli": [ "Brotli" ],
+        "jwt":    [ "PyJWT[crypto]" ],
+    }
 )
@@ -0,0 +1,162 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import asyncio
+import shutil
+import tempfile
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.core.cache                                import caches
+from django.core.cache.backends.locmem                import LocMemCache
+from django.core.exceptions                           import SynchronousOnlyOperation
+from django.test                                      import override_settings
+from django.utils.asyncio                             import async_unsafe
+from authlete.django.cache.django_introspection_cache import DjangoIntrospectionCache
+from authlete.dto.introspection_action                import IntrospectionAction
+from authlete.dto.introspection_response              import IntrospectionResponse
+
+
+class AsyncUnsafeCache(LocMemCache):
+    # Like the database backend, the synchronous methods must not be called
+    # from an event loop.
+    get      = async_unsafe(LocMemCache.get)
+    get_many = async_unsafe(LocMemCache.get_many)
+    set      = async_unsafe(LocMemCache.set)
+    delete   = async_unsafe(LocMemCache.delete)
+
+
+def buildResponse(expiresIn=3600):
+    response = IntrospectionResponse()
+    response.action    = IntrospectionAction.OK
+    response.subject   = 'user'
+    response.scopes    = ['read', 'write']
+    response.expiresAt = int((time.time() + expiresIn) * 1000)
+
+    return response
+
+
+class TestDjangoIntrospectionCache(unittest.TestCase):
+    def setUp(self):
+        self.cacheDir = tempfile.mkdtemp()
+        self.settings = override_settings(CACHES={
+            'locmem': {
+                'BACKEND':  'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'authlete-test'
+            },
+            'file': {
+                'BACKEND':  'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': self.cacheDir
+            },
+            'unsafe': {
+                'BACKEND':  __name__ + '.AsyncUnsafeCache',
+                'LOCATION': 'authlete-test-unsafe'
+            }
+        })
+        self.settings.enable()
+
+
+    def tearDown(self):
+        self.settings.disable()
+        shutil.rmtree(self.cacheDir, ignore_errors=True)
+
+
+    def check(self, alias):
+        cache    = DjangoIntrospectionCache(alias)
+        key      = DjangoIntrospectionCache.computeKey('token')
+        response = buildResponse()
+
+        cache.put(key, response)
+        cached = cache.get(key)
+
+        self.assertEqual(cached.action,    IntrospectionAction.OK)
+        self.assertEqual(cached.subject,   'user')
+        self.assertEqual(cached.scopes,    ['read', 'write'])
+        self.assertEqual(cached.expiresAt, response.expiresAt)
+        self.assertFalse(cached.usable)
+
+        # Another instance sharing the backend sees the entry.
+        self.assertIsNotNone(DjangoIntrospectionCache(alias).get(key))
+
+        cache.remove(key)
+        self.assertIsNone(cache.get(key))
+
+
+    def test_001(self):
+        self.check('locmem')
+
+
+    def test_002(self):
+        self.check('file')
+
+
+    def test_003(self):
+        # Default values are omitted from the serialized entry.
+        cache = DjangoIntrospectionCache('locmem')
+        cache.put('key', buildResponse())
+
+        payload = caches['locmem'].get(DjangoIntrospectionCache.KEY_PREFIX + 'key')[3]
+
+        self.assertNotIn('null', payload)
+        self.assertNotIn('usable', payload)
+
+
+    def test_004(self):
+        # Expired access tokens are not stored.
+        cache = DjangoIntrospectionCache('locmem')
+        cache.put('expired', buildResponse(-1))
+
+        self.assertIsNone(cache.get('expired'))
+
+
+    def test_005(self):
+        # clear() hides the entries written before it.
+        cache = DjangoIntrospectionCache('locmem')
+        cache.put('key', buildResponse())
+        cache.clear()
+
+        self.assertIsNone(cache.get('key'))
+
+        cache.put('key', buildResponse())
+        cache.clear()
+        cache.put('other', buildResponse())
+
+        self.assertIsNone(cache.get('key'))
+        self.assertIsNotNone(cache.get('other'))
+
+
+    def test_006(self):
+        # aget() and aput() work on an event loop with a backend whose
+        # synchronous methods must not be called there.
+        cache = DjangoIntrospectionCache('unsafe')
+
+        async def get():
+            return cache.get('key')
+
+        with self.assertRaises(SynchronousOnlyOperation):
+            asyncio.run(get())
+
+        async def main():
+            await cache.aput('key', buildResponse())
+            return await cache.aget('key')
+
+        self.assertEqual(asyncio.run(main()).subject, 'user')
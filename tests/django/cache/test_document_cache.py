@@ -0,0 +1,107 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import threading
+import time
+import unittest
+from authlete.django.cache import CachedDocument, DocumentCache
+
+
+class Loader(object):
+    def __init__(self, delay=0):
+        self.calls = 0
+        self.delay = delay
+        self.lock  = threading.Lock()
+
+
+    def __call__(self):
+        with self.lock:
+            self.calls += 1
+            calls = self.calls
+
+        time.sleep(self.delay)
+
+        return CachedDocument('{{"version":{}}}'.format(calls))
+
+
+class TestDocumentCache(unittest.TestCase):
+    def test_001(self):
+        # A document is loaded once and kept as bytes.
+        cache  = DocumentCache()
+        loader = Loader()
+
+        self.assertEqual(cache.get('key', loader).content, b'{"version":1}')
+        self.assertEqual(cache.get('key', loader).content, b'{"version":1}')
+        self.assertEqual(loader.calls, 1)
+
+
+    def test_002(self):
+        # Concurrent loads on a cache miss are coalesced.
+        cache   = DocumentCache()
+        loader  = Loader(delay=0.1)
+        threads = [ threading.Thread(target=cache.get, args=('key', loader)) for i in range(5) ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(loader.calls, 1)
+
+
+    def test_003(self):
+        # A stale document is served while it is reloaded in the background.
+        cache  = DocumentCache(ttl=0.05, staleTtl=10)
+        loader = Loader()
+
+        cache.get('key', loader)
+        time.sleep(0.1)
+
+        self.assertEqual(cache.get('key', loader).content, b'{"version":1}')
+
+        time.sleep(0.1)
+
+        self.assertEqual(cache.get('key', loader).content, b'{"version":2}')
+        self.assertEqual(loader.calls, 2)
+
+
+    def test_004(self):
+        # Nothing is cached when the loader returns None.
+        cache = DocumentCache()
+
+        self.assertIsNone(cache.get('key', lambda: None))
+        self.assertEqual(cache.get('key', Loader()).content, b'{"version":1}')
+
+
+    def test_005(self):
+        # The least recently used document is evicted and statistics are kept.
+        cache = DocumentCache(maxSize=2)
+
+        cache.get('a', Loader())
+        cache.get('b', Loader())
+        cache.get('a', Loader())
+        cache.get('c', Loader())
+
+        self.assertEqual(cache.size, 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        cache.get('b', Loader())
+
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
@@ -0,0 +1,78 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from authlete.django.cache   import DocumentCache, DocumentRefresher
+from authlete.django.handler import JwksRequestHandler
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.calls = 0
+        self.jwks  = '{"keys":[{"kid":"1"}]}'
+
+
+    def getServiceJwks(self, pretty, includePrivateKeys):
+        self.calls += 1
+
+        return self.jwks
+
+
+class TestDocumentRefresher(unittest.TestCase):
+    def test_001(self):
+        # The cached document is swapped and changes are notified.
+        api       = FakeApi()
+        cache     = DocumentCache()
+        handler   = JwksRequestHandler(api, cache)
+        changes   = []
+        refresher = DocumentRefresher([ handler ], onChange=lambda t, d: changes.append(d))
+
+        refresher.refreshNow()
+        refresher.refreshNow()
+
+        self.assertEqual(changes, [])
+
+        api.jwks = '{"keys":[{"kid":"2"}]}'
+        refresher.refreshNow()
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(handler.handle(None).content, b'{"keys":[{"kid":"2"}]}')
+        self.assertEqual(api.calls, 3)
+
+
+    def test_002(self):
+        # The thread refreshes documents periodically until it is stopped.
+        api       = FakeApi()
+        refresher = DocumentRefresher([ JwksRequestHandler(api, DocumentCache()) ], interval=0.02)
+
+        refresher.warmUp()
+        time.sleep(0.15)
+        refresher.stop(1)
+
+        calls = api.calls
+        time.sleep(0.05)
+
+        self.assertFalse(refresher.running)
+        self.assertGreater(calls, 2)
+        self.assertEqual(api.calls, calls)
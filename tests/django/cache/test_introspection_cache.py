@@ -0,0 +1,219 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import asyncio
+import threading
+import time
+import unittest
+from authlete.django.cache.introspection_cache import IntrospectionCache
+from authlete.django.cache.signals             import tokenRevoked
+from authlete.dto.introspection_action         import IntrospectionAction
+from authlete.dto.introspection_response       import IntrospectionResponse
+
+
+def buildResponse(expiresIn=3600):
+    response = IntrospectionResponse()
+    response.action    = IntrospectionAction.OK
+    response.subject   = 'user'
+    response.scopes    = ['read', 'write']
+    response.expiresAt = int((time.time() + expiresIn) * 1000)
+
+    return response
+
+
+class TestIntrospectionCache(unittest.TestCase):
+    def test_001(self):
+        # The key is the hex-encoded SHA-256 hash of the token.
+        key = IntrospectionCache.computeKey('token')
+
+        self.assertEqual(len(key), 64)
+        self.assertNotIn('token', key)
+
+
+    def test_002(self):
+        cache    = IntrospectionCache()
+        response = buildResponse()
+        cache.put('key', response)
+
+        self.assertIs(cache.get('key'), response)
+        self.assertIsNone(cache.get('other'))
+
+
+    def test_003(self):
+        # Expired access tokens are not cached.
+        cache = IntrospectionCache()
+        cache.put('key', buildResponse(-1))
+
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.size, 0)
+
+
+    def test_004(self):
+        # maxTtl caps the lifetime of an entry.
+        cache = IntrospectionCache(maxTtl=0)
+        cache.put('key', buildResponse())
+
+        self.assertIsNone(cache.get('key'))
+
+
+    def test_005(self):
+        # The least recently used entry is evicted.
+        cache = IntrospectionCache(maxSize=2)
+        cache.put('a', buildResponse())
+        cache.put('b', buildResponse())
+        cache.get('a')
+        cache.put('c', buildResponse())
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+
+    def test_006(self):
+        cache = IntrospectionCache()
+        cache.put('a', buildResponse())
+        cache.put('b', buildResponse())
+        cache.remove('a')
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.size, 1)
+
+        cache.clear()
+
+        self.assertEqual(cache.size, 0)
+
+
+    def test_007(self):
+        # Negative results are cached for negativeTtl seconds.
+        response = buildResponse()
+        response.action = IntrospectionAction.UNAUTHORIZED
+
+        cache = IntrospectionCache(negativeTtl=10)
+        cache.put('key', response)
+        self.assertIs(cache.get('key'), response)
+
+        cache = IntrospectionCache(negativeTtl=0)
+        cache.put('key', response)
+        self.assertIsNone(cache.get('key'))
+
+
+    def test_008(self):
+        # INTERNAL_SERVER_ERROR is never cached.
+        response = buildResponse()
+        response.action = IntrospectionAction.INTERNAL_SERVER_ERROR
+
+        cache = IntrospectionCache()
+        cache.put('key', response)
+
+        self.assertIsNone(cache.get('key'))
+
+
+    def test_009(self):
+        # A stale entry is served while it is refreshed in the background.
+        cache     = IntrospectionCache(maxTtl=0, staleTtl=60)
+        stale     = buildResponse()
+        fresh     = buildResponse()
+        refreshed = threading.Event()
+
+        def refresher():
+            refreshed.set()
+            return fresh
+
+        cache.put('key', stale)
+
+        # Without a refresher, a stale entry is not served.
+        self.assertIsNone(cache.get('key'))
+        self.assertIs(cache.get('key', refresher), stale)
+        self.assertTrue(refreshed.wait(5))
+
+
+    def test_010(self):
+        # A stale entry is never served after the access token expires.
+        cache = IntrospectionCache(maxTtl=0, staleTtl=60)
+        cache.put('key', buildResponse(-1))
+
+        self.assertIsNone(cache.get('key', buildResponse))
+
+
+    def test_011(self):
+        # The entry is removed when the token is revoked.
+        cache = IntrospectionCache()
+        key   = IntrospectionCache.computeKey('token')
+        cache.put(key, buildResponse())
+
+        tokenRevoked.send(sender=None, tokenHash=key)
+
+        self.assertIsNone(cache.get(key))
+
+
+    def test_012(self):
+        # All the entries are cleared when a refresh token is revoked.
+        cache = IntrospectionCache()
+        cache.put('key', buildResponse())
+
+        tokenRevoked.send(sender=None, tokenHash='other', tokenTypeHint='refresh_token')
+
+        self.assertIsNone(cache.get('key'))
+
+
+    def test_013(self):
+        # A refresh in flight does not put back a removed entry.
+        cache   = IntrospectionCache(maxTtl=0, staleTtl=60)
+        started = threading.Event()
+        release = threading.Event()
+
+        def refresher():
+            started.set()
+            release.wait(5)
+            return buildResponse()
+
+        cache.put('key', buildResponse())
+        cache.get('key', refresher)
+        self.assertTrue(started.wait(5))
+
+        cache.remove('key')
+        release.set()
+
+        # Give the refresh a chance to complete.
+        time.sleep(0.2)
+
+        self.assertEqual(cache.size, 0)
+
+
+    def test_014(self):
+        # A response fetched before a removal is not put.
+        cache = IntrospectionCache()
+        stamp = cache.stamp()
+
+        cache.remove('key')
+        cache.put('key', buildResponse(), stamp)
+        cache.put('other', buildResponse(), stamp)
+
+        self.assertIsNone(cache.get('key'))
+        self.assertIsNotNone(cache.get('other'))
+
+        # Stamps taken after the removal are not affected.
+        cache.put('key', buildResponse(), cache.stamp())
+
+        self.assertIsNotNone(cache.get('key'))
+
+        # No response fetched before clear() is put.
+        stamp = cache.stamp()
+        cache.clear()
+        asyncio.run(cache.aput('other', buildResponse(), stamp))
+
+        self.assertIsNone(cache.get('other'))
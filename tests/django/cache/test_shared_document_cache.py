@@ -0,0 +1,92 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import os
+import tempfile
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from authlete.django.cache   import CachedDocument, SharedDocumentCache
+from authlete.django.handler import ConfigurationRequestHandler
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.calls = 0
+
+
+    def getServiceConfiguration(self, request):
+        self.calls += 1
+
+        return '{"issuer":"https://example.com"}'
+
+
+class TestSharedDocumentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path      = os.path.join(self.directory.name, 'snapshot')
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def test_001(self):
+        # Readers use the documents written by the writer.
+        writerApi = FakeApi()
+        readerApi = FakeApi()
+        writer    = SharedDocumentCache(self.path, writer=True)
+        reader    = SharedDocumentCache(self.path, checkInterval=0)
+
+        ConfigurationRequestHandler(writerApi, writer, tenant='service').reload()
+
+        response = ConfigurationRequestHandler(readerApi, reader, tenant='service').handle(None)
+
+        self.assertEqual(response.content, b'{"issuer":"https://example.com"}')
+        self.assertEqual(writerApi.calls, 1)
+        self.assertEqual(readerApi.calls, 0)
+
+
+    def test_002(self):
+        # A new generation replaces the documents without copying them.
+        writer = SharedDocumentCache(self.path, writer=True)
+        reader = SharedDocumentCache(self.path, checkInterval=0)
+
+        writer.put('key', CachedDocument('{"version":1}'))
+        first = reader.get('key', lambda: None)
+
+        writer.put('key', CachedDocument('{"version":2}'))
+        second = reader.get('key', lambda: None)
+
+        self.assertEqual(writer.snapshot.generation, 2)
+        self.assertEqual(bytes(first.content), b'{"version":1}')
+        self.assertEqual(bytes(second.content), b'{"version":2}')
+        self.assertIsInstance(second.content, memoryview)
+        self.assertEqual(second.etag, CachedDocument('{"version":2}').etag)
+
+
+    def test_003(self):
+        # Documents of handlers without a tenant are not shared.
+        writer = SharedDocumentCache(self.path, writer=True)
+
+        ConfigurationRequestHandler(FakeApi(), writer).reload()
+
+        self.assertEqual(writer.snapshot.read(), {})
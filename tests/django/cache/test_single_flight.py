@@ -0,0 +1,137 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+import asyncio
+import threading
+import unittest
+from authlete.django.cache.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.singleFlight = SingleFlight()
+        self.started      = threading.Event()
+        self.release      = threading.Event()
+        self.calls        = 0
+
+
+    def slow(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return 'result'
+
+
+    def runConcurrently(self, count, func):
+        results = []
+
+        def target():
+            try:
+                results.append(self.singleFlight.do('key', func))
+            except Exception as cause:
+                results.append(cause)
+
+        leader = threading.Thread(target=target)
+        leader.start()
+        self.started.wait(5)
+
+        followers = [ threading.Thread(target=target) for _ in range(count - 1) ]
+        for thread in followers:
+            thread.start()
+
+        # Give the followers a chance to start waiting.
+        for thread in followers:
+            thread.join(0.05)
+
+        self.release.set()
+
+        for thread in [ leader ] + followers:
+            thread.join(5)
+
+        return results
+
+
+    def test_001(self):
+        # Concurrent calls with the same key execute the function once.
+        results = self.runConcurrently(5, self.slow)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [ 'result' ] * 5)
+
+
+    def test_002(self):
+        # The exception is propagated to all the callers.
+        def failing():
+            self.slow()
+            raise ValueError('failed')
+
+        results = self.runConcurrently(3, failing)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+
+    def test_003(self):
+        # Sequential calls are not coalesced.
+        self.release.set()
+        self.singleFlight.do('key', self.slow)
+        self.singleFlight.do('key', self.slow)
+
+        self.assertEqual(self.calls, 2)
+
+
+    def test_004(self):
+        # Concurrent coroutines with the same key await the function once.
+        async def slow():
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            return 'result'
+
+        async def main():
+            return await asyncio.gather(
+                *[ self.singleFlight.ado('key', slow) for _ in range(5) ])
+
+        results = asyncio.run(main())
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [ 'result' ] * 5)
+
+
+    def test_005(self):
+        # When the leader is cancelled, a waiting coroutine takes over.
+        async def slow():
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            return 'result'
+
+        async def main():
+            leader = asyncio.ensure_future(self.singleFlight.ado('key', slow))
+            await asyncio.sleep(0.01)
+
+            followers = [ asyncio.ensure_future(self.singleFlight.ado('key', slow)) for _ in range(3) ]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+
+            return await asyncio.gather(*followers), leader.cancelled()
+
+        results, cancelled = asyncio.run(main())
+
+        self.assertTrue(cancelled)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(results, [ 'result' ] * 3)
@@ -0,0 +1,79 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import time
+import unittest
+from authlete.django.cache.signals          import userClaimsChanged
+from authlete.django.cache.user_claim_cache import UserClaimCache
+
+
+class TestUserClaimCache(unittest.TestCase):
+    def test_001(self):
+        # The loader is called once. None is cached too.
+        cache = UserClaimCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return None
+
+        self.assertIsNone(cache.get('1', 'name', 'ja', loader))
+        self.assertIsNone(cache.get('1', 'name', 'ja', loader))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+
+    def test_002(self):
+        # Entries expire after ttl.
+        cache = UserClaimCache(ttl=0.05)
+        cache.putAll('1', { ('name', None): 'Taro' })
+
+        self.assertEqual(cache.getAll('1', [ ('name', None) ]), { ('name', None): 'Taro' })
+        time.sleep(0.1)
+        self.assertEqual(cache.getAll('1', [ ('name', None) ]), {})
+
+
+    def test_003(self):
+        # Only the entries of the subject are invalidated.
+        cache = UserClaimCache()
+        cache.putAll('1', { ('name', None): 'Taro', ('name', 'ja'): '太郎' })
+        cache.putAll('2', { ('name', None): 'Hanako' })
+
+        cache.invalidate('1')
+
+        self.assertEqual(cache.size, 1)
+        self.assertEqual(cache.getAll('2', [ ('name', None) ]), { ('name', None): 'Hanako' })
+
+        # The signal invalidates the entries as well.
+        userClaimsChanged.send(sender=None, subject='2')
+
+        self.assertEqual(cache.size, 0)
+
+
+    def test_004(self):
+        # The least recently used entry is evicted.
+        cache = UserClaimCache(maxSize=2)
+        cache.putAll('1', { ('name', None): 'Taro' })
+        cache.putAll('2', { ('name', None): 'Hanako' })
+        cache.getAll('1', [ ('name', None) ])
+        cache.putAll('3', { ('name', None): 'Jiro' })
+
+        self.assertEqual(cache.size, 2)
+        self.assertEqual(cache.getAll('2', [ ('name', None) ]), {})
+        self.assertEqual(cache.getAll('1', [ ('name', None) ]), { ('name', None): 'Taro' })
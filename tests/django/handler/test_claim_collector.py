@@ -0,0 +1,135 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import unittest
+from authlete.django.cache       import UserClaimCache
+from authlete.django.handler     import ClaimCollector
+from authlete.django.handler.spi import UserClaimProviderSpiAdapter
+
+
+CLAIMS = {
+    ('name',        None): 'Taro Yamada',
+    ('name',        'ja'): '山田太郎',
+    ('family_name', None): 'Yamada',
+    ('given_name',  'en'): 'Taro'
+}
+
+
+class SingleProvider(UserClaimProviderSpiAdapter):
+    def __init__(self):
+        self.calls = 0
+
+
+    def getUserClaimValue(self, subject, claimName, languageTag):
+        self.calls += 1
+
+        return CLAIMS.get((claimName, languageTag))
+
+
+class BulkProvider(SingleProvider):
+    def __init__(self):
+        super().__init__()
+        self.requests = None
+
+
+    def getUserClaimValues(self, subject, requests):
+        self.requests = requests
+
+        return CLAIMS
+
+
+class ProfileProvider(SingleProvider):
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+
+    def loadUserProfile(self, subject):
+        self.loads += 1
+
+        return dict(CLAIMS)
+
+
+    def getUserClaimValueInContext(self, context, claimName, languageTag):
+        return context.profile.get((claimName, languageTag))
+
+
+class TestClaimCollector(unittest.TestCase):
+    CLAIM_NAMES = [ 'name', 'family_name', 'given_name#en', 'middle_name', 'nickname#' ]
+    EXPECTED    = { 'name': '山田太郎', 'family_name': 'Yamada', 'given_name#en': 'Taro' }
+
+
+    def test_001(self):
+        # Claims are collected one by one when the bulk lookup is not supported.
+        provider = SingleProvider()
+        claims   = ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider).collect()
+
+        self.assertEqual(claims, self.EXPECTED)
+        self.assertEqual(provider.calls, 11)
+
+
+    def test_002(self):
+        # The bulk lookup is preferred and gives the same result.
+        provider = BulkProvider()
+        claims   = ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider).collect()
+
+        self.assertEqual(claims, self.EXPECTED)
+        self.assertEqual(provider.calls, 0)
+        self.assertEqual(provider.requests[0], ('name', None, ['ja', 'en', None]))
+        self.assertEqual(provider.requests[2], ('given_name', 'en', ['en']))
+
+
+    def test_003(self):
+        # The profile is loaded once and shared by the lookups of all claims.
+        provider = ProfileProvider()
+        claims   = ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider).collect()
+
+        self.assertEqual(claims, self.EXPECTED)
+        self.assertEqual(provider.loads, 1)
+        self.assertEqual(provider.calls, 0)
+
+
+    def test_004(self):
+        # Repeated collections are served by the claim cache.
+        cache    = UserClaimCache()
+        provider = SingleProvider()
+
+        for i in range(2):
+            claims = ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider, cache).collect()
+            self.assertEqual(claims, self.EXPECTED)
+
+        self.assertEqual(provider.calls, 11)
+
+        # The provider is called again after the user is invalidated.
+        cache.invalidate('1')
+        ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider, cache).collect()
+
+        self.assertEqual(provider.calls, 22)
+
+
+    def test_005(self):
+        # The bulk lookup is skipped when all the claim values are cached.
+        cache    = UserClaimCache()
+        provider = BulkProvider()
+        ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider, cache).collect()
+
+        provider.requests = None
+        claims = ClaimCollector('1', self.CLAIM_NAMES, ['JA', 'en'], provider, cache).collect()
+
+        self.assertEqual(claims, self.EXPECTED)
+        self.assertIsNone(provider.requests)
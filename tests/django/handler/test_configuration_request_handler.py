@@ -0,0 +1,129 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import gzip
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.test             import RequestFactory
+from authlete.django.cache   import DocumentCache
+from authlete.django.handler import ConfigurationRequestHandler
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.calls  = 0
+        self.pretty = []
+
+
+    def getServiceConfiguration(self, request):
+        self.calls += 1
+        self.pretty.append(request.pretty)
+
+        return '{"issuer":"https://example.com"}'
+
+
+class TestConfigurationRequestHandler(unittest.TestCase):
+    def setUp(self):
+        self.api     = FakeApi()
+        self.factory = RequestFactory()
+
+
+    def test_001(self):
+        # The configuration is cached and served with an ETag.
+        cache   = DocumentCache()
+        handler = ConfigurationRequestHandler(self.api, cache, maxAge=60)
+
+        response = handler.handle(self.factory.get('/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'{"issuer":"https://example.com"}')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        self.assertIsNotNone(response['ETag'])
+
+        ConfigurationRequestHandler(self.api, cache).handle(self.factory.get('/'))
+
+        self.assertEqual(self.api.calls, 1)
+
+
+    def test_002(self):
+        # A matching If-None-Match header results in 304 Not Modified.
+        handler = ConfigurationRequestHandler(self.api)
+        etag    = handler.handle(self.factory.get('/'))['ETag']
+
+        response = handler.handle(self.factory.get('/', HTTP_IF_NONE_MATCH='W/' + etag))
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+        response = handler.handle(self.factory.get('/', HTTP_IF_NONE_MATCH='"other"'))
+
+        self.assertEqual(response.status_code, 200)
+
+
+    def test_003(self):
+        # A compressed variant is selected by Accept-Encoding.
+        self.api.getServiceConfiguration = \
+            lambda request: '{{"scopes_supported":[{}]}}'.format(','.join(['"scope"'] * 500))
+
+        handler  = ConfigurationRequestHandler(self.api, DocumentCache())
+        response = handler.handle(self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip;q=0.5, *;q=0'))
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertTrue(response['ETag'].endswith('-gzip"'))
+        self.assertEqual(gzip.decompress(response.content)[:20], b'{"scopes_supported":')
+
+        response = handler.handle(self.factory.get('/', HTTP_ACCEPT_ENCODING='identity'))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+        # Documents that are not cached are not compressed.
+        handler  = ConfigurationRequestHandler(self.api)
+        response = handler.handle(self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip'))
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIsNotNone(response['ETag'])
+
+
+    def test_004(self):
+        # Compact JSON by default. Pretty JSON is cached separately.
+        cache   = DocumentCache()
+        handler = ConfigurationRequestHandler(self.api, cache)
+
+        handler.handle(self.factory.get('/'))
+        handler.handle(self.factory.get('/?pretty'))
+        handler.handle(self.factory.get('/?pretty=false'))
+
+        self.assertEqual(self.api.pretty, [ False, True ])
+
+
+    def test_005(self):
+        # Handlers for different tenants do not share cache entries.
+        cache = DocumentCache()
+
+        ConfigurationRequestHandler(self.api, cache, tenant='a').handle(self.factory.get('/'))
+        ConfigurationRequestHandler(self.api, cache, tenant='b').handle(self.factory.get('/'))
+        ConfigurationRequestHandler(self.api, cache, tenant='a').reload()
+        ConfigurationRequestHandler(self.api, cache, tenant='a').handle(self.factory.get('/'))
+
+        self.assertEqual(self.api.calls, 3)
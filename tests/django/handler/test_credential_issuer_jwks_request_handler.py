@@ -0,0 +1,83 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import gzip
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.test                                 import RequestFactory
+from authlete.django.cache                       import DocumentCache
+from authlete.django.handler                     import CredentialIssuerJwksRequestHandler
+from authlete.dto.credential_issuer_jwks_action  import CredentialIssuerJwksAction
+
+
+# A JWK Set with many keys, which is worth compressing.
+JWKS = '{{"keys":[{}]}}'.format(','.join(
+    '{{"kty":"EC","kid":"key{}","crv":"P-256","x":"x","y":"y"}}'.format(i) for i in range(50)))
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.calls = 0
+
+
+    def credentialIssuerJwks(self, request):
+        self.calls += 1
+
+        response = type('Response', (object,), {})()
+        response.action          = CredentialIssuerJwksAction.OK
+        response.responseContent = JWKS
+
+        return response
+
+
+class TestCredentialIssuerJwksRequestHandler(unittest.TestCase):
+    def setUp(self):
+        self.api     = FakeApi()
+        self.factory = RequestFactory()
+
+
+    def test_001(self):
+        # A cached JWK Set is served with an ETag and a compressed variant.
+        handler  = CredentialIssuerJwksRequestHandler(self.api, DocumentCache(), maxAge=60)
+        response = handler.handle(httpRequest=self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content).decode('utf-8'), JWKS)
+
+        response = handler.handle(httpRequest=self.factory.get('/',
+            HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']))
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.api.calls, 1)
+
+
+    def test_002(self):
+        # Without a cache, the JWK Set is served with an ETag but not compressed.
+        handler  = CredentialIssuerJwksRequestHandler(self.api)
+        response = handler.handle(httpRequest=self.factory.get('/', HTTP_ACCEPT_ENCODING='gzip'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode('utf-8'), JWKS)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIsNotNone(response['ETag'])
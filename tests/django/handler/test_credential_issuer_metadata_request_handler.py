@@ -0,0 +1,90 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from authlete.django.cache                           import DocumentCache
+from authlete.django.handler                         import CredentialIssuerMetadataRequestHandler
+from authlete.dto.credential_issuer_metadata_action  import CredentialIssuerMetadataAction
+from authlete.dto.credential_issuer_metadata_request import CredentialIssuerMetadataRequest
+
+
+class FakeApi(object):
+    def __init__(self, action=CredentialIssuerMetadataAction.OK):
+        self.calls  = 0
+        self.action = action
+
+
+    def credentialIssuerMetadata(self, request):
+        self.calls += 1
+
+        response = type('Response', (object,), {})()
+        response.action          = self.action
+        response.responseContent = '{"credential_issuer":"https://example.com"}'
+
+        return response
+
+
+class TestCredentialIssuerMetadataRequestHandler(unittest.TestCase):
+    def test_001(self):
+        # Requests given by the caller are cached per parameters and tenant.
+        api   = FakeApi()
+        cache = DocumentCache()
+
+        for pretty in (True, True, False, False):
+            request = CredentialIssuerMetadataRequest()
+            request.pretty = pretty
+
+            response = CredentialIssuerMetadataRequestHandler(api, cache, tenant='a').handle(request)
+
+            self.assertEqual(response.status_code, 200)
+
+        CredentialIssuerMetadataRequestHandler(api, cache, tenant='b').handle(request)
+
+        self.assertEqual(api.calls, 3)
+        self.assertEqual(cache.hits, 2)
+
+
+    def test_002(self):
+        # Errors are not cached.
+        api     = FakeApi(CredentialIssuerMetadataAction.NOT_FOUND)
+        cache   = DocumentCache()
+        handler = CredentialIssuerMetadataRequestHandler(api, cache)
+
+        self.assertEqual(handler.handle().status_code, 404)
+        self.assertEqual(handler.handle().status_code, 404)
+        self.assertEqual(api.calls, 2)
+
+
+    def test_003(self):
+        # Without a tenant, handlers for different services do not share
+        # cache entries.
+        api1  = FakeApi()
+        api2  = FakeApi()
+        cache = DocumentCache()
+
+        CredentialIssuerMetadataRequestHandler(api1, cache).handle()
+        CredentialIssuerMetadataRequestHandler(api2, cache).handle()
+        CredentialIssuerMetadataRequestHandler(api1, cache).handle()
+
+        self.assertEqual(api1.calls, 1)
+        self.assertEqual(api2.calls, 1)
@@ -0,0 +1,109 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import base64
+import json
+import threading
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from authlete.django.cache                          import DocumentCache
+from authlete.django.handler                        import FederationConfigurationRequestHandler
+from authlete.dto.federation_configuration_action   import FederationConfigurationAction
+from authlete.dto.federation_configuration_response import FederationConfigurationResponse
+
+
+def encode(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+class FakeApi(object):
+    def __init__(self, lifetime):
+        self.calls    = 0
+        self.lifetime = lifetime
+        self.lock     = threading.Lock()
+
+
+    def federationConfiguration(self, request):
+        with self.lock:
+            self.calls += 1
+
+        time.sleep(0.05)
+
+        response = FederationConfigurationResponse()
+        response.action          = FederationConfigurationAction.OK
+        response.responseContent = '{}.{}.signature'.format(
+            encode({ 'alg': 'ES256' }), encode({ 'exp': time.time() + self.lifetime }))
+
+        return response
+
+
+class TestFederationConfigurationRequestHandler(unittest.TestCase):
+    def test_001(self):
+        # Concurrent requests are served by one API call.
+        api     = FakeApi(3600)
+        cache   = DocumentCache(ttl=86400)
+        threads = [ threading.Thread(
+            target=lambda: FederationConfigurationRequestHandler(api, cache).handle())
+            for i in range(5) ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        response = FederationConfigurationRequestHandler(api, cache).handle()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/entity-statement+jwt')
+        self.assertEqual(api.calls, 1)
+
+
+    def test_002(self):
+        # The statement is not served within expiryMargin of its expiration.
+        api   = FakeApi(10)
+        cache = DocumentCache(ttl=86400)
+
+        FederationConfigurationRequestHandler(api, cache, expiryMargin=5).handle()
+        FederationConfigurationRequestHandler(api, cache, expiryMargin=5).handle()
+
+        self.assertEqual(api.calls, 1)
+
+        cache.clear()
+        FederationConfigurationRequestHandler(api, cache, expiryMargin=20).warmUp()
+        FederationConfigurationRequestHandler(api, cache, expiryMargin=20).handle()
+        FederationConfigurationRequestHandler(api, cache, expiryMargin=20).handle()
+
+        self.assertEqual(api.calls, 4)
+
+
+    def test_003(self):
+        # Handlers for different tenants do not share cache entries.
+        api   = FakeApi(3600)
+        cache = DocumentCache()
+
+        FederationConfigurationRequestHandler(api, cache, tenant='a').handle()
+        FederationConfigurationRequestHandler(api, cache, tenant='b').handle()
+        FederationConfigurationRequestHandler(api, cache, tenant='a').handle()
+
+        self.assertEqual(api.calls, 2)
@@ -0,0 +1,88 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from authlete.api.authlete_api_exception import AuthleteApiException
+from authlete.django.cache               import DocumentCache
+from authlete.django.handler             import JwksRequestHandler
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers     = headers
+
+
+class FakeApi(object):
+    def __init__(self, location=None):
+        self.calls    = 0
+        self.location = location
+
+
+    def getServiceJwks(self, pretty, includePrivateKeys):
+        self.calls += 1
+
+        if self.location is not None:
+            raise AuthleteApiException('/api/service/jwks/get', None, None,
+                response=FakeResponse(302, { 'Location': self.location }))
+
+        return '{"keys":[]}'
+
+
+class TestJwksRequestHandler(unittest.TestCase):
+    def test_001(self):
+        # The redirect location is remembered.
+        api   = FakeApi('https://example.com/jwks')
+        cache = DocumentCache()
+
+        for i in range(3):
+            response = JwksRequestHandler(api, cache).handle(None)
+
+            self.assertEqual(response.status_code, 302)
+            self.assertEqual(response['Location'], 'https://example.com/jwks')
+
+        self.assertEqual(api.calls, 1)
+
+
+    def test_002(self):
+        # The redirect location expires after redirectTtl.
+        api   = FakeApi('https://example.com/jwks')
+        cache = DocumentCache()
+
+        JwksRequestHandler(api, cache, redirectTtl=0).handle(None)
+        JwksRequestHandler(api, cache, redirectTtl=0).handle(None)
+
+        self.assertEqual(api.calls, 2)
+
+
+    def test_003(self):
+        # Handlers for different tenants do not share cache entries.
+        api   = FakeApi()
+        cache = DocumentCache()
+
+        JwksRequestHandler(api, cache, tenant='a').handle(None)
+        JwksRequestHandler(api, cache, tenant='b').handle(None)
+        JwksRequestHandler(api, cache, tenant='a').reload()
+        JwksRequestHandler(api, cache, tenant='a').handle(None)
+
+        self.assertEqual(api.calls, 3)
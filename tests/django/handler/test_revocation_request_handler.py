@@ -0,0 +1,90 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.test                         import RequestFactory
+from authlete.django.cache               import IntrospectionCache
+from authlete.django.handler             import RevocationRequestHandler
+from authlete.dto.introspection_action   import IntrospectionAction
+from authlete.dto.introspection_response import IntrospectionResponse
+from authlete.dto.revocation_action      import RevocationAction
+from authlete.dto.revocation_response    import RevocationResponse
+
+
+def buildResponse():
+    response = IntrospectionResponse()
+    response.action    = IntrospectionAction.OK
+    response.expiresAt = int((time.time() + 3600) * 1000)
+
+    return response
+
+
+class FakeApi(object):
+    def __init__(self, action):
+        self.action = action
+
+
+    def revocation(self, request):
+        response = RevocationResponse()
+        response.action = self.action
+
+        return response
+
+
+class TestRevocationRequestHandler(unittest.TestCase):
+    def setUp(self):
+        self.cache = IntrospectionCache()
+        self.cache.put(IntrospectionCache.computeKey('token'), buildResponse())
+        self.cache.put(IntrospectionCache.computeKey('other'), buildResponse())
+
+
+    def revoke(self, action, data):
+        request = RequestFactory().post('/revocation', data,
+            content_type='application/x-www-form-urlencoded')
+
+        return RevocationRequestHandler(FakeApi(action)).handle(request)
+
+
+    def test_001(self):
+        # The entry of the revoked access token is removed.
+        response = self.revoke(RevocationAction.OK, 'token=token')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.cache.size, 1)
+        self.assertIsNotNone(self.cache.get(IntrospectionCache.computeKey('other')))
+
+
+    def test_002(self):
+        # All the entries are cleared when a refresh token is revoked.
+        self.revoke(RevocationAction.OK, 'token=refresh&token_type_hint=refresh_token')
+
+        self.assertEqual(self.cache.size, 0)
+
+
+    def test_003(self):
+        # Nothing is removed when the revocation fails.
+        response = self.revoke(RevocationAction.BAD_REQUEST, 'token=token')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.cache.size, 2)
@@ -0,0 +1,117 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import threading
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.test             import override_settings
+
+import authlete.django
+from authlete.django.apps    import AuthleteDjangoConfig
+from authlete.django.cache   import DocumentCache
+from authlete.django.handler import ConfigurationRequestHandler, JwksRequestHandler
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.threads = set()
+
+
+    def getServiceConfiguration(self, request):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return '{"issuer":"https://example.com"}'
+
+
+    def getServiceJwks(self, pretty, includePrivateKeys):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return '{"keys":[]}'
+
+
+class SlowTarget(object):
+    def warmUp(self):
+        time.sleep(1)
+
+
+class FailingTarget(object):
+    def warmUp(self):
+        raise RuntimeError('failed')
+
+
+class Target(object):
+    def __init__(self):
+        self.warmed = False
+
+
+    def warmUp(self):
+        self.warmed = True
+
+
+def failingFactory():
+    raise RuntimeError('failed')
+
+
+# Referred to by the AUTHLETE_WARMUP_HANDLERS setting.
+TARGET = Target()
+
+
+class TestAuthleteDjangoConfig(unittest.TestCase):
+    def setUp(self):
+        self.config = AuthleteDjangoConfig('authlete.django', authlete.django)
+
+
+    def test_001(self):
+        # Handlers are warmed up concurrently and fill their caches.
+        api   = FakeApi()
+        cache = DocumentCache()
+
+        succeeded = self.config.warmUp([
+            ConfigurationRequestHandler(api, cache),
+            JwksRequestHandler(api, cache)
+        ], 5)
+
+        self.assertTrue(succeeded)
+        self.assertEqual(len(api.threads), 2)
+        self.assertIsNotNone(cache.get(('configuration', api, False), lambda: None))
+        self.assertIsNotNone(cache.get(('jwks', api, False), lambda: None))
+
+
+    def test_002(self):
+        # Startup does not wait beyond the deadline and survives failures.
+        start     = time.monotonic()
+        succeeded = self.config.warmUp([ SlowTarget(), FailingTarget() ], 0.1)
+
+        self.assertFalse(succeeded)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+    def test_003(self):
+        # Targets that cannot be resolved are skipped without failing startup.
+        with override_settings(AUTHLETE_WARMUP_HANDLERS=[
+                __name__ + '.Missing', __name__ + '.failingFactory', __name__ + '.TARGET' ]):
+            with self.assertLogs('authlete.django.apps', 'WARNING') as logs:
+                self.config.ready()
+
+        self.assertTrue(TARGET.warmed)
+        self.assertEqual(len(logs.output), 2)
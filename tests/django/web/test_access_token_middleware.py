@@ -0,0 +1,104 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import asyncio
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.http                         import HttpResponse
+from django.test                         import RequestFactory, override_settings
+from authlete.django.web                 import AccessTokenMiddleware, AccessTokenValidator
+from authlete.dto.introspection_action   import IntrospectionAction
+from authlete.dto.introspection_response import IntrospectionResponse
+
+
+class FakeApi(object):
+    def introspection(self, request):
+        response = IntrospectionResponse()
+        response.expiresAt = int((time.time() + 3600) * 1000)
+
+        if request.token == 'bad':
+            response.action          = IntrospectionAction.UNAUTHORIZED
+            response.responseContent = 'Bearer error="invalid_token"'
+        else:
+            response.action  = IntrospectionAction.OK
+            response.subject = 'user'
+
+        return response
+
+
+# Referred to by the AUTHLETE_ACCESS_TOKEN_VALIDATOR setting.
+VALIDATOR = AccessTokenValidator(FakeApi())
+
+
+def view(request):
+    result = getattr(request, AccessTokenValidator.REQUEST_ATTRIBUTE, None)
+
+    return HttpResponse('' if result is None else result.introspectionResponse.subject)
+
+
+async def aview(request):
+    return view(request)
+
+
+class TestAccessTokenMiddleware(unittest.TestCase):
+    def setUp(self):
+        self.settings = override_settings(AUTHLETE_ACCESS_TOKEN_VALIDATOR=__name__ + '.VALIDATOR')
+        self.settings.enable()
+
+
+    def tearDown(self):
+        self.settings.disable()
+
+
+    def request(self, authorization=None):
+        if authorization is None:
+            return RequestFactory().get('/')
+
+        return RequestFactory().get('/', HTTP_AUTHORIZATION=authorization)
+
+
+    def test_001(self):
+        middleware = AccessTokenMiddleware(view)
+
+        self.assertFalse(asyncio.iscoroutinefunction(middleware))
+        self.assertEqual(middleware(self.request('Bearer token')).content, b'user')
+        self.assertEqual(middleware(self.request('Bearer bad')).status_code, 401)
+
+        # Requests without an access token are passed to the view as is.
+        self.assertEqual(middleware(self.request()).status_code, 200)
+
+
+    def test_002(self):
+        middleware = AccessTokenMiddleware(aview)
+
+        async def main():
+            return [
+                await middleware(self.request('Bearer token')),
+                await middleware(self.request('Bearer bad'))
+            ]
+
+        responses = asyncio.run(main())
+
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        self.assertEqual(responses[0].content, b'user')
+        self.assertEqual(responses[1].status_code, 401)
@@ -0,0 +1,268 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import asyncio
+import base64
+import hashlib
+import threading
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.test                         import RequestFactory, override_settings
+
+from authlete.django.cache               import IntrospectionCache
+from authlete.django.cache.signals       import tokenRevoked
+from authlete.django.web                 import AccessTokenValidator
+from authlete.dto.introspection_action   import IntrospectionAction
+from authlete.dto.introspection_response import IntrospectionResponse
+
+
+CERTIFICATE = base64.b64encode(b'certificate').decode('ascii')
+THUMBPRINT  = base64.urlsafe_b64encode(
+    hashlib.sha256(b'certificate').digest()).decode('ascii').rstrip('=')
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.calls = 0
+        self.lock  = threading.Lock()
+
+
+    def introspection(self, request):
+        with self.lock:
+            self.calls += 1
+
+        response = IntrospectionResponse()
+        response.expiresAt = int((time.time() + 3600) * 1000)
+
+        if request.token.startswith('bad'):
+            response.action          = IntrospectionAction.UNAUTHORIZED
+            response.responseContent = 'Bearer error="invalid_token"'
+        elif self.__isWrongCertificate(request):
+            response.action          = IntrospectionAction.UNAUTHORIZED
+            response.responseContent = 'Bearer error="invalid_token"'
+            response.existent        = True
+        else:
+            response.action   = IntrospectionAction.OK
+            response.existent = True
+            response.subject  = 'user'
+            response.scopes   = ['read', 'write']
+
+        if request.token.startswith('mtls'):
+            response.certificateThumbprint = THUMBPRINT
+
+        return response
+
+
+    def __isWrongCertificate(self, request):
+        return request.token.startswith('mtls') and \
+            request.clientCertificate != CERTIFICATE
+
+
+class FakeAsyncClient(object):
+    def __init__(self, api):
+        self.api = api
+
+
+    async def introspection(self, request):
+        await asyncio.sleep(0)
+
+        return self.api.introspection(request)
+
+
+class TestAccessTokenValidator(unittest.TestCase):
+    def setUp(self):
+        self.api = FakeApi()
+
+
+    def test_001(self):
+        # With a cache, scopes and subject are checked locally.
+        validator = AccessTokenValidator(self.api, IntrospectionCache())
+
+        self.assertTrue(validator.check('token', ['read']).valid)
+        self.assertTrue(validator.check('token', None, 'user').valid)
+
+        result = validator.check('token', ['admin'])
+
+        self.assertFalse(result.valid)
+        self.assertEqual(result.errorResponse.status_code, 403)
+        self.assertEqual(result.introspectionResponse.action, IntrospectionAction.FORBIDDEN)
+        self.assertEqual(self.api.calls, 1)
+
+
+    def test_002(self):
+        # validate() keeps the result in the properties.
+        validator = AccessTokenValidator(self.api)
+
+        self.assertFalse(validator.validate('bad'))
+        self.assertFalse(validator.valid)
+        self.assertEqual(validator.errorResponse.status_code, 401)
+
+
+    def test_003(self):
+        # Distinct access tokens are validated once and results keep the order.
+        validator = AccessTokenValidator(self.api)
+
+        results = validator.checkMany([
+            'token1',
+            ('token1', ['read']),
+            ('token2', ['admin']),
+            ('bad', None),
+            ('token1', ['read'], 'other')
+        ])
+
+        self.assertEqual(
+            [ result.valid for result in results ],
+            [ True, True, False, False, False ])
+        self.assertEqual(results[2].errorResponse.status_code, 403)
+        self.assertEqual(results[3].errorResponse.status_code, 401)
+        self.assertEqual(self.api.calls, 3)
+
+
+    @override_settings(ALLOWED_HOSTS=['testserver'])
+    def test_004(self):
+        # DPoP proofs are sent to Authlete every time without the cache, and
+        # certificate binding is checked locally for cached responses.
+        validator = AccessTokenValidator(self.api, IntrospectionCache())
+        factory   = RequestFactory()
+
+        for i in range(2):
+            request = factory.get('/', HTTP_AUTHORIZATION='DPoP token', HTTP_DPOP='proof')
+            self.assertTrue(validator.checkRequest(request).valid)
+
+        self.assertEqual(self.api.calls, 2)
+
+        request = factory.get('/', HTTP_AUTHORIZATION='Bearer mtls',
+            HTTP_CLIENT_CERT=':{}:'.format(CERTIFICATE))
+        self.assertTrue(validator.checkRequest(request).valid)
+
+        request = factory.get('/', HTTP_AUTHORIZATION='Bearer mtls')
+        result  = validator.checkRequest(request)
+
+        self.assertFalse(result.valid)
+        self.assertEqual(result.errorResponse.status_code, 401)
+        self.assertEqual(self.api.calls, 3)
+
+
+    def test_005(self):
+        # acheck() uses the non-blocking client and the cache.
+        validator = AccessTokenValidator(self.api, IntrospectionCache(),
+            asyncClient=FakeAsyncClient(self.api))
+
+        async def main():
+            return [
+                await validator.acheck('token', ['read']),
+                await validator.acheck('token', ['admin']),
+                await validator.acheck('bad')
+            ]
+
+        results = asyncio.run(main())
+
+        self.assertTrue(results[0].valid)
+        self.assertEqual(results[1].errorResponse.status_code, 403)
+        self.assertEqual(results[2].errorResponse.status_code, 401)
+        self.assertEqual(self.api.calls, 2)
+
+
+    def test_006(self):
+        # avalidate() without a non-blocking client runs check() in a thread.
+        validator = AccessTokenValidator(self.api)
+
+        self.assertTrue(asyncio.run(validator.avalidate('token', None, 'user')))
+        self.assertTrue(validator.valid)
+
+        self.assertFalse(asyncio.run(validator.avalidate('bad')))
+        self.assertEqual(validator.errorResponse.status_code, 401)
+        self.assertEqual(self.api.calls, 2)
+
+
+    def test_007(self):
+        # A rejection caused by a wrong client certificate is not cached.
+        validator = AccessTokenValidator(self.api, IntrospectionCache())
+        factory   = RequestFactory()
+        wrong     = base64.b64encode(b'wrong').decode('ascii')
+
+        request = factory.get('/', HTTP_AUTHORIZATION='Bearer mtls',
+            HTTP_CLIENT_CERT=':{}:'.format(wrong))
+        self.assertEqual(validator.checkRequest(request).errorResponse.status_code, 401)
+
+        request = factory.get('/', HTTP_AUTHORIZATION='Bearer mtls',
+            HTTP_CLIENT_CERT=':{}:'.format(CERTIFICATE))
+        self.assertTrue(validator.checkRequest(request).valid)
+        self.assertEqual(self.api.calls, 2)
+
+
+    def test_008(self):
+        # A rejection caused by a missing client certificate is not cached.
+        validator = AccessTokenValidator(self.api, IntrospectionCache())
+        factory   = RequestFactory()
+
+        request = factory.get('/', HTTP_AUTHORIZATION='Bearer mtls')
+        self.assertEqual(validator.checkRequest(request).errorResponse.status_code, 401)
+
+        request = factory.get('/', HTTP_AUTHORIZATION='Bearer mtls',
+            HTTP_CLIENT_CERT=':{}:'.format(CERTIFICATE))
+        self.assertTrue(validator.checkRequest(request).valid)
+        self.assertEqual(self.api.calls, 2)
+
+        # Rejections of access tokens that do not exist are cached.
+        validator.check('bad')
+        validator.check('bad')
+        self.assertEqual(self.api.calls, 3)
+
+
+    def test_009(self):
+        # A cached certificate-bound access token is rejected without a
+        # client certificate.
+        validator = AccessTokenValidator(self.api, IntrospectionCache())
+        request   = RequestFactory().get('/', HTTP_AUTHORIZATION='Bearer mtls',
+            HTTP_CLIENT_CERT=':{}:'.format(CERTIFICATE))
+
+        self.assertTrue(validator.checkRequest(request).valid)
+
+        self.assertFalse(validator.validate('mtls'))
+        self.assertFalse(validator.check('mtls').valid)
+        self.assertFalse(validator.checkMany([ 'mtls' ])[0].valid)
+        self.assertEqual(self.api.calls, 1)
+
+
+    def test_010(self):
+        # A token revoked during the API call of a cache miss is not cached.
+        key       = IntrospectionCache.computeKey('token')
+        validator = AccessTokenValidator(self.api, IntrospectionCache(),
+            asyncClient=FakeAsyncClient(self.api))
+        introspection = self.api.introspection
+
+        def revokingIntrospection(request):
+            response = introspection(request)
+            tokenRevoked.send(sender=None, tokenHash=key)
+            return response
+
+        self.api.introspection = revokingIntrospection
+
+        self.assertTrue(validator.check('token').valid)
+        self.assertTrue(asyncio.run(validator.acheck('token')).valid)
+
+        self.api.introspection = introspection
+
+        self.assertTrue(validator.check('token').valid)
+        self.assertEqual(self.api.calls, 3)
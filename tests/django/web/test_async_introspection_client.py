@@ -0,0 +1,104 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import asyncio
+import json
+import unittest
+from authlete.api.authlete_api_exception  import AuthleteApiException
+from authlete.conf.authlete_configuration import AuthleteConfiguration
+from authlete.django.web                  import AsyncIntrospectionClient
+from authlete.dto.introspection_action    import IntrospectionAction
+from authlete.dto.introspection_request   import IntrospectionRequest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def buildConfiguration(apiVersion=None):
+    return AuthleteConfiguration({
+        'apiVersion':         apiVersion,
+        'baseUrl':            'https://api.example.com/',
+        'serviceApiKey':      '123',
+        'serviceApiSecret':   'secret',
+        'serviceAccessToken': 'sat'
+    })
+
+
+def buildRequest(token):
+    request = IntrospectionRequest()
+    request.token = token
+
+    return request
+
+
+@unittest.skipIf(httpx is None, "'httpx' is not installed.")
+class TestAsyncIntrospectionClient(unittest.TestCase):
+    def introspect(self, cnf, handler, token):
+        client = AsyncIntrospectionClient(cnf)
+
+        # Replace the transport so that no network access is made.
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def main():
+            try:
+                return await client.introspection(buildRequest(token))
+            finally:
+                await client.aclose()
+
+        return asyncio.run(main())
+
+
+    def test_001(self):
+        # V3 uses the service access token and the service ID in the path.
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={ 'action': 'OK', 'subject': 'user' })
+
+        response = self.introspect(buildConfiguration('V3'), handler, 'token')
+
+        self.assertEqual(response.action, IntrospectionAction.OK)
+        self.assertEqual(response.subject, 'user')
+        self.assertEqual(str(requests[0].url), 'https://api.example.com/api/123/auth/introspection')
+        self.assertEqual(requests[0].headers['Authorization'], 'Bearer sat')
+        self.assertEqual(json.loads(requests[0].content)['token'], 'token')
+
+
+    def test_002(self):
+        # V2 uses basic authentication.
+        def handler(request):
+            self.assertTrue(request.headers['Authorization'].startswith('Basic '))
+            return httpx.Response(200, json={ 'action': 'UNAUTHORIZED' })
+
+        response = self.introspect(buildConfiguration(), handler, 'token')
+
+        self.assertEqual(response.action, IntrospectionAction.UNAUTHORIZED)
+
+
+    def test_003(self):
+        # A status code other than 2XX is raised as AuthleteApiException.
+        def handler(request):
+            return httpx.Response(400, json={ 'resultMessage': 'Bad request.' })
+
+        with self.assertRaises(AuthleteApiException) as context:
+            self.introspect(buildConfiguration('V3'), handler, 'token')
+
+        self.assertEqual(context.exception.message, 'Bad request.')
@@ -0,0 +1,64 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import importlib.util
+import sys
+import types
+import unittest
+from unittest import mock
+
+import authlete.django.web.coroutine_utility
+from authlete.django.web import CoroutineUtility
+
+
+def load(name):
+    # Load another copy of the module so that the imports are executed again.
+    spec   = importlib.util.spec_from_file_location(name,
+        authlete.django.web.coroutine_utility.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+class TestCoroutineUtility(unittest.TestCase):
+    def test_001(self):
+        async def coroutine():
+            pass
+
+        def function():
+            pass
+
+        self.assertTrue(CoroutineUtility.isCoroutineFunction(coroutine))
+        self.assertFalse(CoroutineUtility.isCoroutineFunction(function))
+
+        marked = CoroutineUtility.markCoroutineFunction(lambda: None)
+
+        self.assertTrue(CoroutineUtility.isCoroutineFunction(marked))
+
+
+    def test_002(self):
+        # asgiref < 3.6 does not have iscoroutinefunction().
+        with mock.patch.dict(sys.modules, { 'asgiref.sync': types.ModuleType('asgiref.sync') }):
+            module = load('coroutine_utility_without_asgiref_functions')
+
+        async def coroutine():
+            pass
+
+        self.assertTrue(module.CoroutineUtility.isCoroutineFunction(coroutine))
+        self.assertFalse(module.CoroutineUtility.isCoroutineFunction(lambda: None))
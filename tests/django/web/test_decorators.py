@@ -0,0 +1,100 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import time
+import unittest
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure()
+
+from django.http                         import HttpResponse
+from django.test                         import RequestFactory
+from authlete.django.web                 import AccessTokenValidator, require_token
+from authlete.dto.introspection_action   import IntrospectionAction
+from authlete.dto.introspection_response import IntrospectionResponse
+
+
+class FakeApi(object):
+    def __init__(self):
+        self.calls = 0
+
+
+    def introspection(self, request):
+        self.calls += 1
+
+        response = IntrospectionResponse()
+        response.action    = IntrospectionAction.OK
+        response.subject   = 'user'
+        response.scopes    = ['read', 'write']
+        response.expiresAt = int((time.time() + 3600) * 1000)
+
+        return response
+
+
+class TestRequireToken(unittest.TestCase):
+    def setUp(self):
+        self.api       = FakeApi()
+        self.validator = AccessTokenValidator(self.api)
+        self.factory   = RequestFactory()
+
+
+    def get(self, view, authorization=None):
+        if authorization is None:
+            return view(self.factory.get('/'))
+
+        return view(self.factory.get('/', HTTP_AUTHORIZATION=authorization))
+
+
+    def test_001(self):
+        # Nested decorators validate the access token only once.
+        @require_token(scopes=['read'], validator=self.validator)
+        @require_token(scopes=['write'], subject='user', validator=self.validator)
+        def view(request):
+            return HttpResponse(request.accessTokenValidation.introspectionResponse.subject)
+
+        response = self.get(view, 'Bearer token')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'user')
+        self.assertEqual(self.api.calls, 1)
+
+
+    def test_002(self):
+        # Insufficient scope.
+        @require_token(scopes=['admin'], validator=self.validator)
+        def view(request):
+            return HttpResponse()
+
+        response = self.get(view, 'Bearer token')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertIn('insufficient_scope', response['WWW-Authenticate'])
+
+
+    def test_003(self):
+        # No access token.
+        @require_token(validator=self.validator)
+        def view(request):
+            return HttpResponse()
+
+        response = self.get(view)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Bearer')
+        self.assertEqual(self.api.calls, 0)
@@ -0,0 +1,170 @@
+#
+# Copyright (C) 2026 Authlete, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific
+# language governing permissions and limitations under the
+# License.
+
+
+
+import asyncio
+import base64
+import json
+import threading
+import time
+import unittest
+from authlete.dto.introspection_action import IntrospectionAction
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives.asymmetric     import ec
+    from jwt.algorithms                                import ECAlgorithm
+    from authlete.django.cache.service_jwks_cache      import ServiceJwksCache
+    from authlete.django.web.jwt_access_token_verifier import JwtAccessTokenVerifier
+except ImportError:
+    jwt = None
+
+
+ISSUER = 'https://as.example.com'
+
+
+class FakeApi(object):
+    def __init__(self, jwk):
+        self.jwks  = json.dumps({ 'keys': [ jwk ] })
+        self.calls = 0
+
+
+    def getServiceJwks(self, pretty, includePrivateKeys):
+        self.calls += 1
+        return self.jwks
+
+
+@unittest.skipIf(jwt is None, 'PyJWT is not installed.')
+class TestJwtAccessTokenVerifier(unittest.TestCase):
+    def setUp(self):
+        self.key = ec.generate_private_key(ec.SECP256R1())
+
+        jwk = json.loads(ECAlgorithm.to_jwk(self.key.public_key()))
+        jwk['kid'] = 'key1'
+        jwk['alg'] = 'ES256'
+
+        self.api      = FakeApi(jwk)
+        self.verifier = JwtAccessTokenVerifier(ServiceJwksCache(self.api), ISSUER)
+
+
+    def encode(self, kid='key1', expiresIn=60, **claims):
+        claims.setdefault('iss', ISSUER)
+        claims['exp'] = int(time.time()) + expiresIn
+
+        return jwt.encode(claims, self.key, 'ES256',
+            headers={ 'kid': kid, 'typ': 'at+jwt' })
+
+
+    def test_001(self):
+        response = self.verifier.verify(self.encode(sub='user', scope='read write'))
+
+        self.assertEqual(response.action, IntrospectionAction.OK)
+        self.assertEqual(response.subject, 'user')
+        self.assertEqual(response.scopes, [ 'read', 'write' ])
+
+
+    def test_002(self):
+        # Expired access tokens are rejected locally.
+        response = self.verifier.verify(self.encode(expiresIn=-60))
+
+        self.assertEqual(response.action, IntrospectionAction.UNAUTHORIZED)
+
+
+    def test_003(self):
+        # Wrong issuer.
+        response = self.verifier.verify(self.encode(iss='https://other.example.com'))
+
+        self.assertEqual(response.action, IntrospectionAction.UNAUTHORIZED)
+
+
+    def test_004(self):
+        # Opaque access tokens and unknown key IDs fall back to introspection.
+        self.assertIsNone(self.verifier.verify('opaque-access-token'))
+        self.assertIsNone(self.verifier.verify(self.encode(kid='unknown')))
+
+
+    def test_005(self):
+        # The JWK Set is fetched once.
+        self.verifier.verify(self.encode())
+        self.verifier.verify(self.encode())
+
+        self.assertEqual(self.api.calls, 1)
+
+
+    def forge(self, header, claims):
+        def encode(value):
+            data = json.dumps(value).encode('utf-8')
+            return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+        claims.setdefault('iss', ISSUER)
+        claims.setdefault('exp', int(time.time()) + 60)
+
+        return '{}.{}.AAAA'.format(encode(header), encode(claims))
+
+
+    def test_006(self):
+        # An algorithm that does not match the key is rejected.
+        response = self.verifier.verify(
+            self.forge({ 'alg': 'RS256', 'kid': 'key1', 'typ': 'at+jwt' }, {}))
+
+        self.assertEqual(response.action, IntrospectionAction.UNAUTHORIZED)
+
+
+    def test_007(self):
+        # A non-string 'typ' is not accepted as an access token.
+        token = jwt.encode({ 'iss': ISSUER, 'exp': int(time.time()) + 60 },
+            self.key, 'ES256', headers={ 'kid': 'key1', 'typ': [ 'at+jwt' ] })
+
+        self.assertIsNone(self.verifier.verify(token))
+
+
+    def test_008(self):
+        # A malformed 'scope' claim is rejected.
+        response = self.verifier.verify(self.encode(scope={ 'read': True }))
+
+        self.assertEqual(response.action, IntrospectionAction.UNAUTHORIZED)
+
+
+    def test_009(self):
+        # averify() fetches the JWK Set in a worker thread.
+        mainThread = threading.current_thread()
+        threads    = []
+        getServiceJwks = self.api.getServiceJwks
+
+        def recordingGetServiceJwks(pretty, includePrivateKeys):
+            threads.append(threading.current_thread())
+            return getServiceJwks(pretty, includePrivateKeys)
+
+        self.api.getServiceJwks = recordingGetServiceJwks
+
+        async def main():
+            return [ await self.verifier.averify(self.encode()) for _ in range(2) ]
+
+        responses = asyncio.run(main())
+
+        self.assertEqual([ r.action for r in responses ], [ IntrospectionAction.OK ] * 2)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], mainThread)
+
+
+    def test_010(self):
+        # A JWT without 'typ' (e.g. an ID token) is not accepted as an access token.
+        token = jwt.encode({ 'iss': ISSUER, 'sub': 'alice', 'aud': 'client1',
+            'exp': int(time.time()) + 60 }, self.key, 'ES256', headers={ 'kid': 'key1', 'typ': None })
+
+        self.assertNotIn('typ', jwt.get_unverified_header(token))
+        self.assertIsNone(self.verifier.verify(token))